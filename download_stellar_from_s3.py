@@ -15,6 +15,7 @@ import logging
 import csv
 import io
 import sys
+from datetime import datetime
 from stellar_db_functions import OracleConnector
 
 # Configure logging
@@ -65,33 +66,46 @@ def parse_float(value):
 
 
 def parse_date(value):
-    """Convert date/timestamp string to None if empty (for Oracle TO_DATE/TO_TIMESTAMP)."""
+    """Convert date/timestamp string to None if empty (parsed to a native bind on insert)."""
     if value == '' or value is None:
         return None
     return value
 
 
+# Canonical ISO shapes by string length, for the parse_datetime() fast path
+ISO_FORMATS_BY_LENGTH = {10: '%Y-%m-%d', 19: '%Y-%m-%d %H:%M:%S'}
+
+
+def parse_datetime(value, *formats):
+    """Convert a date/timestamp string to a datetime using the first matching format, or None."""
+    if not value:
+        return None
+    # Fast path: a value already in canonical ISO shape is parsed by
+    # fromisoformat() in C instead of strptime()'s format machinery
+    if (ISO_FORMATS_BY_LENGTH.get(len(value)) in formats
+            and value[4] == '-' and value[7] == '-'
+            and value[10:11] in ('', ' ')):
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            pass
+    for fmt in formats:
+        try:
+            return datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+    return None
+
+
 def parse_customers_data(csv_content):
     """Parse customers CSV - 52 columns matching actual CSV structure."""
-    from datetime import datetime
-    
     def convert_date(value):
         """Convert date string to datetime object or None."""
-        if not value or value == '':
-            return None
-        try:
-            return datetime.strptime(value, '%Y-%m-%d')
-        except:
-            return None
+        return parse_datetime(value, '%Y-%m-%d')
     
     def convert_timestamp(value):
         """Convert timestamp string to datetime object or None."""
-        if not value or value == '':
-            return None
-        try:
-            return datetime.strptime(value, '%Y-%m-%d %H:%M:%S')
-        except:
-            return None
+        return parse_datetime(value, '%Y-%m-%d %H:%M:%S')
     
     reader = csv.DictReader(io.StringIO(csv_content))
     data_rows = []
@@ -152,7 +166,7 @@ def parse_customers_data(csv_content):
             convert_timestamp(row.get('updated_at'))
         ))
     
-    logger.info(f"Parsed {len(data_rows)} customer records")
+    logger.info("Parsed %d customer records", len(data_rows))
     return data_rows
 
 
@@ -187,7 +201,7 @@ def parse_locations_data(csv_content):
             parse_date(row.get('updated_at'))
         ))
     
-    logger.info(f"Parsed {len(data_rows)} location records")
+    logger.info("Parsed %d location records", len(data_rows))
     return data_rows
 
 
@@ -220,7 +234,7 @@ def parse_seasons_data(csv_content):
             parse_date(row.get('updated_at'))
         ))
     
-    logger.info(f"Parsed {len(data_rows)} season records")
+    logger.info("Parsed %d season records", len(data_rows))
     return data_rows
 
 
@@ -258,7 +272,7 @@ def parse_accessories_data(csv_content):
             parse_date(row.get('updated_at'))
         ))
     
-    logger.info(f"Parsed {len(data_rows)} accessory records")
+    logger.info("Parsed %d accessory records", len(data_rows))
     return data_rows
 
 
@@ -283,7 +297,7 @@ def parse_accessory_options_data(csv_content):
             parse_date(row.get('updated_at'))
         ))
     
-    logger.info(f"Parsed {len(data_rows)} accessory option records")
+    logger.info("Parsed %d accessory option records", len(data_rows))
     return data_rows
 
 
@@ -308,7 +322,7 @@ def parse_accessory_tiers_data(csv_content):
             parse_date(row.get('updated_at'))
         ))
     
-    logger.info(f"Parsed {len(data_rows)} accessory tier records")
+    logger.info("Parsed %d accessory tier records", len(data_rows))
     return data_rows
 
 
@@ -343,7 +357,7 @@ def parse_amenities_data(csv_content):
             parse_date(row.get('updated_at'))
         ))
     
-    logger.info(f"Parsed {len(data_rows)} amenity records")
+    logger.info("Parsed %d amenity records", len(data_rows))
     return data_rows
 
 
@@ -387,7 +401,7 @@ def parse_categories_data(csv_content):
             parse_date(row.get('updated_at'))
         ))
     
-    logger.info(f"Parsed {len(data_rows)} category records")
+    logger.info("Parsed %d category records", len(data_rows))
     return data_rows
 
 
@@ -402,7 +416,7 @@ def parse_holidays_data(csv_content):
             parse_date(row.get('holiday_date'))
         ))
     
-    logger.info(f"Parsed {len(data_rows)} holiday records")
+    logger.info("Parsed %d holiday records", len(data_rows))
     return data_rows
 
 
@@ -497,27 +511,16 @@ def parse_bookings_data(csv_content):
             parse_date(parse_date(row.get('deleted_at')))
         ))
     
-    logger.info(f"Parsed {len(data_rows)} booking records")
+    logger.info("Parsed %d booking records", len(data_rows))
     return data_rows
 
 
 def parse_booking_boats_data(csv_content):
     """Parse booking_boats CSV - 57 columns matching actual CSV structure."""
-    from datetime import datetime
-    
     def convert_timestamp(value):
         """Convert timestamp string to datetime object or None."""
-        if not value or value == '':
-            return None
-        try:
-            # Try with seconds
-            return datetime.strptime(value, '%Y-%m-%d %H:%M:%S')
-        except:
-            try:
-                # Try without seconds
-                return datetime.strptime(value, '%Y-%m-%d %H:%M')
-            except:
-                return None
+        # Try with seconds, then without
+        return parse_datetime(value, '%Y-%m-%d %H:%M:%S', '%Y-%m-%d %H:%M')
     
     reader = csv.DictReader(io.StringIO(csv_content))
     data_rows = []
@@ -583,7 +586,7 @@ def parse_booking_boats_data(csv_content):
             convert_timestamp(row.get('deleted_at'))
         ))
     
-    logger.info(f"Parsed {len(data_rows)} booking boat records")
+    logger.info("Parsed %d booking boat records", len(data_rows))
     return data_rows
 
 
@@ -652,7 +655,7 @@ def parse_booking_payments_data(csv_content):
             parse_date(row.get('deleted_at'))
         ))
     
-    logger.info(f"Parsed {len(data_rows)} booking payment records")
+    logger.info("Parsed %d booking payment records", len(data_rows))
     return data_rows
 
 
@@ -673,7 +676,7 @@ def parse_booking_accessories_data(csv_content):
             parse_date(row.get('updated_at'))
         ))
     
-    logger.info(f"Parsed {len(data_rows)} booking accessory records")
+    logger.info("Parsed %d booking accessory records", len(data_rows))
     return data_rows
 
 
@@ -697,7 +700,7 @@ def parse_style_groups_data(csv_content):
             parse_date(row.get('updated_at'))
         ))
     
-    logger.info(f"Parsed {len(data_rows)} style group records")
+    logger.info("Parsed %d style group records", len(data_rows))
     return data_rows
 
 
@@ -808,7 +811,7 @@ def parse_styles_data(csv_content):
             parse_date(row.get('updated_at'))
         ))
     
-    logger.info(f"Parsed {len(data_rows)} style records")
+    logger.info("Parsed %d style records", len(data_rows))
     return data_rows
 
 
@@ -860,7 +863,7 @@ def parse_style_boats_data(csv_content):
             parse_date(parse_date(row.get('updated_at')))
         ))
     
-    logger.info(f"Parsed {len(data_rows)} style boat records")
+    logger.info("Parsed %d style boat records", len(data_rows))
     return data_rows
 
 
@@ -882,7 +885,7 @@ def parse_customer_boats_data(csv_content):
             parse_date(row.get('updated_at'))
         ))
     
-    logger.info(f"Parsed {len(data_rows)} customer boat records")
+    logger.info("Parsed %d customer boat records", len(data_rows))
     return data_rows
 
 
@@ -899,7 +902,7 @@ def parse_season_dates_data(csv_content):
             parse_date(row.get('end_date'))
         ))
     
-    logger.info(f"Parsed {len(data_rows)} season date records")
+    logger.info("Parsed %d season date records", len(data_rows))
     return data_rows
 
 
@@ -934,7 +937,7 @@ def parse_style_hourly_prices_data(csv_content):
             parse_date(row.get('updated_at'))
         ))
     
-    logger.info(f"Parsed {len(data_rows)} style hourly price records")
+    logger.info("Parsed %d style hourly price records", len(data_rows))
     return data_rows
 
 
@@ -973,7 +976,7 @@ def parse_style_times_data(csv_content):
             parse_date(row.get('updated_at'))
         ))
     
-    logger.info(f"Parsed {len(data_rows)} style time records")
+    logger.info("Parsed %d style time records", len(data_rows))
     return data_rows
 
 
@@ -998,7 +1001,7 @@ def parse_style_prices_data(csv_content):
             parse_date(row.get('updated_at'))
         ))
     
-    logger.info(f"Parsed {len(data_rows)} style price records")
+    logger.info("Parsed %d style price records", len(data_rows))
     return data_rows
 
 
@@ -1039,7 +1042,7 @@ def parse_club_tiers_data(csv_content):
             parse_date(row.get('updated_at'))
         ))
     
-    logger.info(f"Parsed {len(data_rows)} club tier records")
+    logger.info("Parsed %d club tier records", len(data_rows))
     return data_rows
 
 
@@ -1082,7 +1085,7 @@ def parse_coupons_data(csv_content):
             parse_date(row.get('updated_at'))
         ))
     
-    logger.info(f"Parsed {len(data_rows)} coupon records")
+    logger.info("Parsed %d coupon records", len(data_rows))
     return data_rows
 
 
@@ -1104,7 +1107,7 @@ def parse_pos_items_data(csv_content):
             parse_date(row.get('updated_at'))
         ))
     
-    logger.info(f"Parsed {len(data_rows)} POS item records")
+    logger.info("Parsed %d POS item records", len(data_rows))
     return data_rows
 
 
@@ -1128,7 +1131,7 @@ def parse_pos_sales_data(csv_content):
             parse_date(row.get('deleted_at'))
         ))
     
-    logger.info(f"Parsed {len(data_rows)} POS sale records")
+    logger.info("Parsed %d POS sale records", len(data_rows))
     return data_rows
 
 
@@ -1155,7 +1158,7 @@ def parse_fuel_sales_data(csv_content):
             parse_date(row.get('deleted_at'))
         ))
     
-    logger.info(f"Parsed {len(data_rows)} fuel sale records")
+    logger.info("Parsed %d fuel sale records", len(data_rows))
     return data_rows
 
 
@@ -1186,7 +1189,7 @@ def parse_waitlists_data(csv_content):
             parse_date(parse_date(row.get('updated_at')))
         ))
     
-    logger.info(f"Parsed {len(data_rows)} waitlist records")
+    logger.info("Parsed %d waitlist records", len(data_rows))
     return data_rows
 
 
@@ -1208,7 +1211,7 @@ def parse_closed_dates_data(csv_content):
             parse_date(row.get('updated_at'))
         ))
     
-    logger.info(f"Parsed {len(data_rows)} closed date records")
+    logger.info("Parsed %d closed date records", len(data_rows))
     return data_rows
 
 
@@ -1231,7 +1234,7 @@ def parse_blacklists_data(csv_content):
             parse_date(row.get('created_at'))
         ))
     
-    logger.info(f"Parsed {len(data_rows)} blacklist records")
+    logger.info("Parsed %d blacklist records", len(data_rows))
     return data_rows
 
 
@@ -1244,7 +1247,7 @@ def find_latest_data_file_in_s3(s3_client, bucket):
         response = s3_client.list_objects_v2(Bucket=bucket)
         
         if 'Contents' not in response:
-            logger.warning(f"No files found in bucket: {bucket}")
+            logger.warning("No files found in bucket: %s", bucket)
             return None
         
         # Filter for -DATA.sql.gz files only
@@ -1252,20 +1255,20 @@ def find_latest_data_file_in_s3(s3_client, bucket):
                       if obj['Key'].endswith('-DATA.sql.gz')]
         
         if not data_files:
-            logger.warning(f"No -DATA.sql.gz files found in bucket: {bucket}")
+            logger.warning("No -DATA.sql.gz files found in bucket: %s", bucket)
             return None
         
         # Sort by last modified date (most recent first)
         data_files.sort(key=lambda x: x['LastModified'], reverse=True)
         latest_file = data_files[0]
         
-        logger.info(f"Found latest DATA file: {latest_file['Key']}")
-        logger.info(f"  Last Modified: {latest_file['LastModified']}")
-        logger.info(f"  Size: {latest_file['Size']:,} bytes")
+        logger.info("Found latest DATA file: %s", latest_file['Key'])
+        logger.info("  Last Modified: %s", latest_file['LastModified'])
+        logger.info("  Size: %s bytes", format(latest_file['Size'], ','))
         return latest_file['Key']
         
     except Exception as e:
-        logger.error(f"Error finding latest DATA file: {e}")
+        logger.error("Error finding latest DATA file: %s", e)
         return None
 
 
@@ -1276,7 +1279,7 @@ def extract_table_data_from_sql(sql_content, table_name):
     """
     import re
     
-    logger.info(f"Extracting data for table: {table_name.upper()}")
+    logger.info("Extracting data for table: %s", table_name.upper())
     
     # Pattern to match INSERT INTO statements for this table
     # Example: INSERT INTO `customers` VALUES (1,'John',...);
@@ -1285,7 +1288,7 @@ def extract_table_data_from_sql(sql_content, table_name):
     matches = re.findall(pattern, sql_content, re.IGNORECASE | re.DOTALL)
     
     if not matches:
-        logger.warning(f"No INSERT statements found for table: {table_name}")
+        logger.warning("No INSERT statements found for table: %s", table_name)
         return []
     
     data_rows = []
@@ -1332,7 +1335,7 @@ def extract_table_data_from_sql(sql_content, table_name):
         if values:
             data_rows.append(tuple(values))
     
-    logger.info(f"Extracted {len(data_rows)} rows from {table_name}")
+    logger.info("Extracted %d rows from %s", len(data_rows), table_name)
     return data_rows
 
 
@@ -1372,10 +1375,10 @@ def process_stellar_data_from_s3(
         else:
             s3_client = boto3.client('s3', region_name=region)
         
-        logger.info(f"Connected to S3 region: {region}, bucket: {bucket}")
+        logger.info("Connected to S3 region: %s, bucket: %s", region, bucket)
         
     except Exception as e:
-        logger.exception(f"Failed to initialize S3 client: {e}")
+        logger.exception("Failed to initialize S3 client: %s", e)
         raise
     
     # Find and download latest DATA file
@@ -1385,23 +1388,25 @@ def process_stellar_data_from_s3(
         return
     
     try:
-        logger.info(f"Downloading: s3://{bucket}/{latest_file}")
+        logger.info("Downloading: s3://%s/%s", bucket, latest_file)
         response = s3_client.get_object(Bucket=bucket, Key=latest_file)
         
         # Decompress gzip
         with gzip_module.GzipFile(fileobj=response['Body']) as gzipfile:
             tar_content = gzipfile.read()
         
-        logger.info(f"Downloaded and decompressed {len(tar_content):,} bytes")
+        logger.info(
+            "Downloaded and decompressed %s bytes", format(len(tar_content), ',')
+        )
         
         # Extract tarball
         tar_like = io.BytesIO(tar_content)
         tar = tarfile.open(fileobj=tar_like)
         
-        logger.info(f"Tarball contains {len(tar.getnames())} files")
+        logger.info("Tarball contains %d files", len(tar.getnames()))
         
     except Exception as e:
-        logger.exception(f"Failed to download/extract tarball: {e}")
+        logger.exception("Failed to download/extract tarball: %s", e)
         raise
     
     # Initialize Oracle database
@@ -1409,7 +1414,7 @@ def process_stellar_data_from_s3(
         db_connector = OracleConnector(db_user, db_password, db_dsn)
         logger.info("Connected to Oracle database")
     except Exception as e:
-        logger.exception(f"Failed to connect to Oracle: {e}")
+        logger.exception("Failed to connect to Oracle: %s", e)
         raise
     
     # Define tables to process with their insert functions and parsers
@@ -1465,24 +1470,42 @@ def process_stellar_data_from_s3(
     failed_tables = []
     failed_tables_details = {}  # Track error details for each failed table
     
+    # Clear the staging tables that have a CSV in this tarball up front
+    # (TRUNCATE commits, so it cannot run per table inside the shared
+    # transaction); a table whose CSV is missing keeps its previous staging
+    # data. The inserts below then share one transaction that finalize()
+    # commits once at the end of the load, before it runs the merge
+    # procedures (each of which commits on its own). Loads in a shared
+    # transaction are conventional inserts, so a failed table can be rolled
+    # back on its own; direct-path loads only run when insert_* commits per
+    # table
+    tar_members = set(tar.getnames())
+    db_connector.truncate_staging_tables([
+        table_name for table_name, _, _ in tables_to_process
+        if f"data/{table_name}.csv" in tar_members
+    ])
+    
     for table_name, parser_func, insert_func in tables_to_process:
         try:
-            logger.info(f"\nProcessing table: {table_name.upper()}")
+            logger.info("\nProcessing table: %s", table_name.upper())
             
             # Look for CSV file in tarball
             csv_filename = f"data/{table_name}.csv"
             try:
                 csv_file = tar.extractfile(csv_filename)
                 if csv_file is None:
-                    logger.warning(f"File not found in tarball: {csv_filename}")
+                    logger.warning("File not found in tarball: %s", csv_filename)
                     failed_tables.append(table_name)
                     continue
                 
                 csv_content = csv_file.read().decode('utf-8', errors='ignore')
-                logger.info(f"Extracted {len(csv_content):,} bytes from {csv_filename}")
+                logger.info(
+                    "Extracted %s bytes from %s",
+                    format(len(csv_content), ','), csv_filename
+                )
                 
             except KeyError:
-                logger.warning(f"File not found in tarball: {csv_filename}")
+                logger.warning("File not found in tarball: %s", csv_filename)
                 failed_tables.append(table_name)
                 continue
             
@@ -1490,30 +1513,24 @@ def process_stellar_data_from_s3(
             data_rows = parser_func(csv_content)
             
             if data_rows:
-                staging_table = f"STG_STELLAR_{table_name.upper()}"
-                logger.info(f"Truncating {staging_table}...")
-                db_connector.cursor.execute(
-                    f"TRUNCATE TABLE {staging_table}"
-                )
-                db_connector.connection.commit()
-                
-                insert_func(data_rows)
+                # Rows rejected by batch errors are not counted as loaded
+                inserted = insert_func(data_rows, commit=False)
                 
-                total_records += len(data_rows)
+                total_records += inserted
                 successful_tables += 1
-                successful_tables_details[table_name] = len(data_rows)
+                successful_tables_details[table_name] = inserted
                 logger.info(
-                    f"✅ Successfully processed {table_name}: "
-                    f"{len(data_rows)} records"
+                    "✅ Successfully processed %s: %d of %d records",
+                    table_name, inserted, len(data_rows)
                 )
             else:
-                logger.warning(f"No data rows parsed for {table_name}")
+                logger.warning("No data rows parsed for %s", table_name)
                 failed_tables.append(table_name)
                 failed_tables_details[table_name] = "No data rows in CSV file"
                 
         except Exception as e:
             error_msg = str(e)
-            logger.exception(f"Failed to process {table_name}: {e}")
+            logger.exception("Failed to process %s: %s", table_name, e)
             failed_tables.append(table_name)
             
             # Categorize the error for the report
@@ -1532,31 +1549,45 @@ def process_stellar_data_from_s3(
             else:
                 failed_tables_details[table_name] = error_msg[:100]
     
+    try:
+        failed_merges = db_connector.finalize()
+    except Exception as e:
+        logger.exception("Failed to commit Stellar staging load: %s", e)
+        db_connector.close()
+        raise
+    
+    # A table whose merge failed did not reach the warehouse
+    for merge, error in failed_merges.items():
+        table_name = merge.lower()
+        if table_name in successful_tables_details:
+            total_records -= successful_tables_details.pop(table_name)
+            successful_tables -= 1
+        failed_tables.append(table_name)
+        failed_tables_details[table_name] = f"Merge failed: {error[:100]}"
+    
     # Close tarball and connection
     try:
         tar.close()
     except Exception as e:
-        logger.warning(f"Error closing tarball: {e}")
+        logger.warning("Error closing tarball: %s", e)
     
     try:
-        db_connector.cursor.close()
-        db_connector.connection.close()
-        logger.info("Database connection closed")
+        db_connector.close()
     except Exception as e:
-        logger.warning(f"Error closing connection: {e}")
+        logger.warning("Error closing connection: %s", e)
     
     # Summary
     logger.info("\n" + "=" * 80)
     logger.info("STELLAR BUSINESS DATA PROCESSING - SUMMARY")
     logger.info("=" * 80)
     logger.info(
-        f"Successfully processed: {successful_tables}/"
-        f"{len(tables_to_process)} tables"
+        "Successfully processed: %d/%d tables",
+        successful_tables, len(tables_to_process)
     )
-    logger.info(f"Total records loaded: {total_records}")
+    logger.info("Total records loaded: %d", total_records)
     
     if failed_tables:
-        logger.warning(f"Failed tables: {', '.join(failed_tables)}")
+        logger.warning("Failed tables: %s", ', '.join(failed_tables))
     else:
         logger.info("All tables processed successfully!")
     
@@ -6,9 +6,17 @@ comparison logic that handles NULLs correctly.
 
 import oracledb
 import json
+import re
 import sys
 import os
 
+# End of the UPDATE SET (DW_LAST_UPDATED line) up to WHEN NOT MATCHED,
+# capturing any existing WHERE clause so it is replaced
+UPDATE_WHERE_PATTERN = re.compile(
+    r'(tgt\.DW_LAST_UPDATED = SYSTIMESTAMP)\s*(WHERE\s*\([^)]+\))?\s*(WHEN NOT MATCHED)',
+    re.DOTALL
+)
+
 
 def load_config():
     """Load database configuration from config.json"""
@@ -197,19 +205,18 @@ def update_stored_procedure(proc_file_path, where_clause):
     # Find the UPDATE SET section and add WHERE clause before WHEN NOT MATCHED
     # Look for pattern: "tgt.DW_LAST_UPDATED = SYSTIMESTAMP" followed by optional WHERE and then "WHEN NOT MATCHED"
     
-    import re
-    
-    # Pattern to match the end of UPDATE SET (DW_LAST_UPDATED line) up to WHEN NOT MATCHED
-    # This will capture any existing WHERE clause
-    pattern = r'(tgt\.DW_LAST_UPDATED = SYSTIMESTAMP)\s*(WHERE\s*\([^)]+\))?\s*(WHEN NOT MATCHED)'
-    
     # Replace with new WHERE clause
     replacement = r'\1\n' + where_clause + r'\n    \3'
     
-    new_content = re.sub(pattern, replacement, content, flags=re.DOTALL)
+    new_content, replaced = UPDATE_WHERE_PATTERN.subn(replacement, content)
     
+    # The substitution count says whether the pattern was found; the texts
+    # are only compared when it was, to catch a regenerated identical clause
+    if not replaced:
+        print("\nWARNING: No changes made. Pattern not found.")
+        return False
     if new_content == content:
-        print("\nWARNING: No changes made. Pattern not found or already up to date.")
+        print("\nWARNING: No changes made. Already up to date.")
         return False
     
     # Write updated content
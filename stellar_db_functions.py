@@ -20,26 +20,1044 @@ Dependencies:
     - oracledb: Oracle database connectivity
     - logging: For structured logging
     - os: For environment variable access
+    - datetime: For native DATE/TIMESTAMP bind values
+
+Staging loads that commit per table (insert_* with the default
+commit=True, and every run_all_inserts() load) use direct-path inserts
+(APPEND_VALUES). The STG_STELLAR_* tables are truncated and fully reloaded
+every run, so they are set NOLOGGING to skip redo for those loads (see the
+ALTER TABLE statements in tables/oracle_stellar_staging_tables.sql):
+
+    ALTER TABLE STG_STELLAR_<TABLE> NOLOGGING;
+
+A direct-path insert makes its table unreadable to the same transaction
+until commit (ORA-12838), so a committing load is sent as one array (or in
+committed slices above DIRECT_PATH_MAX_ROWS) and commits before its merge
+runs.
+
+Loads with commit=False, which is how the Stellar S3 ETL loads every
+table, share one transaction and use conventional inserts in BATCH_SIZE
+chunks, so a failed table can be rolled back to its savepoint. They
+generate redo regardless of NOLOGGING; finalize() commits them and runs
+their merges.
 """
 
 import os
+import math
 import logging
+import contextlib
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from decimal import Decimal
+from operator import itemgetter
+
 import oracledb
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Rows per round trip. Cursors are created with this arraysize (and
+# prefetchrows one above it) and executemany() chunks match it, so bind
+# buffers and fetches are sized the same way on every cursor.
+CURSOR_ARRAYSIZE = 10000
+BATCH_SIZE = CURSOR_ARRAYSIZE
+
+# Largest load sent as a single direct-path array. Direct path is only used
+# by loads that commit per table (commit=True, as run_all_inserts() loads
+# do). A direct-path insert cannot be split into chunks within one
+# transaction (ORA-12838), so a bigger committing load is sent in slices of
+# this size with a commit after each, keeping the client bind buffers
+# bounded (DPI-1015 / the 2GB array limit). Loads that share a transaction
+# (commit=False, as the Stellar S3 ETL loads every table) are always
+# conventional, in BATCH_SIZE chunks, so a failed table can be rolled back
+# to its savepoint.
+DIRECT_PATH_MAX_ROWS = 100000
+
+# Statement cache size per connection; covers every staging INSERT plus
+# the merge procedure calls so parsed statement handles stay resident.
+STATEMENT_CACHE_SIZE = 60
+
+# Driver-wide defaults, so connections opened outside the pool get the same
+# statement cache, and any incidental LOB column is fetched as str/bytes
+# rather than as a locator that costs another round trip to read.
+oracledb.defaults.stmtcachesize = STATEMENT_CACHE_SIZE
+oracledb.defaults.fetch_lobs = False
+
+# Network tuning: maximum session data unit (bytes per packet) so large
+# array binds go out in fewer packets, and a short connect timeout so an
+# unreachable database fails fast instead of hanging the job.
+SESSION_DATA_UNIT = 65535
+TCP_CONNECT_TIMEOUT = 5
+
+# COMMIT_WRITE settings. Pooled sessions commit staging loads without
+# waiting for the redo flush (see _init_session); merges into the warehouse
+# switch to the default durable commit for as long as they run.
+STAGING_COMMIT_WRITE = 'BATCH,NOWAIT'
+MERGE_COMMIT_WRITE = 'IMMEDIATE,WAIT'
+
+# Password for ewallet.pem, which thin mode reads instead of cwallet.sso.
+# Empty for an auto-login wallet.
+WALLET_PASSWORD = os.environ.get('ORACLE_WALLET_PASSWORD', '')
+
+# Rows per INSERT ALL statement for the narrow, low-volume tables. A fixed
+# batch shape keeps the statement text identical between full batches so
+# it stays a shared-pool (and statement cache) hit.
+INSERT_ALL_BATCH = 100
+
+# Loads this small go out as a single INSERT ALL statement for any table
+# narrow enough to take them in one; below this size the executemany()
+# setup costs more than the rows.
+INSERT_ALL_MAX_ROWS = 32
+
+# Oracle limit on the total number of columns across all INTO clauses of
+# one multitable insert; caps the rows per INSERT ALL at 999 // width.
+INSERT_ALL_MAX_COLUMNS = 999
+
+# Committing loads at least this large mark the staging table's secondary
+# indexes UNUSABLE for the load and rebuild them once afterwards, instead
+# of maintaining them row by row (see OracleConnector._bulk_mode).
+BULK_MODE_MIN_ROWS = 50000
+
+# Rejected rows reported individually per table load; the rest are only
+# counted so one bad feed cannot flood the log.
+BATCH_ERROR_LOG_LIMIT = 20
+
+# Session pool sizing and worker count for run_all_inserts(). The staging
+# tables are independent until the merge step, so they load concurrently.
+# POOL_MIN opens only the main connection up front; the pool grows by
+# POOL_INCREMENT when run_all_inserts() needs more sessions. POOL_MAX leaves
+# room for the main connection next to every worker.
+POOL_MIN = 1
+POOL_MAX = 16
+POOL_INCREMENT = 2
+INSERT_WORKERS = 8
+
+
+def _as_row_tuples(data_rows):
+    """
+    Normalize insert input to the list of tuples executemany() binds.
+    
+    Parser output (a list of tuples) is returned unchanged. A pandas
+    DataFrame, detected by duck typing so pandas stays optional, is
+    converted in one pass with NaN/NaT mapped to None. Any other iterable
+    of sequences is materialized as tuples.
+    """
+    if isinstance(data_rows, list):
+        if not data_rows or type(data_rows[0]) is tuple:
+            return data_rows
+        return [tuple(row) for row in data_rows]
+    if hasattr(data_rows, 'itertuples'):
+        return [
+            tuple(None if v != v else v for v in row)
+            for row in data_rows.itertuples(index=False, name=None)
+        ]
+    return [tuple(row) for row in data_rows]
+
+
+# The CSV dates and timestamps are ISO 8601 ('YYYY-MM-DD' and
+# 'YYYY-MM-DD HH:MM:SS'); datetime.fromisoformat() parses them in C, several
+# times faster than strptime(), which goes through the regex-based _strptime
+# module on every call.
+
+
+def _parse_date(value):
+    """Convert a 'YYYY-MM-DD' string to a datetime for a native DATE bind."""
+    if value is None or isinstance(value, date):
+        return value
+    if value == '':
+        return None
+    return datetime.fromisoformat(value)
+
+
+def _parse_timestamp(value):
+    """Convert a 'YYYY-MM-DD HH:MM:SS' string to a datetime for a TIMESTAMP bind."""
+    if value is None or isinstance(value, datetime):
+        return value
+    if value == '':
+        return None
+    return datetime.fromisoformat(value)
+
+
+def _memoized(parse):
+    """Wrap a parser with a dict cache that lives as long as the wrapper."""
+    cache = {}
+    
+    def lookup(value):
+        try:
+            return cache[value]
+        except KeyError:
+            result = cache[value] = parse(value)
+            return result
+    
+    return lookup
+
+
+def _convert_datetime_columns(rows, date_cols=(), timestamp_cols=()):
+    """
+    Parse date and timestamp string columns into datetime objects.
+    
+    The rows are transposed so each affected column is parsed with a single
+    map() over the whole batch, instead of copying every row into a list
+    and assigning its fields one at a time. Rows loaded together often share
+    CREATED_AT/UPDATED_AT values, so each distinct string is parsed once per
+    call and reused; the cache is dropped when the call returns.
+    
+    Args:
+        rows (list): List of tuples as produced by the CSV parsers
+        date_cols (tuple): Zero-based positions of DATE columns
+        timestamp_cols (tuple): Zero-based positions of TIMESTAMP columns
+    
+    Returns:
+        list: New list of tuples with the given columns converted
+    """
+    if not rows or not (date_cols or timestamp_cols):
+        return list(rows)
+    columns = list(zip(*rows))
+    parse_date = _memoized(_parse_date)
+    parse_timestamp = _memoized(_parse_timestamp)
+    for i in date_cols:
+        columns[i] = map(parse_date, columns[i])
+    for i in timestamp_cols:
+        columns[i] = map(parse_timestamp, columns[i])
+    return list(zip(*columns))
+
+
+@functools.lru_cache(maxsize=None)
+def _insert_all_sql(table, columns, num_rows):
+    """
+    Build a multi-row INSERT ALL statement with positional binds.
+    
+    Args:
+        table (str): Staging table name
+        columns (tuple): Column names in bind order
+        num_rows (int): Number of INTO clauses to emit
+    
+    Returns:
+        str: INSERT ALL ... SELECT 1 FROM DUAL statement
+    """
+    width = len(columns)
+    column_list = ", ".join(columns)
+    clauses = []
+    for r in range(num_rows):
+        binds = ", ".join(f":{r * width + c + 1}" for c in range(width))
+        clauses.append(f"    INTO {table} ({column_list}) VALUES ({binds})")
+    return "INSERT ALL\n" + "\n".join(clauses) + "\nSELECT 1 FROM DUAL"
+
+
+def _datetime_input_sizes(num_cols, date_cols=(), timestamp_cols=()):
+    """Build a setinputsizes() list pinning DATE/TIMESTAMP bind positions."""
+    sizes = [None] * num_cols
+    for i in date_cols:
+        sizes[i] = oracledb.DB_TYPE_DATE
+    for i in timestamp_cols:
+        sizes[i] = oracledb.DB_TYPE_TIMESTAMP
+    return sizes
+
+
+def _to_number(value):
+    """
+    Convert a stray value in a NUMBER column to int or float.
+    
+    Raises:
+        ValueError: If value is not numeric, or is NaN or infinite (Oracle
+                    NUMBER cannot hold either)
+    """
+    if isinstance(value, str):
+        try:
+            return int(value)
+        except ValueError:
+            number = float(value)
+    else:
+        number = int(value) if isinstance(value, bool) else float(value)
+    if isinstance(number, float) and not math.isfinite(number):
+        raise ValueError(f"{value!r} is not a finite number")
+    return number
+
+
+# Value types each kind of pinned bind position accepts as-is
+_NUMBER_TYPES = frozenset((int, float, Decimal, type(None)))
+_TEXT_TYPES = frozenset((str, type(None)))
+_INEXACT_TYPES = frozenset((float, Decimal))
+
+
+def _is_finite(value):
+    """Return False for a float or Decimal NaN/infinity, True otherwise."""
+    if type(value) is float:
+        return math.isfinite(value)
+    if type(value) is Decimal:
+        return value.is_finite()
+    return True
+
+
+def _normalize_columns(rows, input_sizes):
+    """
+    Coerce stray values so every column matches the type it is pinned to.
+    
+    CSV-derived columns occasionally mix types (an int column with a '12'
+    string, a text column with a number). Each pinned NUMBER or text column
+    is type-checked in one pass; only columns that actually hold stray
+    values are rebuilt, so the common case costs one scan per column. A
+    value that cannot be converted (including NaN and infinity in a NUMBER
+    column) is left in place and its column is bound as text for this
+    batch, so Oracle's own conversion rejects just that row through batch
+    errors (or fails a direct-path insert) instead of loading a wrong value.
+    
+    Args:
+        rows (list): List of tuples to bind
+        input_sizes (list): setinputsizes() arguments (see
+                            OracleConnector._column_input_sizes)
+    
+    Returns:
+        tuple: (rows, input_sizes) -- unchanged, or a new list of tuples
+               with stray values coerced and the sizes to bind it with
+    """
+    stray = []
+    for c, size in enumerate(input_sizes):
+        if size is oracledb.DB_TYPE_NUMBER:
+            allowed, convert = _NUMBER_TYPES, _to_number
+        elif isinstance(size, int):
+            allowed, convert = _TEXT_TYPES, str
+        else:
+            continue
+        values = tuple(map(itemgetter(c), rows))
+        types = set(map(type, values))
+        if not types <= allowed or (
+                convert is _to_number and types & _INEXACT_TYPES
+                and not all(map(_is_finite, values))):
+            stray.append((c, allowed, convert))
+    if not stray:
+        return rows, input_sizes
+    
+    columns = list(zip(*rows))
+    input_sizes = list(input_sizes)
+    for c, allowed, convert in stray:
+        values = list(columns[c])
+        unconvertible = 0
+        for i, value in enumerate(values):
+            if type(value) in allowed and (convert is str or _is_finite(value)):
+                continue
+            try:
+                values[i] = convert(value)
+            except (TypeError, ValueError):
+                if unconvertible < BATCH_ERROR_LOG_LIMIT:
+                    logger.warning(
+                        "⚠️  Cannot convert %r in column %d of batch row %d",
+                        value, c + 1, i
+                    )
+                unconvertible += 1
+        if unconvertible:
+            values = [None if v is None else str(v) for v in values]
+            input_sizes[c] = max(
+                1, max(len(v) for v in values if v is not None)
+            )
+            logger.warning(
+                "⚠️  Binding column %d as text for %d unconvertible values",
+                c + 1, unconvertible
+            )
+        columns[c] = values
+    return list(zip(*columns)), input_sizes
+
+
+@dataclass(frozen=True)
+class TableSpec:
+    """
+    Load definition for one Stellar staging table.
+    
+    Attributes:
+        table: Staging table name
+        label: Singular noun used in log messages (e.g. 'booking boat')
+        columns: Column names in CSV parser (bind) order
+        date_cols: Zero-based positions of DATE columns
+        timestamp_cols: Zero-based positions of TIMESTAMP columns
+        merge: Suffix of the SP_MERGE_STELLAR_* procedure run right after
+               the load, or None when the table is merged later
+        insert_all: Load with multi-row INSERT ALL instead of executemany();
+                    only for tables narrow enough for INSERT_ALL_BATCH rows
+                    per statement
+        sql: Direct-path INSERT statement with one positional bind per column
+        conventional_sql: Same INSERT without the direct-path hint, for
+                          loads that insert into the table more than once
+        insert_all_rows: Most rows one INSERT ALL statement can carry for
+                         this table (INSERT_ALL_MAX_COLUMNS // width)
+    """
+    table: str
+    label: str
+    columns: tuple
+    date_cols: tuple = ()
+    timestamp_cols: tuple = ()
+    merge: str = None
+    insert_all: bool = False
+    sql: str = field(init=False, repr=False)
+    conventional_sql: str = field(init=False, repr=False)
+    insert_all_rows: int = field(init=False, repr=False)
+    
+    def __post_init__(self):
+        # Build the INSERTs once, when TABLES is defined at import, so
+        # every load passes the same string object to the driver
+        binds = ", ".join(f":{i}" for i in range(1, len(self.columns) + 1))
+        target = f"INTO {self.table} ({', '.join(self.columns)}) VALUES ({binds})"
+        object.__setattr__(self, 'sql', f"INSERT /*+ APPEND_VALUES */ {target}")
+        object.__setattr__(self, 'conventional_sql', f"INSERT {target}")
+        rows = INSERT_ALL_MAX_COLUMNS // len(self.columns)
+        if self.insert_all and rows < INSERT_ALL_BATCH:
+            raise ValueError(
+                f"{self.table} is too wide for INSERT ALL batches of "
+                f"{INSERT_ALL_BATCH} rows ({len(self.columns)} columns)"
+            )
+        object.__setattr__(self, 'insert_all_rows', rows)
+
+
+# Every Stellar staging table, keyed by the name used in insert_<key>() and
+# run_all_inserts() payloads
+TABLES = {
+    'locations': TableSpec(
+        'STG_STELLAR_LOCATIONS', 'location',
+        (
+            'ID', 'CODE', 'LOCATION_NAME', 'LOCATION_TYPE', 'MINIMUM_1',
+            'MINIMUM_2', 'DELIVERY', 'FRONTEND', 'PRICING', 'IS_INTERNAL',
+            'IS_CANCELED', 'CANCEL_REASON', 'CANCEL_DATE', 'IS_TRANSFERRED',
+            'TRANSFER_DESTINATION', 'MODULE_TYPE', 'OPERATING_LOCATION',
+            'ZOHO_ID', 'ZCRM_ID', 'IS_ACTIVE', 'CREATED_AT', 'UPDATED_AT'
+        ),
+        date_cols=(12,), timestamp_cols=(20, 21)
+    ),
+    'customers': TableSpec(
+        'STG_STELLAR_CUSTOMERS', 'customer',
+        (
+            'USER_ID', 'CLUB_PRINCIPAL_USER_ID', 'COUPON_ID', 'CLUB_TIER_ID',
+            'FIRST_NAME', 'LAST_NAME', 'MIDDLE_NAME', 'GENDER', 'PHONE',
+            'CELL', 'EMERGENCY_NAME', 'EMERGENCY_PHONE', 'SECONDARY_EMAIL',
+            'BILLING_STREET1', 'BILLING_STREET2', 'BILLING_CITY',
+            'BILLING_STATE', 'BILLING_COUNTRY', 'BILLING_ZIP',
+            'MAILING_STREET1', 'MAILING_STREET2', 'MAILING_CITY',
+            'MAILING_STATE', 'MAILING_COUNTRY', 'MAILING_ZIP', 'NUM_KIDS',
+            'REFERRER', 'SERVICES', 'DATE_OF_BIRTH', 'DL_STATE', 'DL_COUNTRY',
+            'DL_NUMBER', 'NOTES', 'INTERNAL_NOTES', 'CLUB_STATUS',
+            'CLUB_START_DATE', 'CLUB_USE_RECURRING_BILLING',
+            'CLUB_RECURRING_BILLING_START_DATE', 'BALANCE',
+            'BOAT_DAMAGE_RESPONSIBILITY_COVERAGE', 'PENALTY_POINTS',
+            'OPEN_BALANCE_THRESHOLD', 'CLUB_END_DATE', 'CC_SAVED_NAME',
+            'CC_SAVED_LAST4', 'CC_SAVED_EXPIRY', 'CC_SAVED_PROFILE_ID',
+            'CC_SAVED_METHOD_ID', 'CC_SAVED_ADDRESS_ID', 'EXTERNAL_ID',
+            'CREATED_AT', 'UPDATED_AT'
+        ),
+        merge='CUSTOMERS'
+    ),
+    'bookings': TableSpec(
+        'STG_STELLAR_BOOKINGS', 'booking',
+        (
+            'ID', 'LOCATION_ID', 'CUSTOMER_ID', 'CREATOR_ID', 'ADMIN_ID',
+            'BILLING_FIRST_NAME', 'BILLING_LAST_NAME', 'BILLING_STREET1',
+            'BILLING_STREET2', 'BILLING_CITY', 'BILLING_STATE',
+            'BILLING_COUNTRY', 'BILLING_ZIP', 'CC_SAVED_NAME',
+            'CC_SAVED_LAST4', 'CC_SAVED_PROFILE_ID', 'CC_SAVED_METHOD_ID',
+            'CC_SAVED_ADDRESS_ID', 'CC_PREAUTH_ID', 'CC_PREAUTH_AMOUNT',
+            'CC_CONNECT_TYPE', 'CC_CONNECT_ID', 'ACCESSORIES_CUSTOM_PRICE',
+            'ACCESSORIES_TOTAL', 'INSURANCE_AMOUNT', 'PETS', 'PARKING',
+            'PARKING_OVERRIDE', 'BOATS_TOTAL', 'POS_TOTAL', 'USE_CLUB_CREDITS',
+            'NO_SHOW_FEE', 'CANCELLATION_FEE', 'CLUB_FEES',
+            'CLUB_FEES_OVERRIDE', 'SUB_TOTAL', 'CONVENIENCE_FEE',
+            'CONVENIENCE_FEE_WAIVED', 'INTERNAL_APPLICATION_FEE', 'TAX_1',
+            'TAX_1_EXEMPT', 'TAX_1_RATE_OVERRIDE', 'TAX_2', 'TAX_2_EXEMPT',
+            'CHECK_IN_TAX_1', 'CHECK_IN_TAX_2', 'CHECK_IN_TOTAL',
+            'DEPOSIT_TOTAL', 'DEPOSIT_OVERRIDE', 'DEPOSIT_WAIVED', 'GRATUITY',
+            'GRAND_TOTAL', 'ADJUSTMENT_TOTAL', 'AMOUNT_PAID', 'NOTES',
+            'NOTES_CONTRACT', 'NOTES_FROM_CUSTOMER',
+            'NOTES_FROM_CUSTOMER_CONTRACT', 'NOTES_FOR_CUSTOMER',
+            'NOTES_FOR_CUSTOMER_CONTRACT', 'FRONTEND', 'IS_ON_HOLD',
+            'IS_LOCKED', 'IS_FINALIZED', 'IS_CANCELED',
+            'OVERRIDE_TURNAROUND_TIME', 'CANCELLATION_TYPE',
+            'BYPASS_CLUB_RESTRICTIONS', 'RENTERS_INSURANCE_INTEREST',
+            'COUPON_ID', 'COUPON_TYPE', 'COUPON_AMOUNT', 'DISCOUNT_TOTAL',
+            'AGENT_ID', 'AGENT_NAME', 'REFERRER_ID', 'SAFETY_REMINDER',
+            'DELETED_ADMIN_ID', 'CREATED_AT', 'UPDATED_AT', 'FINALIZED_AT',
+            'DELETED_AT'
+        ),
+        timestamp_cols=(78, 79, 80, 81), merge='BOOKINGS'
+    ),
+    'booking_boats': TableSpec(
+        'STG_STELLAR_BOOKING_BOATS', 'booking boat',
+        (
+            'ID', 'BOOKING_ID', 'STYLE_ID', 'BOAT_ID', 'TIME_ID',
+            'TIMEFRAME_ID', 'MAIN_BOAT', 'NUM_PASSENGERS', 'BOAT_DEPARTURE',
+            'BOAT_RETURN', 'STATUS_BOOKING', 'PRICE', 'PRICE_OVERRIDE',
+            'SIGNATURE_DATE', 'CHECK_OUT_DATE', 'CHECK_OUT_EQUIPMENT',
+            'CHECK_OUT_NOTES', 'CHECK_OUT_ENGINE_HOURS', 'CHECK_IN_DATE',
+            'CHECK_IN_EQUIPMENT', 'CHECK_IN_NOTES', 'CHECK_IN_ENGINE_HOURS',
+            'CHECK_IN_HOURS', 'CHECK_IN_DEPOSIT', 'CHECK_IN_WEATHER',
+            'CHECK_IN_LATE', 'CHECK_IN_MISC_NON_TAX', 'CHECK_IN_MISC_TAX',
+            'CHECK_IN_CLEANING', 'CHECK_IN_GALLONS', 'CHECK_IN_FUEL',
+            'CHECK_IN_DIESEL_GALLONS', 'CHECK_IN_DIESEL', 'CHECK_IN_TIP',
+            'CHECK_IN_TAX_1', 'CHECK_IN_TAX_2', 'CHECK_IN_TOTAL',
+            'QUEUE_ADMIN_ID', 'QUEUE_DATE', 'ATTENDANT_QUEUE_ADMIN_ID',
+            'ATTENDANT_WATER_ADMIN_ID', 'BOAT_ASSIGNED', 'ADDITIONAL_DRIVERS',
+            'ADDITIONAL_DRIVER_NAMES', 'ACCESSORIES_MIGRATED', 'PRICE_RULE_ID',
+            'PRICE_RULE_ORIGINAL_PRICE', 'PRICE_RULE_DYNAMIC_PRICE',
+            'PRICE_RULE_DIFFERENCE', 'EMERGENCY_NAME', 'EMERGENCY_PHONE',
+            'DATE_OF_BIRTH', 'CONTRACT_RETURN_PDF', 'CONTRACT_PDF',
+            'CREATED_AT', 'UPDATED_AT', 'DELETED_AT'
+        ),
+        merge='BOOKING_BOATS'
+    ),
+    'booking_payments': TableSpec(
+        'STG_STELLAR_BOOKING_PAYMENTS', 'booking payment',
+        (
+            'ID', 'BOOKING_ID', 'CUSTOMER_ID', 'ADMIN_ID', 'FRONTEND',
+            'PAYMENT_FOR', 'PAYMENT_TYPE', 'CARD_TYPE', 'PAYMENT_TOTAL',
+            'CASH_TOTAL', 'CREDIT_TOTAL', 'AGENT_AR_TOTAL', 'CREDIT_LAST4',
+            'CREDIT_EXPIRY', 'BILLING_FIRST_NAME', 'BILLING_LAST_NAME',
+            'BILLING_STREET1', 'BILLING_STREET2', 'BILLING_CITY',
+            'BILLING_STATE', 'BILLING_COUNTRY', 'BILLING_ZIP', 'TRANS_ID',
+            'ORIGINAL_PAYMENT_ID', 'STATUS_PAYMENT', 'NOTES', 'IS_AGENT_AR',
+            'OFFLINE_TYPE', 'DOCK_MASTER_TICKET', 'MY_TASK_IT_ID',
+            'REPORT_BOATS', 'REPORT_PROPANE', 'REPORT_ACCESSORIES',
+            'REPORT_PARKING', 'REPORT_INSURANCE', 'REPORT_FUEL',
+            'REPORT_DAMAGES', 'REPORT_CLEANING', 'REPORT_LATE', 'REPORT_OTHER',
+            'REPORT_DISCOUNT', 'INTERNAL_APPLICATION_FEE', 'CC_PROCESSOR_FEE',
+            'CC_BRAND', 'CC_COUNTRY', 'CC_FUNDING', 'CC_CONNECT_TYPE',
+            'CC_CONNECT_ID', 'CC_PAYOUT_ID', 'CC_PAYOUT_DATE',
+            'EXTERNAL_CHARGE_ID', 'IS_SYNCED', 'STRIPE_READER_ID',
+            'CREATED_AT', 'UPDATED_AT', 'DELETED_AT'
+        ),
+        timestamp_cols=(49, 53, 54, 55), merge='BOOKING_PAYMENTS'
+    ),
+    'style_groups': TableSpec(
+        'STG_STELLAR_STYLE_GROUPS', 'style group',
+        (
+            'ID', 'LOCATION_ID', 'GROUP_NAME', 'FRONTEND_MAX_SAME_DEPARTURES',
+            'SAFETY_TEST_ENABLED', 'SAFETY_TEST_INSTRUCTIONS',
+            'SAFETY_TEST_MIN_PERCENT_PASS', 'SAFETY_TEST_EXPIRATION_DAYS',
+            'SAFETY_VIDEO_LINK', 'CREATED_AT', 'UPDATED_AT'
+        ),
+        timestamp_cols=(9, 10)
+    ),
+    'styles': TableSpec(
+        'STG_STELLAR_STYLES', 'style',
+        (
+            'ID', 'LOCATION_ID', 'STYLE_GROUP_ID', 'STYLE_NAME',
+            'BACKEND_DISPLAY', 'POSITION_ORDER', 'TURN_AROUND_TIME',
+            'DEPOSIT_AMOUNT', 'MULTI_DAY_DEPOSIT_AMOUNT', 'PRE_AUTH_AMOUNT',
+            'FUEL_BURN_RATIO', 'TAX_1_RATE', 'TAX_2_RATE', 'INSURANCE_ENABLED',
+            'INSURANCE_PRICING_TYPE', 'INSURANCE_PRICING_RATE',
+            'INSURANCE_FIRST_DAY_PRICE', 'GRATUITY_ENABLED',
+            'GRATUITY_PRICING_RATE', 'PARKING_QTY_MULTIPLIER',
+            'FRONTEND_DISPLAY', 'FRONTEND_NAME', 'FRONTEND_POSITION',
+            'FRONTEND_TYPE', 'FRONTEND_QTY_LIMIT', 'FRONTEND_UNIT_SELECTOR',
+            'FRONTEND_PARTIAL_PAYMENT_TYPE', 'FRONTEND_PARTIAL_PAYMENT_AMOUNT',
+            'BACKEND_MULTI_DAY_DISABLED', 'MAX_SAME_STYLE_PER_BOOKING',
+            'FRONTEND_MIN_HOURS_ADVANCE_DEPARTURE', 'BACKEND_HOURLY_ENABLED',
+            'WEEK_DAY_BACKEND_HOURLY_MIN_HOURS',
+            'WEEK_DAY_BACKEND_HOURLY_MAX_HOURS',
+            'WEEK_END_BACKEND_HOURLY_MIN_HOURS',
+            'WEEK_END_BACKEND_HOURLY_MAX_HOURS',
+            'HOLIDAY_BACKEND_HOURLY_MIN_HOURS',
+            'HOLIDAY_BACKEND_HOURLY_MAX_HOURS', 'FRONTEND_HOURLY_ENABLED',
+            'WEEK_DAY_FRONTEND_HOURLY_MIN_HOURS',
+            'WEEK_DAY_FRONTEND_HOURLY_MAX_HOURS',
+            'WEEK_DAY_FRONTEND_HOURLY_TIME_INCREMENT',
+            'WEEK_DAY_FRONTEND_HOURLY_LENGTH_INCREMENT',
+            'WEEK_END_FRONTEND_HOURLY_MIN_HOURS',
+            'WEEK_END_FRONTEND_HOURLY_MAX_HOURS',
+            'WEEK_END_FRONTEND_HOURLY_TIME_INCREMENT',
+            'WEEK_END_FRONTEND_HOURLY_LENGTH_INCREMENT',
+            'HOLIDAY_FRONTEND_HOURLY_MIN_HOURS',
+            'HOLIDAY_FRONTEND_HOURLY_MAX_HOURS',
+            'HOLIDAY_FRONTEND_HOURLY_TIME_INCREMENT',
+            'HOLIDAY_FRONTEND_HOURLY_LENGTH_INCREMENT',
+            'BACKEND_NIGHTLY_ENABLED', 'BACKEND_NIGHTLY_MIN_NIGHTS',
+            'BACKEND_NIGHTLY_MAX_NIGHTS', 'BACKEND_NIGHTLY_START',
+            'BACKEND_NIGHTLY_END', 'BACKEND_NIGHTLY_DISCOUNT_DAYS',
+            'BACKEND_NIGHTLY_DISCOUNT_TYPE', 'BACKEND_NIGHTLY_DISCOUNT_AMOUNT',
+            'FRONTEND_NIGHTLY_ENABLED', 'FRONTEND_NIGHTLY_MIN_NIGHTS',
+            'FRONTEND_NIGHTLY_MIN_NIGHTS_PEAK', 'FRONTEND_NIGHTLY_MAX_NIGHTS',
+            'FRONTEND_NIGHTLY_START', 'FRONTEND_NIGHTLY_END',
+            'FRONTEND_NIGHTLY_ADDL_TIMES', 'FRONTEND_NIGHTLY_DISCOUNT_DAYS',
+            'FRONTEND_NIGHTLY_DISCOUNT_TYPE',
+            'FRONTEND_NIGHTLY_DISCOUNT_AMOUNT', 'IMAGE_URL', 'PASSENGERS',
+            'WEIGHT_CAPACITY', 'HORSEPOWER', 'ENGINE_TYPE', 'LENGTH_FEET',
+            'WIDTH_FEET', 'DRAFT_FEET', 'FUEL_CAPACITY', 'BRAND', 'MODEL',
+            'TITLE', 'DESCRIPTION_TEXT', 'SUMMARY_TEXT', 'NOTES', 'VIDEO_LINK',
+            'SMARTWAIVER_WAIVER_LINK', 'ACCOUNTING_ITEM_ID',
+            'LOCAL_VIDEO_LINK', 'DOCKMASTER_PART_NUMBER',
+            'DOCKMASTER_TAX_CODE', 'END_HOURS',
+            'SEASONAL_BUFFER_DEFAULT_LOWER', 'SEASONAL_BUFFER_DEFAULT_UPPER',
+            'SEASONAL_BUFFER_PEAK_LOWER', 'SEASONAL_BUFFER_PEAK_UPPER',
+            'BILLABLE_UNIT_TYPE', 'CREATED_AT', 'UPDATED_AT'
+        ),
+        timestamp_cols=(96, 97), merge='STYLES'
+    ),
+    'style_boats': TableSpec(
+        'STG_STELLAR_STYLE_BOATS', 'style boat',
+        (
+            'ID', 'STYLE_ID', 'BOAT_NUMBER', 'PAPER_LESS_NUMBER', 'MOTOR',
+            'MANUFACTURER', 'SERIAL_NUMBER', 'IN_FLEET', 'HULL_NUMBER',
+            'STATE_NUMBER', 'CYLINDERS', 'HP', 'MODEL', 'BOAT_TYPE',
+            'PURCHASED_DATE', 'PURCHASED_COST', 'SALE_DATE', 'SALE_PRICE',
+            'CLUB_LOCATION', 'DEALER_NAME', 'DEALER_CITY', 'DEALER_STATE',
+            'PO_NUMBER', 'BOAT_YEAR_MODEL', 'MOTOR_YEAR_MODEL',
+            'MOTOR_MANUFACTURER_MODEL', 'STATE_REG_DATE', 'STATE_REG_EXP_DATE',
+            'ENGINE_PURCHASED_COST', 'BACKEND_DISPLAY', 'POSITION_ORDER',
+            'STATUS_BOAT', 'SERVICE_START', 'SERVICE_END', 'CLEAN_STATUS',
+            'INSURANCE_REG_NO', 'BUOY_INSURANCE_STATUS', 'CREATED_AT',
+            'UPDATED_AT'
+        ),
+        date_cols=(14, 16, 26, 27, 32, 33), timestamp_cols=(37, 38), merge='STYLE_BOATS'
+    ),
+    'customer_boats': TableSpec(
+        'STG_STELLAR_CUSTOMER_BOATS', 'customer boat',
+        (
+            'ID', 'CUSTOMER_ID', 'SLIP_ID', 'BOAT_NAME', 'BOAT_NUMBER',
+            'LENGTH_FEET', 'WIDTH_FEET', 'CREATED_AT', 'UPDATED_AT'
+        ),
+        timestamp_cols=(7, 8), insert_all=True
+    ),
+    'seasons': TableSpec(
+        'STG_STELLAR_SEASONS', 'season',
+        (
+            'ID', 'LOCATION_ID', 'SEASON_NAME', 'SEASON_START', 'SEASON_END',
+            'STATUS_SEASON', 'WEEK_DAY_MIN_START_TIME',
+            'WEEK_DAY_MAX_START_TIME', 'WEEK_DAY_MIN_END_TIME',
+            'WEEK_DAY_MAX_END_TIME', 'WEEK_END_MIN_START_TIME',
+            'WEEK_END_MAX_START_TIME', 'WEEK_END_MIN_END_TIME',
+            'WEEK_END_MAX_END_TIME', 'HOLIDAY_MIN_START_TIME',
+            'HOLIDAY_MAX_START_TIME', 'HOLIDAY_MIN_END_TIME',
+            'HOLIDAY_MAX_END_TIME', 'CREATED_AT', 'UPDATED_AT'
+        ),
+        date_cols=(3, 4), timestamp_cols=(18, 19)
+    ),
+    'season_dates': TableSpec(
+        'STG_STELLAR_SEASON_DATES', 'season date',
+        (
+            'ID', 'SEASON_ID', 'START_DATE', 'END_DATE'
+        ),
+        date_cols=(2, 3), insert_all=True
+    ),
+    'style_hourly_prices': TableSpec(
+        'STG_STELLAR_STYLE_HOURLY_PRICES', 'style hourly price',
+        (
+            'ID', 'STYLE_ID', 'SEASON_ID', 'HOURLY_TYPE', 'DEFAULT_PRICE',
+            'HOLIDAY', 'SATURDAY', 'SUNDAY', 'MONDAY', 'TUESDAY', 'WEDNESDAY',
+            'THURSDAY', 'FRIDAY', 'DAY_DISCOUNT', 'UNDER_ONE_HOUR',
+            'FIRST_HOUR_AM', 'FIRST_HOUR_PM', 'MAX_PRICE', 'MIN_HOURS',
+            'MAX_HOURS', 'CREATED_AT', 'UPDATED_AT'
+        ),
+        timestamp_cols=(20, 21), merge='STYLE_HOURLY_PRICES'
+    ),
+    'style_times': TableSpec(
+        'STG_STELLAR_STYLE_TIMES', 'style time',
+        (
+            'ID', 'STYLE_ID', 'SEASON_ID', 'DESCRIPTION_TEXT',
+            'FRONTEND_DISPLAY', 'START_1', 'END_1', 'END_DAYS_1', 'STATUS_1',
+            'START_2', 'END_2', 'END_DAYS_2', 'STATUS_2', 'START_3', 'END_3',
+            'END_DAYS_3', 'STATUS_3', 'START_4', 'END_4', 'END_DAYS_4',
+            'STATUS_4', 'VALID_DAYS', 'HOLIDAYS_ONLY_IF_VALID_DAY',
+            'MAPPED_TIME_ID', 'CREATED_AT', 'UPDATED_AT'
+        ),
+        timestamp_cols=(24, 25), merge='STYLE_TIMES'
+    ),
+    'style_prices': TableSpec(
+        'STG_STELLAR_STYLE_PRICES', 'style price',
+        (
+            'TIME_ID', 'DEFAULT_PRICE', 'HOLIDAY', 'SATURDAY', 'SUNDAY',
+            'MONDAY', 'TUESDAY', 'WEDNESDAY', 'THURSDAY', 'FRIDAY',
+            'CREATED_AT', 'UPDATED_AT'
+        ),
+        timestamp_cols=(10, 11), merge='STYLE_PRICES'
+    ),
+    'accessories': TableSpec(
+        'STG_STELLAR_ACCESSORIES', 'accessory',
+        (
+            'ID', 'LOCATION_ID', 'ACCESSORY_NAME', 'POSITION_ORDER',
+            'FRONTEND_POSITION', 'SHORT_NAME', 'ABBREVIATION', 'IMAGE_URL',
+            'PRICE', 'DEPOSIT_AMOUNT', 'TAX_EXEMPT', 'MAX_OVERLAPPING_RENTALS',
+            'FRONTEND_QTY_LIMIT', 'USE_STRIPED_BACKGROUND',
+            'BACKEND_AVAILABLE_DAYS', 'FRONTEND_AVAILABLE_DAYS',
+            'MAX_SAME_DEPARTURES', 'CREATED_AT', 'UPDATED_AT'
+        ),
+        timestamp_cols=(17, 18)
+    ),
+    'accessory_options': TableSpec(
+        'STG_STELLAR_ACCESSORY_OPTIONS', 'accessory option',
+        (
+            'ID', 'ACCESSORY_ID', 'VALUE_TEXT', 'USE_STRIPED_BACKGROUND',
+            'CREATED_AT', 'UPDATED_AT'
+        ),
+        timestamp_cols=(4, 5)
+    ),
+    'accessory_tiers': TableSpec(
+        'STG_STELLAR_ACCESSORY_TIERS', 'accessory tier',
+        (
+            'ID', 'ACCESSORY_ID', 'MIN_HOURS', 'MAX_HOURS', 'PRICE',
+            'ACCESSORY_OPTION_ID', 'CREATED_AT', 'UPDATED_AT'
+        ),
+        timestamp_cols=(6, 7)
+    ),
+    'booking_accessories': TableSpec(
+        'STG_STELLAR_BOOKING_ACCESSORIES', 'booking accessory',
+        (
+            'BOOKING_ID', 'ACCESSORY_ID', 'QTY', 'PRICE', 'PRICE_OVERRIDE',
+            'ACCESSORY_OPTION_ID', 'CREATED_AT', 'UPDATED_AT'
+        ),
+        timestamp_cols=(6, 7)
+    ),
+    'club_tiers': TableSpec(
+        'STG_STELLAR_CLUB_TIERS', 'club tier',
+        (
+            'ID', 'LOCATION_ID', 'TIER_NAME', 'FRONTEND_DISPLAY',
+            'FRONTEND_NAME', 'FRONTEND_POSITION', 'TERM_LENGTH',
+            'TERM_LENGTH_TYPE', 'TERM_AUTO_RENEW', 'TERM_FEE', 'PERIOD_LENGTH',
+            'PERIOD_LENGTH_TYPE', 'CREDITS_PER_PERIOD', 'HOURS_PER_CREDIT',
+            'PERIOD_FEE', 'FRONTEND_DISPLAY_PRICING', 'NO_SHOW_FEE',
+            'ALLOW_SELF_CANCELLATIONS', 'CANCELLATION_FEE', 'APPLICATION_FEE',
+            'BOAT_DAMAGE_RESPONSIBILITY_DEDUCTION',
+            'MAX_PENDING_WAIT_LIST_ENTRIES', 'FREE_ACCESSORIES',
+            'DESCRIPTION_TEXT', 'TERMS_TEXT', 'STATUS_TIER', 'CREATED_AT',
+            'UPDATED_AT'
+        ),
+        timestamp_cols=(26, 27)
+    ),
+    'coupons': TableSpec(
+        'STG_STELLAR_COUPONS', 'coupon',
+        (
+            'ID', 'LOCATION_ID', 'CODE', 'COUPON_NAME', 'COUPON_TYPE',
+            'COUPON_AMOUNT', 'COUNT_ALLOWED', 'COUNT_ALLOWED_DAILY',
+            'COUNT_USED', 'RENTAL_START', 'RENTAL_END', 'COUPON_START',
+            'COUPON_END', 'MIN_DEPARTURE_TIME', 'MAX_DEPARTURE_TIME',
+            'MIN_RETURN_TIME', 'MAX_RETURN_TIME', 'MIN_HOURS', 'MAX_HOURS',
+            'MIN_HOURS_BEFORE_DEPARTURE', 'MAX_HOURS_BEFORE_DEPARTURE',
+            'MAX_SAME_DAY_PER_CUSTOMER', 'MAX_ACTIVE_PER_CUSTOMER',
+            'DISABLE_CONSECUTIVE_PER_CUSTOMER', 'STATUS_COUPON', 'VALID_DAYS',
+            'HOLIDAYS_ONLY_IF_VALID_DAY', 'VALID_STYLES', 'CREATED_AT',
+            'UPDATED_AT'
+        ),
+        date_cols=(9, 10, 11, 12), timestamp_cols=(28, 29)
+    ),
+    'pos_items': TableSpec(
+        'STG_STELLAR_POS_ITEMS', 'POS item',
+        (
+            'ID', 'LOCATION_ID', 'SKU', 'ITEM_NAME', 'COST', 'PRICE',
+            'TAX_EXEMPT', 'CREATED_AT', 'UPDATED_AT'
+        ),
+        timestamp_cols=(7, 8), merge='POS_ITEMS'
+    ),
+    'pos_sales': TableSpec(
+        'STG_STELLAR_POS_SALES', 'POS sale',
+        (
+            'ID', 'LOCATION_ID', 'ADMIN_ID', 'CUSTOMER_NAME', 'SUB_TOTAL',
+            'TAX_1', 'GRAND_TOTAL', 'AMOUNT_PAID', 'CREATED_AT', 'UPDATED_AT',
+            'DELETED_AT'
+        ),
+        timestamp_cols=(8, 9, 10), merge='POS_SALES'
+    ),
+    'fuel_sales': TableSpec(
+        'STG_STELLAR_FUEL_SALES', 'fuel sale',
+        (
+            'ID', 'LOCATION_ID', 'ADMIN_ID', 'CUSTOMER_NAME', 'FUEL_TYPE',
+            'QTY', 'PRICE', 'SUB_TOTAL', 'TIP', 'GRAND_TOTAL', 'AMOUNT_PAID',
+            'CREATED_AT', 'UPDATED_AT', 'DELETED_AT'
+        ),
+        timestamp_cols=(11, 12, 13)
+    ),
+    'waitlists': TableSpec(
+        'STG_STELLAR_WAITLISTS', 'waitlist',
+        (
+            'ID', 'LOCATION_ID', 'CATEGORY_ID', 'STYLE_ID', 'CUSTOMER_ID',
+            'TIME_ID', 'TIMEFRAME_ID', 'FIRST_NAME', 'LAST_NAME', 'EMAIL',
+            'PHONE', 'DEPARTURE_DATE', 'LENGTH_REQUESTED', 'WAIT_LIST_TIME',
+            'FULFILLED', 'FULFILLED_DATE', 'CREATED_AT', 'UPDATED_AT'
+        ),
+        date_cols=(11, 15), timestamp_cols=(16, 17)
+    ),
+    'closed_dates': TableSpec(
+        'STG_STELLAR_CLOSED_DATES', 'closed date',
+        (
+            'ID', 'LOCATION_ID', 'CLOSED_DATE', 'ALLOW_BACKEND_DEPARTURES',
+            'ALLOW_BACKEND_RETURNS', 'ALLOW_FRONTEND_DEPARTURES',
+            'ALLOW_FRONTEND_RETURNS', 'CREATED_AT', 'UPDATED_AT'
+        ),
+        date_cols=(2,), timestamp_cols=(7, 8)
+    ),
+    'holidays': TableSpec(
+        'STG_STELLAR_HOLIDAYS', 'holiday',
+        (
+            'LOCATION_ID', 'HOLIDAY_DATE'
+        ),
+        date_cols=(1,)
+    ),
+    'blacklists': TableSpec(
+        'STG_STELLAR_BLACKLISTS', 'blacklist',
+        (
+            'ID', 'LOCATION_ID', 'FIRST_NAME', 'LAST_NAME', 'PHONE', 'CELL',
+            'EMAIL', 'DL_NUMBER', 'NOTES', 'CREATED_AT'
+        ),
+        timestamp_cols=(9,)
+    ),
+    'categories': TableSpec(
+        'STG_STELLAR_CATEGORIES', 'category',
+        (
+            'ID', 'LOCATION_ID', 'CATEGORY_NAME', 'FRONTEND_DISPLAY',
+            'FRONTEND_NAME', 'FRONTEND_TYPE', 'FRONTEND_POSITION',
+            'FILTER_UNIT_TYPE_ENABLED', 'FILTER_UNIT_TYPE_NAME',
+            'FILTER_UNIT_TYPE_POSITION', 'MIN_NIGHTS_MULTI_DAY',
+            'CALENDAR_BANNER_TEXT', 'DESCRIPTION_TEXT', 'CREATED_AT',
+            'UPDATED_AT'
+        ),
+        timestamp_cols=(13, 14)
+    ),
+    'amenities': TableSpec(
+        'STG_STELLAR_AMENITIES', 'amenity',
+        (
+            'ID', 'LOCATION_ID', 'AMENITY_NAME', 'FRONTEND_DISPLAY',
+            'FRONTEND_NAME', 'FRONTEND_POSITION', 'FEATURED', 'FILTERABLE',
+            'ICON', 'AMENITY_TYPE', 'OPTIONS_TEXT', 'PREFIX_TEXT',
+            'SUFFIX_TEXT', 'DESCRIPTION_TEXT', 'CREATED_AT', 'UPDATED_AT'
+        ),
+        timestamp_cols=(14, 15)
+    ),
+}
+
+STAGING_TABLES = tuple(spec.table for spec in TABLES.values())
+
+
+def _table_spec(table):
+    """Return the TableSpec for a TABLES key, or the spec itself."""
+    return table if isinstance(table, TableSpec) else TABLES[table]
+
+
+def _error_collecting_block(steps):
+    """
+    Build an anonymous block that runs each step in its own exception scope.
+    
+    A failing step is recorded in the :errors OUT bind (one line per
+    failure) and the remaining steps still run, so the whole batch is a
+    single round trip that never stops at the first error.
+    
+    Args:
+        steps (iterable): (name, plsql_statement) pairs
+    
+    Returns:
+        str: DECLARE ... END; block with an :errors bind
+    """
+    return (
+        "DECLARE\n"
+        "    l_errors VARCHAR2(32767);\n"
+        "BEGIN\n"
+        + "".join(
+            f"    BEGIN {statement}\n"
+            "    EXCEPTION WHEN OTHERS THEN\n"
+            "        l_errors := SUBSTR(l_errors || "
+            f"'{name}: ' || REPLACE(DBMS_UTILITY.FORMAT_ERROR_STACK, CHR(10), ' ') "
+            "|| CHR(10), 1, 32000);\n"
+            "    END;\n"
+            for name, statement in steps
+        )
+        + "    :errors := l_errors;\n"
+        "END;"
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _truncate_staging_sql(tables):
+    """
+    Build a block that truncates the given tables in one round trip.
+    
+    The table list is looped over server-side and failures are collected
+    per table instead of aborting the remaining truncates. REUSE STORAGE
+    keeps the extents allocated for the reload that follows immediately.
+    
+    Args:
+        tables (tuple): Staging table names
+    
+    Returns:
+        str: DECLARE ... END; block with an :errors bind
+    """
+    return (
+        "DECLARE\n"
+        "    l_errors VARCHAR2(32767);\n"
+        "BEGIN\n"
+        "    FOR t IN (SELECT column_value AS table_name\n"
+        "              FROM TABLE(sys.odcivarchar2list(\n"
+        + ",\n".join(f"                  '{table}'" for table in tables)
+        + "))) LOOP\n"
+        "        BEGIN\n"
+        "            EXECUTE IMMEDIATE 'TRUNCATE TABLE ' || t.table_name || ' REUSE STORAGE';\n"
+        "        EXCEPTION WHEN OTHERS THEN\n"
+        "            l_errors := SUBSTR(l_errors || t.table_name || ': ' || SQLERRM || CHR(10), 1, 32000);\n"
+        "        END;\n"
+        "    END LOOP;\n"
+        "    :errors := l_errors;\n"
+        "END;"
+    )
+
+
+# Every staging TRUNCATE in one round trip
+TRUNCATE_STAGING_SQL = _truncate_staging_sql(STAGING_TABLES)
+
+# ORA-06550: the PL/SQL block wrapping a call failed to compile (PLS-00201
+# for a procedure that does not exist, PLS-00905 for an invalid one), so
+# nothing in it ran
+PLSQL_COMPILE_ERROR = 6550
+
+# Stellar merge procedures in the order SP_RUN_ALL_MOLO_STELLAR_MERGES runs
+# them (parents before children)
+STELLAR_MERGE_PROCEDURES = tuple(
+    f"SP_MERGE_STELLAR_{name}" for name in (
+        'CUSTOMERS', 'LOCATIONS', 'SEASONS', 'ACCESSORIES',
+        'ACCESSORY_OPTIONS', 'ACCESSORY_TIERS', 'AMENITIES', 'CATEGORIES',
+        'HOLIDAYS', 'BOOKINGS', 'BOOKING_BOATS', 'BOOKING_PAYMENTS',
+        'BOOKING_ACCESSORIES', 'STYLE_GROUPS', 'STYLES', 'STYLE_BOATS',
+        'CUSTOMER_BOATS', 'SEASON_DATES', 'STYLE_HOURLY_PRICES',
+        'STYLE_TIMES', 'STYLE_PRICES', 'CLUB_TIERS', 'COUPONS', 'POS_ITEMS',
+        'POS_SALES', 'FUEL_SALES', 'WAITLISTS', 'CLOSED_DATES', 'BLACKLISTS',
+    )
+)
+
+# Fallback for a missing master procedure: every Stellar merge in one round
+# trip. The calls are dynamic so a procedure that does not exist
+# fails its own step instead of the whole block failing to compile.
+MERGE_STELLAR_SQL = _error_collecting_block(
+    (procedure, f"EXECUTE IMMEDIATE 'BEGIN {procedure}; END;';")
+    for procedure in STELLAR_MERGE_PROCEDURES
+)
+
+# Load waves for run_all_inserts(). Some tables run their merge procedure
+# right after loading, and those merges follow the parent-before-child order
+# of SP_RUN_ALL_MOLO_STELLAR_MERGES, so a wave starts only after the previous
+# one has finished. Tables not listed load in the first wave.
+INSERT_STAGES = (
+    frozenset({'customers', 'styles', 'pos_items'}),
+    frozenset({'bookings', 'style_boats', 'style_hourly_prices',
+               'style_times', 'pos_sales'}),
+    frozenset({'booking_boats', 'booking_payments', 'style_prices'}),
+)
+
+
+def _resolve_wallet_dir():
+    """
+    Set up Oracle wallet environment for Autonomous Database.
+    
+    Returns:
+        str: Wallet directory (also exported as TNS_ADMIN)
+    """
+    # Check if we're in a container by looking for /.dockerenv or checking if Oracle Instant Client has wallet files
+    container_wallet = '/opt/oracle/instantclient/network/admin'
+    is_container = (os.path.exists('/.dockerenv') or 
+                   (os.path.exists(container_wallet) and 
+                    os.path.exists(os.path.join(container_wallet, 'cwallet.sso'))))
+    
+    if is_container:
+        # Force container path
+        wallet_dir = container_wallet
+        os.environ['TNS_ADMIN'] = wallet_dir
+        logger.info("✅ Container detected - TNS_ADMIN forced to: %s", wallet_dir)
+    elif 'TNS_ADMIN' in os.environ:
+        # Use existing TNS_ADMIN if set
+        wallet_dir = os.environ['TNS_ADMIN']
+        logger.info("✅ TNS_ADMIN already set to: %s", wallet_dir)
+    else:
+        # Get absolute path to wallet directory (for local development)
+        script_dir = os.path.dirname(os.path.abspath(__file__))
+        wallet_dir = os.path.join(script_dir, "wallet_demo")
+        wallet_dir = os.path.abspath(wallet_dir)
+        os.environ['TNS_ADMIN'] = wallet_dir
+        logger.info("✅ TNS_ADMIN set to: %s", wallet_dir)
+    
+    # Verify wallet directory exists
+    if os.path.exists(wallet_dir):
+        # List all files in wallet directory for debugging
+        try:
+            files_in_wallet = os.listdir(wallet_dir)
+            logger.info("📁 Files in wallet directory: %s", files_in_wallet)
+        except Exception as e:
+            logger.warning("⚠️  Could not list wallet directory: %s", e)
+        
+        # Verify wallet files exist
+        required_files = ['cwallet.sso', 'tnsnames.ora', 'sqlnet.ora']
+        missing_files = [f for f in required_files if not os.path.exists(os.path.join(wallet_dir, f))]
+        
+        if missing_files:
+            logger.warning("⚠️  Missing wallet files: %s", missing_files)
+        else:
+            logger.info("✅ All required wallet files found")
+            
+        # Read and log tnsnames.ora content for debugging
+        try:
+            tnsnames_path = os.path.join(wallet_dir, 'tnsnames.ora')
+            with open(tnsnames_path, 'r') as f:
+                tnsnames_content = f.read()
+            logger.info("📄 tnsnames.ora first 200 chars: %s", tnsnames_content[:200])
+        except Exception as e:
+            logger.warning("⚠️  Could not read tnsnames.ora: %s", e)
+    else:
+        logger.error("❌ Wallet directory not found: %s", wallet_dir)
+        raise FileNotFoundError(f"Wallet directory not found: {wallet_dir}")
+    
+    return wallet_dir
+
+
+_WALLET_DIR = None
+_WALLET_LOCK = threading.Lock()
+
+
+def _ensure_wallet():
+    """
+    Resolve and validate the wallet directory once per process.
+    
+    The wallet location and its files do not change within a process. The
+    lock makes connectors created concurrently wait for the first check
+    instead of repeating it; a failed check raises and is retried by the
+    next connector.
+    
+    Returns:
+        str: Wallet directory (also exported as TNS_ADMIN)
+    """
+    global _WALLET_DIR
+    with _WALLET_LOCK:
+        if _WALLET_DIR is None:
+            _WALLET_DIR = _resolve_wallet_dir()
+        return _WALLET_DIR
+
+
+def _set_commit_write(cursor, mode):
+    """Set COMMIT_WRITE for the session the cursor belongs to."""
+    cursor.execute(f"ALTER SESSION SET COMMIT_WRITE = '{mode}'")
+
+
+def _init_session(connection, requested_tag):
+    """
+    Session callback for the pool: let commits return without waiting for
+    the redo flush. Every staging table is reloaded from S3 on the next run,
+    so losing the tail of a load to an instance crash is recoverable. The
+    warehouse is not reloaded, so merge_single_table() and run_all_merges()
+    switch the session to MERGE_COMMIT_WRITE while the merges run.
+    """
+    with connection.cursor() as cursor:
+        _set_commit_write(cursor, STAGING_COMMIT_WRITE)
+
 
 class OracleConnector:
     """
     Oracle Database connector with support for Oracle Autonomous Database.
     
-    This class handles database connections using Oracle Instant Client and
-    provides methods for MERGE operations on Stellar Business tables.
+    This class handles database connections using python-oracledb thin mode
+    and provides methods for MERGE operations on Stellar Business tables.
+    Create one connector per ETL run and reuse it for every table: its pool,
+    prepared cursors and resolved input sizes are only paid for once.
     
     Attributes:
-        connection: Oracle database connection object
+        pool: Oracle session pool used for concurrent staging loads
+        connection: Oracle database connection object (acquired from pool)
         cursor: Database cursor for executing SQL statements
+        _cursors: Dedicated INSERT cursors keyed by SQL text
+        _input_sizes: Resolved per-column input sizes keyed by table name
+        _column_widths: Text column widths from USER_TAB_COLUMNS, keyed by
+                        table name and then column name
+        _secondary_indexes: Indexes _bulk_mode() rebuilds, keyed by table name
+        _pending_merges: Merge procedures deferred to finalize() by loads
+                         made with commit=False, in load order
     """
     
     def __init__(self, user, password, dsn):
@@ -51,144 +1069,76 @@ class OracleConnector:
             password (str): Database password  
             dsn (str): Database data source name (connection string)
         """
-        # Configure Oracle wallet for Autonomous Database
-        self._setup_oracle_wallet()
-        
-        # Initialize Oracle Instant Client
-        self._initialize_oracle_client()
+        # Configure Oracle wallet for Autonomous Database. The driver runs
+        # in thin mode, so no Instant Client is loaded here; the wallet is
+        # read directly from wallet_dir.
+        wallet_dir = self._setup_oracle_wallet()
         
         # Establish database connection
         logger.info("Attempting to connect to Oracle database...")
-        logger.info(f"   User: {user}")
-        logger.info(f"   DSN: {dsn}")
+        logger.info("   User: %s", user)
+        logger.info("   DSN: %s", dsn)
         
-        self.connection = oracledb.connect(
+        self.pool = oracledb.create_pool(
             user=user,
             password=password,
-            dsn=dsn
+            dsn=dsn,
+            min=POOL_MIN,
+            max=POOL_MAX,
+            increment=POOL_INCREMENT,
+            stmtcachesize=STATEMENT_CACHE_SIZE,
+            config_dir=wallet_dir,
+            wallet_location=wallet_dir,
+            wallet_password=WALLET_PASSWORD,
+            sdu=SESSION_DATA_UNIT,
+            tcp_connect_timeout=TCP_CONNECT_TIMEOUT,
+            session_callback=_init_session
         )
+        self.connection = self.pool.acquire()
         logger.info("✅ Oracle database connection successful!")
-        self.cursor = self.connection.cursor()
+        self.cursor = self._new_cursor(self.connection)
+        self._cursors = {}
+        self._input_sizes = {}
+        self._column_widths = {}
+        self._secondary_indexes = {}
+        self._pending_merges = []
     
     def _setup_oracle_wallet(self):
         """Set up Oracle wallet environment for Autonomous Database."""
-        # Check if we're in a container by looking for /.dockerenv or checking if Oracle Instant Client has wallet files
-        container_wallet = '/opt/oracle/instantclient/network/admin'
-        is_container = (os.path.exists('/.dockerenv') or 
-                       (os.path.exists(container_wallet) and 
-                        os.path.exists(os.path.join(container_wallet, 'cwallet.sso'))))
-        
-        if is_container:
-            # Force container path
-            wallet_dir = container_wallet
-            os.environ['TNS_ADMIN'] = wallet_dir
-            logger.info(f"✅ Container detected - TNS_ADMIN forced to: {wallet_dir}")
-        elif 'TNS_ADMIN' in os.environ:
-            # Use existing TNS_ADMIN if set
-            wallet_dir = os.environ['TNS_ADMIN']
-            logger.info(f"✅ TNS_ADMIN already set to: {wallet_dir}")
-        else:
-            # Get absolute path to wallet directory (for local development)
-            script_dir = os.path.dirname(os.path.abspath(__file__))
-            wallet_dir = os.path.join(script_dir, "wallet_demo")
-            wallet_dir = os.path.abspath(wallet_dir)
-            os.environ['TNS_ADMIN'] = wallet_dir
-            logger.info(f"✅ TNS_ADMIN set to: {wallet_dir}")
-        
-        # Verify wallet directory exists
-        if os.path.exists(wallet_dir):
-            # List all files in wallet directory for debugging
-            try:
-                files_in_wallet = os.listdir(wallet_dir)
-                logger.info(f"📁 Files in wallet directory: {files_in_wallet}")
-            except Exception as e:
-                logger.warning(f"⚠️  Could not list wallet directory: {e}")
-            
-            # Verify wallet files exist
-            required_files = ['cwallet.sso', 'tnsnames.ora', 'sqlnet.ora']
-            missing_files = [f for f in required_files if not os.path.exists(os.path.join(wallet_dir, f))]
-            
-            if missing_files:
-                logger.warning(f"⚠️  Missing wallet files: {missing_files}")
-            else:
-                logger.info("✅ All required wallet files found")
-                
-            # Read and log tnsnames.ora content for debugging
-            try:
-                tnsnames_path = os.path.join(wallet_dir, 'tnsnames.ora')
-                with open(tnsnames_path, 'r') as f:
-                    tnsnames_content = f.read()
-                logger.info(f"📄 tnsnames.ora first 200 chars: {tnsnames_content[:200]}")
-            except Exception as e:
-                logger.warning(f"⚠️  Could not read tnsnames.ora: {e}")
-        else:
-            logger.error(f"❌ Wallet directory not found: {wallet_dir}")
-            raise FileNotFoundError(f"Wallet directory not found: {wallet_dir}")
+        return _ensure_wallet()
     
-    def _initialize_oracle_client(self):
-        """Initialize Oracle Instant Client with common installation paths."""
-        try:
-            # Try different common paths for Oracle Instant Client
-            client_paths = [
-                "/opt/oracle/instantclient",           # Linux/Docker
-                r"C:\oracle\instantclient_21_3",       # Windows
-                r"C:\oracle\instantclient"             # Windows alternative
-            ]
-            
-            for path in client_paths:
-                if os.path.exists(path):
-                    oracledb.init_oracle_client(lib_dir=path)
-                    logger.info(f"Oracle Instant Client initialized from: {path}")
-                    break
-            else:
-                logger.warning(
-                    "Oracle Instant Client path not found, trying without lib_dir"
-                )
-                oracledb.init_oracle_client()
-                
-        except Exception as e:
-            logger.warning(f"Oracle client already initialized or error: {e}")
-    
-    def truncate_staging_tables(self):
+    def truncate_staging_tables(self, table_keys=None):
         """
-        Truncate all Stellar staging tables before data load.
+        Truncate Stellar staging tables before data load.
         
-        This method clears all staging tables in preparation for fresh data.
+        This method clears staging tables in preparation for fresh data.
         Following the rosnet-api-integration pattern: truncate, insert to 
         staging, then call stored procedures to merge into data warehouse.
-        """
-        staging_tables = [
-            'STG_STELLAR_LOCATIONS', 'STG_STELLAR_CUSTOMERS', 
-            'STG_STELLAR_BOOKINGS', 'STG_STELLAR_BOOKING_BOATS',
-            'STG_STELLAR_BOOKING_PAYMENTS', 'STG_STELLAR_STYLE_GROUPS',
-            'STG_STELLAR_STYLES', 'STG_STELLAR_STYLE_BOATS',
-            'STG_STELLAR_CUSTOMER_BOATS', 'STG_STELLAR_SEASONS',
-            'STG_STELLAR_SEASON_DATES', 
-            'STG_STELLAR_STYLE_HOURLY_PRICES',
-            'STG_STELLAR_STYLE_TIMES', 'STG_STELLAR_STYLE_PRICES',
-            'STG_STELLAR_ACCESSORIES', 'STG_STELLAR_ACCESSORY_OPTIONS',
-            'STG_STELLAR_ACCESSORY_TIERS', 
-            'STG_STELLAR_BOOKING_ACCESSORIES',
-            'STG_STELLAR_CLUB_TIERS', 'STG_STELLAR_COUPONS',
-            'STG_STELLAR_POS_ITEMS', 'STG_STELLAR_POS_SALES',
-            'STG_STELLAR_FUEL_SALES', 'STG_STELLAR_WAITLISTS',
-            'STG_STELLAR_CLOSED_DATES', 'STG_STELLAR_HOLIDAYS',
-            'STG_STELLAR_BLACKLISTS', 'STG_STELLAR_CATEGORIES',
-            'STG_STELLAR_AMENITIES'
-        ]
         
+        Args:
+            table_keys: Optional TABLES keys to truncate (e.g. only the
+                        tables a load has data for); defaults to all
+        """
+        if table_keys is None:
+            tables, sql = STAGING_TABLES, TRUNCATE_STAGING_SQL
+        else:
+            tables = tuple(TABLES[key].table for key in table_keys)
+            if not tables:
+                return
+            sql = _truncate_staging_sql(tables)
         logger.info("Truncating Stellar staging tables...")
-        for table in staging_tables:
-            try:
-                self.cursor.execute(f"TRUNCATE TABLE {table}")
-                logger.debug(f"✅ Truncated {table}")
-            except Exception as e:
-                logger.warning(f"Could not truncate {table}: {e}")
+        errors_var = self.cursor.var(str, 32767)
+        self.cursor.execute(sql, errors=errors_var)
+        
+        errors = errors_var.getvalue()
+        if errors:
+            for error in errors.splitlines():
+                logger.warning("Could not truncate %s", error)
         
         self.connection.commit()
         logger.info(
-            f"✅ Successfully truncated {len(staging_tables)} "
-            "Stellar staging tables"
+            "✅ Successfully truncated %d Stellar staging tables",
+            len(tables)
         )
     
     def run_all_merges(self):
@@ -196,7 +1146,11 @@ class OracleConnector:
         Execute the master stored procedure that merges all staging tables.
         
         This calls SP_RUN_ALL_MOLO_STELLAR_MERGES which internally calls 
-        all individual merge procedures. The stored procedures handle:
+        all individual merge procedures. If it is missing (or invalid), the
+        Stellar merge procedures are run individually in a single round
+        trip instead. Any other failure is raised: the master procedure may
+        already have committed some merges, which must not run twice. The
+        stored procedures handle:
         - MERGE logic (UPDATE existing, INSERT new)
         - INSERTED_DATE and UPDATED_DATE management
         - Transaction commits
@@ -205,58 +1159,105 @@ class OracleConnector:
             "Executing stored procedure to merge all Stellar staging "
             "data to data warehouse..."
         )
+        _set_commit_write(self.cursor, MERGE_COMMIT_WRITE)
         try:
-            self.cursor.execute("BEGIN SP_RUN_ALL_MOLO_STELLAR_MERGES; END;")
+            self.cursor.callproc("SP_RUN_ALL_MOLO_STELLAR_MERGES")
             self.connection.commit()
-            logger.info("✅ Successfully completed all Stellar merge operations")
-        except Exception as e:
+        except oracledb.DatabaseError as e:
+            self.connection.rollback()
+            error, = e.args
+            if getattr(error, 'code', None) != PLSQL_COMPILE_ERROR:
+                logger.error("❌ SP_RUN_ALL_MOLO_STELLAR_MERGES failed: %s", e)
+                raise
             logger.warning(
-                f"⚠️  Stored procedure SP_RUN_ALL_MOLO_STELLAR_MERGES not found or failed: {e}"
+                "⚠️  Stored procedure SP_RUN_ALL_MOLO_STELLAR_MERGES not found or invalid: %s",
+                e
             )
+            self._run_stellar_merges()
+            return
+        finally:
+            _set_commit_write(self.cursor, STAGING_COMMIT_WRITE)
+        logger.info("✅ Successfully completed all Stellar merge operations")
+    
+    def _run_stellar_merges(self):
+        """
+        Run every Stellar merge procedure in one round trip.
+        
+        Fallback for run_all_merges(): each procedure runs in its own
+        exception scope, so a missing or failing procedure is logged and
+        the remaining merges still run.
+        """
+        logger.info(
+            "Running %d Stellar merge procedures individually...",
+            len(STELLAR_MERGE_PROCEDURES)
+        )
+        try:
+            errors_var = self.cursor.var(str, 32767)
+            self.cursor.execute(MERGE_STELLAR_SQL, errors=errors_var)
+            self.connection.commit()
+        except Exception as e:
+            logger.warning("⚠️  Stellar merge block failed: %s", e)
+            # Don't raise - let the process continue
+            self.connection.rollback()
+            return
+        
+        errors = errors_var.getvalue()
+        failed = errors.splitlines() if errors else []
+        for error in failed:
+            logger.warning("⚠️  Merge failed: %s", error)
+        if failed:
             logger.warning(
                 "   Data has been loaded into STG_STELLAR_* staging tables successfully."
             )
             logger.warning(
                 "   Create the stored procedures to merge STG_* → DW_* tables."
             )
-            # Don't raise - let the process continue
-            self.connection.rollback()
+        logger.info(
+            "✅ Stellar merges complete: %d succeeded, %d failed",
+            len(STELLAR_MERGE_PROCEDURES) - len(failed), len(failed)
+        )
     
-    def merge_single_table(self, table_name):
+    def merge_single_table(self, table_name, conn=None):
         """
         Execute a single merge stored procedure immediately after data load.
         
         Args:
             table_name (str): Name of the table (e.g., 'CUSTOMERS', 'BOOKINGS', 'STYLES')
                             Will be converted to procedure name SP_MERGE_STELLAR_{table_name}
+            conn: Optional pooled connection to run on (defaults to the main connection)
         
         Returns:
             dict: Merge statistics {'inserted': int, 'updated': int, 'output': str}
         """
         procedure_name = f'SP_MERGE_STELLAR_{table_name.upper()}'
+        connection = self.connection if conn is None else conn
+        cursor = self.cursor if conn is None else conn.cursor()
         
         try:
+            # The merge commits warehouse data, so it waits for the redo flush
+            _set_commit_write(cursor, MERGE_COMMIT_WRITE)
+            
             # Enable DBMS_OUTPUT to capture procedure logging
-            self.cursor.callproc("dbms_output.enable")
+            cursor.callproc("dbms_output.enable")
             
             # Call the procedure (no OUT parameters, uses DBMS_OUTPUT instead)
-            self.cursor.callproc(procedure_name)
+            cursor.callproc(procedure_name)
             
             # Fetch DBMS_OUTPUT lines
             output_lines = []
-            line_var = self.cursor.var(str)
-            status_var = self.cursor.var(int)
+            line_var = cursor.var(str)
+            status_var = cursor.var(int)
             
             while True:
-                self.cursor.callproc("dbms_output.get_line", (line_var, status_var))
+                cursor.callproc("dbms_output.get_line", (line_var, status_var))
                 if status_var.getvalue() != 0:
                     break
                 output_line = line_var.getvalue()
                 if output_line:
                     output_lines.append(output_line)
-                    logger.info(f"  📋 {output_line}")
+                    logger.info("  📋 %s", output_line)
             
-            self.connection.commit()
+            connection.commit()
             
             # Parse the output to extract inserted/updated counts if present
             result = {
@@ -279,938 +1280,997 @@ class OracleConnector:
                         pass
             
             logger.info(
-                f"✅ {procedure_name}: "
-                f"{result['inserted']} inserted, {result['updated']} updated"
+                "✅ %s: %d inserted, %d updated",
+                procedure_name, result['inserted'], result['updated']
             )
             
             return result
                 
         except Exception as e:
-            logger.error(f"❌ Error executing {procedure_name}: {e}")
-            self.connection.rollback()
+            logger.error("❌ Error executing %s: %s", procedure_name, e)
+            connection.rollback()
             raise
+        finally:
+            _set_commit_write(cursor, STAGING_COMMIT_WRITE)
+            if conn is not None:
+                cursor.close()
+    
+    def finalize(self):
+        """
+        Commit the staging load, then run the merges it deferred.
+        
+        insert_* methods called with commit=False leave their rows in the
+        open transaction; this issues the one commit for all of them.
+        Closing the connection without it rolls the load back. The merge
+        procedures of those tables run afterwards, in load order. Each
+        procedure commits on its own, so the merges are not part of the
+        staging transaction; a failed merge is logged and the rest still run.
+        
+        Returns:
+            dict: Error message by merge name (e.g. 'CUSTOMERS') for each
+                  deferred merge that failed
+        """
+        self.connection.commit()
+        logger.info("✅ Committed Stellar staging load")
+        
+        pending, self._pending_merges = self._pending_merges, []
+        failed = {}
+        for merge in pending:
+            logger.info("Executing merge for %s...", merge)
+            try:
+                self.merge_single_table(merge)
+            except Exception as e:
+                # merge_single_table has logged and rolled back
+                failed[merge] = str(e)
+        return failed
     
     def close(self):
-        """Close database cursor and connection."""
+        """Close database cursors, connection and session pool."""
+        for cursor, _ in self._cursors.values():
+            cursor.close()
+        self._cursors.clear()
         if self.cursor:
             self.cursor.close()
         if self.connection:
             self.connection.close()
+        if self.pool:
+            self.pool.close()
         logger.info("Database connection closed")
 
+    def run_all_inserts(self, payloads, max_workers=INSERT_WORKERS):
+        """
+        Load independent staging tables concurrently on pooled connections.
+        
+        Each table is loaded by insert() on its own connection acquired from
+        the pool; tables with no rows are recorded as 0 without acquiring a
+        connection or starting a task. Tables are submitted in INSERT_STAGES
+        waves, waiting for each wave to finish before starting the next, so
+        the merges that run right after a load see their parent tables
+        merged first. Call run_all_merges() afterwards; merges are not
+        parallelized.
+        
+        Args:
+            payloads (dict): Table key (e.g. 'locations', 'customers') mapped to
+                             its list of row tuples
+            max_workers (int): Number of concurrent insert threads
+        
+        Returns:
+            dict: {'successful_tables': {key: row_count},
+                   'failed_tables': {key: error_message}}
+        """
+        successful_tables = {}
+        failed_tables = {}
+        
+        later_stages = frozenset().union(*INSERT_STAGES[1:])
+        waves = [
+            {key: rows for key, rows in payloads.items()
+             if key not in later_stages}
+        ] + [
+            {key: rows for key, rows in payloads.items() if key in stage}
+            for stage in INSERT_STAGES[1:]
+        ]
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for wave in waves:
+                futures = {}
+                for key, rows in wave.items():
+                    rows = _as_row_tuples(rows) if rows is not None else []
+                    if not rows:
+                        logger.info("No %s data to process", TABLES[key].label)
+                        successful_tables[key] = 0
+                        continue
+                    future = executor.submit(
+                        self._insert_on_pooled_connection, key, rows
+                    )
+                    futures[future] = key
+                for future in as_completed(futures):
+                    key = futures[future]
+                    try:
+                        successful_tables[key] = future.result()
+                    except Exception as e:
+                        logger.error("❌ Parallel insert failed for %s: %s", key, e)
+                        failed_tables[key] = str(e)
+        
+        logger.info(
+            "✅ Parallel load complete: %d succeeded, %d failed",
+            len(successful_tables), len(failed_tables)
+        )
+        return {
+            'successful_tables': successful_tables,
+            'failed_tables': failed_tables
+        }
 
-    # ========================================================================
-    # MERGE FUNCTIONS - Stellar Business Tables
-    # ========================================================================
+    def _insert_on_pooled_connection(self, table_key, data_rows):
+        """Run insert_<table_key> on a connection acquired from the pool."""
+        with self.pool.acquire() as conn:
+            return self.insert(table_key, data_rows, conn=conn, commit=True)
 
-    def insert_locations(self, data_rows):
+    def _mark_table_load(self, connection, commit):
         """
-        Insert location data into STG_STELLAR_LOCATIONS table.
-        All 22 columns.
+        Set a savepoint before a deferred-commit table load.
         
-        Args:
-            data_rows: List of tuples containing location data
+        With commit=False several tables share one transaction, so a failed
+        table rolls back to this savepoint instead of discarding the tables
+        loaded before it.
         """
-        if not data_rows:
-            logger.info("No location data to process")
+        if not commit:
+            with connection.cursor() as cursor:
+                cursor.execute("SAVEPOINT STG_TABLE_LOAD")
+
+    def _undo_table_load(self, connection, commit):
+        """
+        Roll back a failed table load (see _mark_table_load).
+        
+        Deferred-commit loads only use conventional inserts and leave their
+        merges to finalize(), so the savepoint is still in place here.
+        """
+        if commit:
+            connection.rollback()
             return
+        with connection.cursor() as cursor:
+            cursor.execute("ROLLBACK TO SAVEPOINT STG_TABLE_LOAD")
+
+    def _new_cursor(self, connection):
+        """Create a cursor sized for CURSOR_ARRAYSIZE rows per round trip."""
+        cursor = connection.cursor()
+        cursor.arraysize = CURSOR_ARRAYSIZE
+        cursor.prefetchrows = CURSOR_ARRAYSIZE + 1
+        return cursor
+
+    def _get_cursor(self, sql, num_cols, date_cols=(), timestamp_cols=(),
+                    conn=None):
+        """
+        Return the dedicated cursor for an INSERT statement.
+        
+        Each statement keeps its own cursor so python-oracledb reuses the
+        parsed statement handle and bind buffers across calls instead of
+        re-describing the binds every time. The statement is prepared and
+        the input sizes are computed once when the cursor is created, so
+        callers can execute it with statement=None. Cursors on a pooled
+        connection are not cached because the connection goes back to the
+        pool.
+        
+        Args:
+            sql (str): INSERT statement the cursor is dedicated to
+            num_cols (int): Number of bind positions in the statement
+            date_cols (tuple): Zero-based positions of DATE columns
+            timestamp_cols (tuple): Zero-based positions of TIMESTAMP columns
+            conn: Optional pooled connection; the caller closes the cursor
+        
+        Returns:
+            tuple: (cursor, input_sizes) where input_sizes is None when no
+                   bind position needs pinning
+        """
+        cached = self._cursors.get(sql) if conn is None else None
+        if cached is None:
+            input_sizes = None
+            if date_cols or timestamp_cols:
+                input_sizes = _datetime_input_sizes(
+                    num_cols, date_cols, timestamp_cols
+                )
+            cursor = self._new_cursor(
+                self.connection if conn is None else conn
+            )
+            cursor.prepare(sql)
+            if conn is not None:
+                return cursor, input_sizes
+            cached = (cursor, input_sizes)
+            self._cursors[sql] = cached
+        return cached
+
+    def _executemany_chunked(self, sql, rows, batch_size=BATCH_SIZE,
+                             date_cols=(), timestamp_cols=(), conn=None,
+                             input_sizes=None):
+        """
+        Execute an INSERT statement for all rows in fixed-size chunks.
+        
+        A direct-path (APPEND_VALUES) statement is sent as one chunk, since
+        a second direct-path insert into the same table in one transaction
+        fails with ORA-12838. Date and timestamp columns are parsed into
+        datetime objects and bound natively, so Oracle does not run
+        TO_DATE/TO_TIMESTAMP per row. The caller commits once after all
+        chunks so each table load is still a single transaction.
         
-        insert_sql = """
-        INSERT INTO STG_STELLAR_LOCATIONS (ID, CODE, LOCATION_NAME, LOCATION_TYPE, MINIMUM_1, MINIMUM_2,
-                    DELIVERY, FRONTEND, PRICING, IS_INTERNAL, IS_CANCELED, 
-                    CANCEL_REASON, CANCEL_DATE, IS_TRANSFERRED, TRANSFER_DESTINATION,
-                    MODULE_TYPE, OPERATING_LOCATION, ZOHO_ID, ZCRM_ID, IS_ACTIVE,
-                    CREATED_AT, UPDATED_AT)
-            VALUES (:1, :2, :3, :4, :5, :6, :7, :8, :9, :10, :11, :12, TO_DATE(:13, 'YYYY-MM-DD'), :14, :15, :16, :17, :18, :19, :20, TO_TIMESTAMP(:21, 'YYYY-MM-DD HH24:MI:SS'), TO_TIMESTAMP(:22, 'YYYY-MM-DD HH24:MI:SS'))"""
+        Batch errors are enabled for conventional statements: a row that
+        violates a constraint or fails conversion is rejected and logged
+        with its position, and the rest of the chunk is still inserted.
+        Oracle does not support batch-error mode for direct-path array
+        inserts (ORA-38910), so there a bad row fails the whole statement.
+        
+        Args:
+            sql (str): INSERT statement using positional binds
+            rows (list): List of tuples to bind
+            batch_size (int): Maximum number of rows per executemany() call
+            date_cols (tuple): Zero-based positions of DATE columns
+            timestamp_cols (tuple): Zero-based positions of TIMESTAMP columns
+            conn: Optional pooled connection to insert on
+            input_sizes (list): Optional setinputsizes() arguments for every
+                                bind position (see _column_input_sizes);
+                                defaults to pinning only the datetime columns
+        
+        Returns:
+            int: Number of rows inserted, as reported by array DML row counts
+                 (or the statement row count for a direct-path insert)
+        """
+        inserted = 0
+        rejected = 0
+        direct_path = 'APPEND_VALUES' in sql
+        if direct_path:
+            batch_size = len(rows)
+        cursor, datetime_sizes = self._get_cursor(
+            sql, len(rows[0]), date_cols, timestamp_cols, conn
+        )
+        if input_sizes is None:
+            input_sizes = datetime_sizes
         
         try:
-            self.cursor.executemany(insert_sql, data_rows)
-            self.connection.commit()
-            logger.info(f"✅ Inserted {len(data_rows)} location records")
-        except Exception as e:
-            self.connection.rollback()
-            logger.exception(f"❌ Error merging location data: {e}")
-            raise
+            for start in range(0, len(rows), batch_size):
+                chunk = rows[start:start + batch_size]
+                if date_cols or timestamp_cols:
+                    chunk = _convert_datetime_columns(
+                        chunk, date_cols, timestamp_cols
+                    )
+                if input_sizes:
+                    chunk, chunk_sizes = _normalize_columns(chunk, input_sizes)
+                    cursor.setinputsizes(*chunk_sizes)
+                # The cursor already holds the prepared statement
+                cursor.executemany(
+                    None,
+                    chunk,
+                    batcherrors=not direct_path,
+                    arraydmlrowcounts=not direct_path
+                )
+                if direct_path:
+                    inserted += cursor.rowcount
+                    continue
+                inserted += sum(cursor.getarraydmlrowcounts())
+                for error in cursor.getbatcherrors():
+                    if rejected < BATCH_ERROR_LOG_LIMIT:
+                        logger.warning(
+                            "⚠️  Row %d rejected: %s",
+                            start + error.offset, error.message
+                        )
+                    rejected += 1
+        finally:
+            if conn is not None:
+                cursor.close()
+        
+        if rejected:
+            logger.warning(
+                "⚠️  %d of %d rows rejected by batch errors", rejected, len(rows)
+            )
+        logger.debug("Array DML row counts: %d of %d rows inserted", inserted, len(rows))
+        return inserted
 
-    def insert_customers(self, data_rows):
+    def _insert_all_chunked(self, spec, rows, batch_size=INSERT_ALL_BATCH,
+                            conn=None):
         """
-        Insert customer data into STG_STELLAR_CUSTOMERS table.
-        All 52 columns, using USER_ID as primary key (not ID!).
+        Insert rows with multi-row INSERT ALL statements.
+        
+        For narrow tables with few rows the fixed cost of an executemany()
+        call dominates; one INSERT ALL per batch sends the rows as a single
+        statement execution instead. Batches are capped at
+        spec.insert_all_rows so the INTO clauses stay within Oracle's
+        999-column limit for one statement. An INSERT ALL fails as a whole
+        when one of its rows is bad, so a failed batch is re-sent through
+        the conventional executemany() path, where batch errors reject only
+        the offending rows.
         
         Args:
-            data_rows: List of tuples containing customer data
+            spec (TableSpec): Table being loaded
+            rows (list): List of tuples to bind
+            batch_size (int): Rows per INSERT ALL statement
+            conn: Optional pooled connection to insert on
+        
+        Returns:
+            int: Number of rows inserted
+        """
+        inserted = 0
+        batch_size = min(batch_size, spec.insert_all_rows)
+        connection = self.connection if conn is None else conn
+        # Every row count is a different statement text, so these are not
+        # given a cached cursor each (see _get_cursor); one cursor serves
+        # the call and the statement cache keeps the parsed statements
+        with connection.cursor() as cursor:
+            for start in range(0, len(rows), batch_size):
+                chunk = _convert_datetime_columns(
+                    rows[start:start + batch_size], spec.date_cols,
+                    spec.timestamp_cols
+                )
+                sql = _insert_all_sql(spec.table, spec.columns, len(chunk))
+                try:
+                    cursor.execute(
+                        sql, [value for row in chunk for value in row]
+                    )
+                    inserted += cursor.rowcount
+                except oracledb.DatabaseError as e:
+                    # The failed statement was rolled back on its own; retry
+                    # the batch row by row so only the bad rows are rejected
+                    logger.warning(
+                        "⚠️  INSERT ALL into %s failed (%s); retrying %d rows with batch errors",
+                        spec.table, e, len(chunk)
+                    )
+                    inserted += self._executemany_chunked(
+                        spec.conventional_sql, chunk, conn=conn,
+                        date_cols=spec.date_cols,
+                        timestamp_cols=spec.timestamp_cols
+                    )
+        
+        logger.debug(
+            "INSERT ALL row counts: %d of %d rows inserted into %s",
+            inserted, len(rows), spec.table
+        )
+        return inserted
+
+    def _direct_path_sliced(self, spec, rows, connection, conn=None):
         """
-        if not data_rows:
-            logger.info("No customer data to process")
-            return
+        Direct-path load more than DIRECT_PATH_MAX_ROWS rows in committed slices.
         
-        insert_sql = """
-        INSERT INTO STG_STELLAR_CUSTOMERS (USER_ID, CLUB_PRINCIPAL_USER_ID, COUPON_ID, CLUB_TIER_ID,
-                    FIRST_NAME, LAST_NAME, MIDDLE_NAME, GENDER,
-                    PHONE, CELL, EMERGENCY_NAME, EMERGENCY_PHONE, SECONDARY_EMAIL,
-                    BILLING_STREET1, BILLING_STREET2, BILLING_CITY, BILLING_STATE, BILLING_COUNTRY, BILLING_ZIP,
-                    MAILING_STREET1, MAILING_STREET2, MAILING_CITY, MAILING_STATE, MAILING_COUNTRY, MAILING_ZIP,
-                    NUM_KIDS, REFERRER, SERVICES, DATE_OF_BIRTH,
-                    DL_STATE, DL_COUNTRY, DL_NUMBER,
-                    NOTES, INTERNAL_NOTES,
-                    CLUB_STATUS, CLUB_START_DATE, CLUB_USE_RECURRING_BILLING, CLUB_RECURRING_BILLING_START_DATE,
-                    BALANCE, BOAT_DAMAGE_RESPONSIBILITY_COVERAGE, PENALTY_POINTS, OPEN_BALANCE_THRESHOLD, CLUB_END_DATE,
-                    CC_SAVED_NAME, CC_SAVED_LAST4, CC_SAVED_EXPIRY, CC_SAVED_PROFILE_ID,
-                    CC_SAVED_METHOD_ID, CC_SAVED_ADDRESS_ID,
-                    EXTERNAL_ID, CREATED_AT, UPDATED_AT)
-            VALUES (:1, :2, :3, :4, :5, :6, :7, :8, :9, :10, :11, :12, :13, :14, :15, :16, :17, :18, :19, :20, :21, :22, :23, :24, :25, :26, :27, :28, :29, :30, :31, :32, :33, :34, :35, :36, :37, :38, :39, :40, :41, :42, :43, :44, :45, :46, :47, :48, :49, :50, :51, :52)"""
+        Each slice of DIRECT_PATH_MAX_ROWS rows goes out as one APPEND_VALUES
+        array and is committed before the next, so no transaction holds two
+        direct-path inserts into the table (ORA-12838). Only used for loads
+        that commit per table; if a slice fails, the slices before it stay
+        in the staging table until the next truncate.
         
-        try:
-            self.cursor.executemany(insert_sql, data_rows)
-            self.connection.commit()
-            logger.info(f"✅ Inserted {len(data_rows)} customer records")
-            
-            # Execute merge procedure immediately after insert
-            logger.info("Executing merge for CUSTOMERS...")
-            self.merge_single_table('CUSTOMERS')
-            
-        except Exception as e:
-            self.connection.rollback()
-            logger.exception(f"❌ Error merging customer data: {e}")
-            raise
+        Args:
+            spec (TableSpec): Table being loaded
+            rows (list): List of tuples to bind
+            connection: Connection the slices are committed on
+            conn: Optional pooled connection, passed through to the insert
+        
+        Returns:
+            int: Number of rows inserted
+        """
+        input_sizes = self._column_input_sizes(spec, rows, conn)
+        inserted = 0
+        for start in range(0, len(rows), DIRECT_PATH_MAX_ROWS):
+            inserted += self._executemany_chunked(
+                spec.sql, rows[start:start + DIRECT_PATH_MAX_ROWS], conn=conn,
+                date_cols=spec.date_cols,
+                timestamp_cols=spec.timestamp_cols,
+                input_sizes=input_sizes
+            )
+            connection.commit()
+        return inserted
 
-    def insert_bookings(self, data_rows):
+    def insert(self, table_key, data_rows, conn=None, commit=True):
         """
-        Insert booking data into STG_STELLAR_BOOKINGS table.
+        Load rows into the staging table described by TABLES[table_key].
+        
+        Tables with a merge procedure are committed and merged right after
+        the load; with commit=False the merge is deferred to finalize().
+        Loads of INSERT_ALL_MAX_ROWS rows or fewer are sent as one INSERT
+        ALL statement when the table is narrow enough to carry them in one
+        (see TableSpec.insert_all_rows). A TableSpec can be passed instead
+        of a key to load a table that is not in TABLES through the same
+        path.
+        
+        Only committing loads use direct path (APPEND_VALUES, sliced above
+        DIRECT_PATH_MAX_ROWS) and _bulk_mode(). With commit=False the rows
+        are inserted conventionally, so a failed table can be rolled back to
+        its savepoint without undoing the tables loaded before it.
         
         Args:
-            data_rows: List of tuples containing booking data (82 columns)
+            table_key (str or TableSpec): Key into TABLES (e.g. 'locations')
+                                          or the spec itself
+            data_rows: List of tuples (or a pandas DataFrame) in column order
+            conn: Optional pooled connection to load on (defaults to the main connection)
+            commit: Commit after the insert; when False the rows stay in the
+                    open transaction until finalize()
+        
+        Returns:
+            int: Number of rows inserted
         """
+        spec = _table_spec(table_key)
+        data_rows = _as_row_tuples(data_rows)
         if not data_rows:
-            logger.info("No booking data to process")
-            return
-        
-        insert_sql = """
-        INSERT INTO STG_STELLAR_BOOKINGS (ID, LOCATION_ID, CUSTOMER_ID, CREATOR_ID, ADMIN_ID, BILLING_FIRST_NAME, BILLING_LAST_NAME, BILLING_STREET1, BILLING_STREET2, BILLING_CITY, BILLING_STATE, BILLING_COUNTRY, BILLING_ZIP, CC_SAVED_NAME, CC_SAVED_LAST4, CC_SAVED_PROFILE_ID, CC_SAVED_METHOD_ID, CC_SAVED_ADDRESS_ID, CC_PREAUTH_ID, CC_PREAUTH_AMOUNT, CC_CONNECT_TYPE, CC_CONNECT_ID, ACCESSORIES_CUSTOM_PRICE, ACCESSORIES_TOTAL, INSURANCE_AMOUNT, PETS, PARKING, PARKING_OVERRIDE, BOATS_TOTAL, POS_TOTAL, USE_CLUB_CREDITS, NO_SHOW_FEE, CANCELLATION_FEE, CLUB_FEES, CLUB_FEES_OVERRIDE, SUB_TOTAL, CONVENIENCE_FEE, CONVENIENCE_FEE_WAIVED, INTERNAL_APPLICATION_FEE, TAX_1, TAX_1_EXEMPT, TAX_1_RATE_OVERRIDE, TAX_2, TAX_2_EXEMPT, CHECK_IN_TAX_1, CHECK_IN_TAX_2, CHECK_IN_TOTAL, DEPOSIT_TOTAL, DEPOSIT_OVERRIDE, DEPOSIT_WAIVED, GRATUITY, GRAND_TOTAL, ADJUSTMENT_TOTAL, AMOUNT_PAID, NOTES, NOTES_CONTRACT, NOTES_FROM_CUSTOMER, NOTES_FROM_CUSTOMER_CONTRACT, NOTES_FOR_CUSTOMER, NOTES_FOR_CUSTOMER_CONTRACT, FRONTEND, IS_ON_HOLD, IS_LOCKED, IS_FINALIZED, IS_CANCELED, OVERRIDE_TURNAROUND_TIME, CANCELLATION_TYPE, BYPASS_CLUB_RESTRICTIONS, RENTERS_INSURANCE_INTEREST, COUPON_ID, COUPON_TYPE, COUPON_AMOUNT, DISCOUNT_TOTAL, AGENT_ID, AGENT_NAME, REFERRER_ID, SAFETY_REMINDER, DELETED_ADMIN_ID, CREATED_AT, UPDATED_AT, FINALIZED_AT, DELETED_AT)
-            VALUES (:1, :2, :3, :4, :5, :6, :7, :8, :9, :10, :11, :12, :13, :14, :15, :16, :17, :18, :19, :20, :21, :22, :23, :24, :25, :26, :27, :28, :29, :30, :31, :32, :33, :34, :35, :36, :37, :38, :39, :40, :41, :42, :43, :44, :45, :46, :47, :48, :49, :50, :51, :52, :53, :54, :55, :56, :57, :58, :59, :60, :61, :62, :63, :64, :65, :66, :67, :68, :69, :70, :71, :72, :73, :74, :75, :76, :77, :78, TO_TIMESTAMP(:79, 'YYYY-MM-DD HH24:MI:SS'), TO_TIMESTAMP(:80, 'YYYY-MM-DD HH24:MI:SS'), TO_TIMESTAMP(:81, 'YYYY-MM-DD HH24:MI:SS'), TO_TIMESTAMP(:82, 'YYYY-MM-DD HH24:MI:SS'))"""
+            logger.info("No %s data to process", spec.label)
+            return 0
         
+        connection = self.connection if conn is None else conn
+        self._mark_table_load(connection, commit)
         try:
-            self.cursor.executemany(insert_sql, data_rows)
-            self.connection.commit()
-            logger.info(f"✅ Inserted {len(data_rows)} booking records")
-            
-            # Execute merge procedure immediately after insert
-            logger.info("Executing merge for BOOKINGS...")
-            self.merge_single_table('BOOKINGS')
-            
+            with self._bulk_mode(spec, len(data_rows), connection, commit):
+                small_load = (
+                    len(data_rows) <= INSERT_ALL_MAX_ROWS <= spec.insert_all_rows
+                )
+                if spec.insert_all or small_load:
+                    inserted = self._insert_all_chunked(
+                        spec, data_rows, conn=conn
+                    )
+                elif commit and len(data_rows) > DIRECT_PATH_MAX_ROWS:
+                    inserted = self._direct_path_sliced(
+                        spec, data_rows, connection, conn
+                    )
+                else:
+                    # Direct path only for committing loads: a deferred
+                    # load must stay undoable with ROLLBACK TO SAVEPOINT
+                    sql = spec.sql if commit else spec.conventional_sql
+                    inserted = self._executemany_chunked(
+                        sql, data_rows, conn=conn,
+                        date_cols=spec.date_cols,
+                        timestamp_cols=spec.timestamp_cols,
+                        input_sizes=self._column_input_sizes(
+                            spec, data_rows, conn
+                        )
+                    )
+            self._finish_table_load(spec, inserted, conn, commit)
         except Exception as e:
-            self.connection.rollback()
-            logger.exception(f"❌ Error merging booking data: {e}")
+            self._undo_table_load(connection, commit)
+            logger.exception("❌ Error merging %s data: %s", spec.label, e)
             raise
+        
+        return inserted
 
-    def insert_booking_boats(self, data_rows):
+    def _column_input_sizes(self, spec, rows, conn=None):
         """
-        Insert booking boat data into STG_STELLAR_BOOKING_BOATS table.
+        Resolve setinputsizes() arguments for every column of a staging table.
+        
+        DATE/TIMESTAMP positions are pinned to native types, numeric
+        positions to NUMBER and text positions to the column's declared
+        width (see _text_column_widths), so the driver does not re-scan
+        every row of every chunk to size its bind buffers. The kind of value in
+        each position is taken from its first non-null value in the first
+        BATCH_SIZE rows, since the CSV parsers produce one Python type per
+        column; anything else is left to the driver. Resolved once per
+        table and connector.
         
         Args:
-            data_rows: List of tuples containing booking boat data (57 columns)
+            spec (TableSpec): Table being loaded
+            rows (list): Rows of the load, used to sample value types
+            conn: Optional pooled connection to query the data dictionary on
+        
+        Returns:
+            list: One entry per column
         """
-        if not data_rows:
-            logger.info("No booking boat data to process")
+        sizes = self._input_sizes.get(spec.table)
+        if sizes is not None:
+            return sizes
+        
+        widths = self._text_column_widths(
+            spec.table, self.connection if conn is None else conn
+        )
+        sample = rows[:BATCH_SIZE]
+        sizes = []
+        for c, column in enumerate(spec.columns):
+            if c in spec.date_cols:
+                sizes.append(oracledb.DB_TYPE_DATE)
+                continue
+            if c in spec.timestamp_cols:
+                sizes.append(oracledb.DB_TYPE_TIMESTAMP)
+                continue
+            value = next((row[c] for row in sample if row[c] is not None), None)
+            if isinstance(value, str) and widths.get(column):
+                sizes.append(widths[column])
+            elif (isinstance(value, (int, float)) and not isinstance(value, bool)
+                    and column not in widths):
+                sizes.append(oracledb.DB_TYPE_NUMBER)
+            else:
+                sizes.append(None)
+        
+        self._input_sizes[spec.table] = sizes
+        return sizes
+
+    def _text_column_widths(self, table, connection):
+        """
+        Return the declared width of each text column of a staging table.
+        
+        The column definitions do not change during a run, so the first
+        call reads the text columns of every STG_STELLAR_* table (and of
+        the requested table, should a custom TableSpec use another name)
+        in one USER_TAB_COLUMNS query and keeps them for the connector's
+        lifetime.
+        
+        Args:
+            table (str): Staging table name
+            connection: Connection to query the data dictionary on
+        
+        Returns:
+            dict: CHAR_LENGTH keyed by column name
+        """
+        widths = self._column_widths.get(table)
+        if widths is not None:
+            return widths
+        
+        with connection.cursor() as cursor:
+            cursor.execute(
+                """
+                SELECT TABLE_NAME, COLUMN_NAME, CHAR_LENGTH
+                  FROM USER_TAB_COLUMNS
+                 WHERE (TABLE_NAME LIKE 'STG_STELLAR_%' OR TABLE_NAME = :table_name)
+                   AND DATA_TYPE IN ('VARCHAR2', 'CHAR', 'NVARCHAR2', 'NCHAR')
+                """,
+                table_name=table
+            )
+            found = {name: {} for name in STAGING_TABLES + (table,)}
+            for table_name, column, width in cursor.fetchall():
+                found.setdefault(table_name, {})[column] = width
+        self._column_widths.update(found)
+        return found[table]
+
+    @contextlib.contextmanager
+    def _bulk_mode(self, spec, num_rows, connection, commit):
+        """
+        Defer secondary index maintenance on a staging table for one load.
+        
+        Non-unique, non-partitioned indexes found in USER_INDEXES are marked
+        UNUSABLE before the load (sessions skip unusable indexes by default)
+        and rebuilt NOLOGGING afterwards, so each index is built once from
+        the loaded rows. Unique indexes are left alone since DML against an
+        unusable unique index fails. ALTER INDEX commits, so this only
+        applies to committing loads of at least BULK_MODE_MIN_ROWS rows; a
+        failed load is rolled back before the indexes are rebuilt.
+        
+        Args:
+            spec (TableSpec): Table being loaded
+            num_rows (int): Number of rows in the load
+            connection: Connection the load runs on
+            commit (bool): Whether the load commits per table
+        """
+        if not commit or num_rows < BULK_MODE_MIN_ROWS:
+            yield
             return
         
-        insert_sql = """
-        INSERT INTO STG_STELLAR_BOOKING_BOATS (ID, BOOKING_ID, STYLE_ID, BOAT_ID, TIME_ID, TIMEFRAME_ID,
-                    MAIN_BOAT, NUM_PASSENGERS, BOAT_DEPARTURE, BOAT_RETURN, STATUS_BOOKING,
-                    PRICE, PRICE_OVERRIDE, SIGNATURE_DATE, CHECK_OUT_DATE, CHECK_OUT_EQUIPMENT,
-                    CHECK_OUT_NOTES, CHECK_OUT_ENGINE_HOURS, CHECK_IN_DATE, CHECK_IN_EQUIPMENT,
-                    CHECK_IN_NOTES, CHECK_IN_ENGINE_HOURS, CHECK_IN_HOURS, CHECK_IN_DEPOSIT,
-                    CHECK_IN_WEATHER, CHECK_IN_LATE, CHECK_IN_MISC_NON_TAX, CHECK_IN_MISC_TAX,
-                    CHECK_IN_CLEANING, CHECK_IN_GALLONS, CHECK_IN_FUEL, CHECK_IN_DIESEL_GALLONS,
-                    CHECK_IN_DIESEL, CHECK_IN_TIP, CHECK_IN_TAX_1, CHECK_IN_TAX_2, CHECK_IN_TOTAL,
-                    QUEUE_ADMIN_ID, QUEUE_DATE, ATTENDANT_QUEUE_ADMIN_ID, ATTENDANT_WATER_ADMIN_ID,
-                    BOAT_ASSIGNED, ADDITIONAL_DRIVERS, ADDITIONAL_DRIVER_NAMES, ACCESSORIES_MIGRATED,
-                    PRICE_RULE_ID, PRICE_RULE_ORIGINAL_PRICE, PRICE_RULE_DYNAMIC_PRICE,
-                    PRICE_RULE_DIFFERENCE, EMERGENCY_NAME, EMERGENCY_PHONE, DATE_OF_BIRTH,
-                    CONTRACT_RETURN_PDF, CONTRACT_PDF, CREATED_AT, UPDATED_AT, DELETED_AT)
-            VALUES (:1, :2, :3, :4, :5, :6, :7, :8, :9, :10, :11, :12, :13, :14, :15, :16, :17, :18, :19, :20, :21, :22, :23, :24, :25, :26, :27, :28, :29, :30, :31, :32, :33, :34, :35, :36, :37, :38, :39, :40, :41, :42, :43, :44, :45, :46, :47, :48, :49, :50, :51, :52, :53, :54, :55, :56, :57)"""
+        indexes = self._secondary_indexes.get(spec.table)
+        if indexes is None:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    """
+                    SELECT INDEX_NAME
+                      FROM USER_INDEXES
+                     WHERE TABLE_NAME = :table_name
+                       AND UNIQUENESS = 'NONUNIQUE'
+                       AND INDEX_TYPE IN ('NORMAL', 'BITMAP')
+                       AND PARTITIONED = 'NO'
+                    """,
+                    table_name=spec.table
+                )
+                indexes = tuple(name for name, in cursor.fetchall())
+            self._secondary_indexes[spec.table] = indexes
+        if not indexes:
+            yield
+            return
         
+        with connection.cursor() as cursor:
+            for index in indexes:
+                cursor.execute(f"ALTER INDEX {index} UNUSABLE")
         try:
-            self.cursor.executemany(insert_sql, data_rows)
-            self.connection.commit()
-            logger.info(f"✅ Inserted {len(data_rows)} booking boat records")
-            
-            # Execute merge procedure immediately after insert
-            logger.info("Executing merge for BOOKING_BOATS...")
-            self.merge_single_table('BOOKING_BOATS')
-            
-        except Exception as e:
-            self.connection.rollback()
-            logger.exception(f"❌ Error merging booking boat data: {e}")
+            yield
+        except BaseException:
+            connection.rollback()
             raise
+        finally:
+            with connection.cursor() as cursor:
+                for index in indexes:
+                    cursor.execute(f"ALTER INDEX {index} REBUILD NOLOGGING")
+            logger.debug(
+                "Rebuilt %d index(es) on %s after bulk load",
+                len(indexes), spec.table
+            )
+
+    def _finish_table_load(self, spec, inserted, conn=None, commit=True):
+        """
+        Commit (if requested), log and run the table's merge procedure.
+        
+        Merge procedures commit, so with commit=False the merge is queued
+        for finalize() instead of committing the shared transaction here.
+        """
+        connection = self.connection if conn is None else conn
+        logger.info("✅ Inserted %d %s records", inserted, spec.label)
+        if not commit:
+            if spec.merge:
+                self._pending_merges.append(spec.merge)
+                logger.info("Merge for %s deferred to finalize()", spec.merge)
+            return
+        
+        connection.commit()
+        if spec.merge:
+            # Execute merge procedure immediately after insert
+            logger.info("Executing merge for %s...", spec.merge)
+            self.merge_single_table(spec.merge, conn=conn)
+
+    # ========================================================================
+    # MERGE FUNCTIONS - Stellar Business Tables
+    # ========================================================================
+
+    def insert_locations(self, data_rows, conn=None, commit=True):
+        """
+        Insert location data into STG_STELLAR_LOCATIONS table.
+        All 22 columns.
+        
+        Args:
+            data_rows: List of tuples (or a pandas DataFrame) containing location data
+            conn: Optional pooled connection to load on (defaults to the main connection)
+            commit: Commit after the insert; when False the rows stay in the
+                    open transaction until finalize()
+        """
+        return self.insert('locations', data_rows, conn=conn, commit=commit)
+
+    def insert_customers(self, data_rows, conn=None, commit=True):
+        """
+        Insert customer data into STG_STELLAR_CUSTOMERS table.
+        All 52 columns, using USER_ID as primary key (not ID!).
+        
+        Args:
+            data_rows: List of tuples (or a pandas DataFrame) containing customer data
+            conn: Optional pooled connection to load on (defaults to the main connection)
+            commit: Commit and run the merge procedure right after the
+                    insert; when False the rows stay in the open
+                    transaction and the merge runs in finalize()
+        """
+        return self.insert('customers', data_rows, conn=conn, commit=commit)
+
+    def insert_bookings(self, data_rows, conn=None, commit=True):
+        """
+        Insert booking data into STG_STELLAR_BOOKINGS table.
+        
+        Args:
+            data_rows: List of tuples (or a pandas DataFrame) containing booking data (82 columns)
+            conn: Optional pooled connection to load on (defaults to the main connection)
+            commit: Commit and run the merge procedure right after the
+                    insert; when False the rows stay in the open
+                    transaction and the merge runs in finalize()
+        """
+        return self.insert('bookings', data_rows, conn=conn, commit=commit)
+
+    def insert_booking_boats(self, data_rows, conn=None, commit=True):
+        """
+        Insert booking boat data into STG_STELLAR_BOOKING_BOATS table.
+        
+        Args:
+            data_rows: List of tuples (or a pandas DataFrame) containing booking boat data (57 columns)
+            conn: Optional pooled connection to load on (defaults to the main connection)
+            commit: Commit and run the merge procedure right after the
+                    insert; when False the rows stay in the open
+                    transaction and the merge runs in finalize()
+        """
+        return self.insert('booking_boats', data_rows, conn=conn, commit=commit)
 
-    def insert_booking_payments(self, data_rows):
+    def insert_booking_payments(self, data_rows, conn=None, commit=True):
         """
         Insert booking payment data into STG_STELLAR_BOOKING_PAYMENTS table.
         
         Args:
-            data_rows: List of tuples containing booking payment data (56 columns)
+            data_rows: List of tuples (or a pandas DataFrame) containing booking payment data (56 columns)
+            conn: Optional pooled connection to load on (defaults to the main connection)
+            commit: Commit and run the merge procedure right after the
+                    insert; when False the rows stay in the open
+                    transaction and the merge runs in finalize()
         """
-        if not data_rows:
-            logger.info("No booking payment data to process")
-            return
-        
-        insert_sql = """
-        INSERT INTO STG_STELLAR_BOOKING_PAYMENTS (ID, BOOKING_ID, CUSTOMER_ID, ADMIN_ID, FRONTEND, PAYMENT_FOR,
-                    PAYMENT_TYPE, CARD_TYPE, PAYMENT_TOTAL, CASH_TOTAL, CREDIT_TOTAL,
-                    AGENT_AR_TOTAL, CREDIT_LAST4, CREDIT_EXPIRY, BILLING_FIRST_NAME,
-                    BILLING_LAST_NAME, BILLING_STREET1, BILLING_STREET2, BILLING_CITY,
-                    BILLING_STATE, BILLING_COUNTRY, BILLING_ZIP, TRANS_ID,
-                    ORIGINAL_PAYMENT_ID, STATUS_PAYMENT, NOTES, IS_AGENT_AR, OFFLINE_TYPE,
-                    DOCK_MASTER_TICKET, MY_TASK_IT_ID, REPORT_BOATS, REPORT_PROPANE,
-                    REPORT_ACCESSORIES, REPORT_PARKING, REPORT_INSURANCE, REPORT_FUEL,
-                    REPORT_DAMAGES, REPORT_CLEANING, REPORT_LATE, REPORT_OTHER, REPORT_DISCOUNT,
-                    INTERNAL_APPLICATION_FEE, CC_PROCESSOR_FEE, CC_BRAND, CC_COUNTRY,
-                    CC_FUNDING, CC_CONNECT_TYPE, CC_CONNECT_ID, CC_PAYOUT_ID, CC_PAYOUT_DATE,
-                    EXTERNAL_CHARGE_ID, IS_SYNCED, STRIPE_READER_ID, CREATED_AT, UPDATED_AT, DELETED_AT)
-            VALUES (:1, :2, :3, :4, :5, :6, :7, :8, :9, :10, :11, :12, :13, :14, :15, :16, :17, :18, :19, :20, :21, :22, :23, :24, :25, :26, :27, :28, :29, :30, :31, :32, :33, :34, :35, :36, :37, :38, :39, :40, :41, :42, :43, :44, :45, :46, :47, :48, :49, TO_TIMESTAMP(:50, 'YYYY-MM-DD HH24:MI:SS'), :51, :52, :53, TO_TIMESTAMP(:54, 'YYYY-MM-DD HH24:MI:SS'), TO_TIMESTAMP(:55, 'YYYY-MM-DD HH24:MI:SS'), TO_TIMESTAMP(:56, 'YYYY-MM-DD HH24:MI:SS'))"""
-        
-        try:
-            self.cursor.executemany(insert_sql, data_rows)
-            self.connection.commit()
-            logger.info(f"✅ Inserted {len(data_rows)} booking payment records")
-            
-            # Execute merge procedure immediately after insert
-            logger.info("Executing merge for BOOKING_PAYMENTS...")
-            self.merge_single_table('BOOKING_PAYMENTS')
-            
-        except Exception as e:
-            self.connection.rollback()
-            logger.exception(f"❌ Error merging booking payment data: {e}")
-            raise
+        return self.insert('booking_payments', data_rows, conn=conn, commit=commit)
 
-    def insert_style_groups(self, data_rows):
+    def insert_style_groups(self, data_rows, conn=None, commit=True):
         """
         Insert style group data into STG_STELLAR_STYLE_GROUPS table (11 columns).
         
         Args:
-            data_rows: List of tuples containing style group data (11 values each)
+            data_rows: List of tuples (or a pandas DataFrame) containing style group data (11 values each)
+            conn: Optional pooled connection to load on (defaults to the main connection)
+            commit: Commit after the insert; when False the rows stay in the
+                    open transaction until finalize()
         """
-        if not data_rows:
-            logger.info("No style group data to process")
-            return
-        
-        insert_sql = """
-        INSERT INTO STG_STELLAR_STYLE_GROUPS (ID, LOCATION_ID, GROUP_NAME, FRONTEND_MAX_SAME_DEPARTURES,
-                    SAFETY_TEST_ENABLED, SAFETY_TEST_INSTRUCTIONS, SAFETY_TEST_MIN_PERCENT_PASS,
-                    SAFETY_TEST_EXPIRATION_DAYS, SAFETY_VIDEO_LINK, CREATED_AT, UPDATED_AT)
-            VALUES (:1, :2, :3, :4, :5, :6, :7, :8, :9, TO_TIMESTAMP(:10, \'YYYY-MM-DD HH24:MI:SS\'), TO_TIMESTAMP(:11, \'YYYY-MM-DD HH24:MI:SS\'))"""
-        
-        try:
-            self.cursor.executemany(insert_sql, data_rows)
-            self.connection.commit()
-            logger.info(f"✅ Inserted {len(data_rows)} style group records")
-        except Exception as e:
-            self.connection.rollback()
-            logger.exception(f"❌ Error merging style group data: {e}")
-            raise
+        return self.insert('style_groups', data_rows, conn=conn, commit=commit)
 
-    def insert_styles(self, data_rows):
+    def insert_styles(self, data_rows, conn=None, commit=True):
         """
         Insert style data into STG_STELLAR_STYLES table (98 columns).
         
         Args:
-            data_rows: List of tuples containing style data
+            data_rows: List of tuples (or a pandas DataFrame) containing style data
+            conn: Optional pooled connection to load on (defaults to the main connection)
+            commit: Commit and run the merge procedure right after the
+                    insert; when False the rows stay in the open
+                    transaction and the merge runs in finalize()
         """
-        if not data_rows:
-            logger.info("No style data to process")
-            return
-        
-        insert_sql = """
-        INSERT INTO STG_STELLAR_STYLES (ID, LOCATION_ID, STYLE_GROUP_ID, STYLE_NAME, BACKEND_DISPLAY, POSITION_ORDER,
-                    TURN_AROUND_TIME, DEPOSIT_AMOUNT, MULTI_DAY_DEPOSIT_AMOUNT, PRE_AUTH_AMOUNT,
-                    FUEL_BURN_RATIO, TAX_1_RATE, TAX_2_RATE, INSURANCE_ENABLED, INSURANCE_PRICING_TYPE,
-                    INSURANCE_PRICING_RATE, INSURANCE_FIRST_DAY_PRICE, GRATUITY_ENABLED, GRATUITY_PRICING_RATE,
-                    PARKING_QTY_MULTIPLIER, FRONTEND_DISPLAY, FRONTEND_NAME, FRONTEND_POSITION, FRONTEND_TYPE,
-                    FRONTEND_QTY_LIMIT, FRONTEND_UNIT_SELECTOR, FRONTEND_PARTIAL_PAYMENT_TYPE,
-                    FRONTEND_PARTIAL_PAYMENT_AMOUNT, BACKEND_MULTI_DAY_DISABLED, MAX_SAME_STYLE_PER_BOOKING,
-                    FRONTEND_MIN_HOURS_ADVANCE_DEPARTURE, BACKEND_HOURLY_ENABLED, WEEK_DAY_BACKEND_HOURLY_MIN_HOURS,
-                    WEEK_DAY_BACKEND_HOURLY_MAX_HOURS, WEEK_END_BACKEND_HOURLY_MIN_HOURS, WEEK_END_BACKEND_HOURLY_MAX_HOURS,
-                    HOLIDAY_BACKEND_HOURLY_MIN_HOURS, HOLIDAY_BACKEND_HOURLY_MAX_HOURS, FRONTEND_HOURLY_ENABLED,
-                    WEEK_DAY_FRONTEND_HOURLY_MIN_HOURS, WEEK_DAY_FRONTEND_HOURLY_MAX_HOURS,
-                    WEEK_DAY_FRONTEND_HOURLY_TIME_INCREMENT, WEEK_DAY_FRONTEND_HOURLY_LENGTH_INCREMENT,
-                    WEEK_END_FRONTEND_HOURLY_MIN_HOURS, WEEK_END_FRONTEND_HOURLY_MAX_HOURS,
-                    WEEK_END_FRONTEND_HOURLY_TIME_INCREMENT, WEEK_END_FRONTEND_HOURLY_LENGTH_INCREMENT,
-                    HOLIDAY_FRONTEND_HOURLY_MIN_HOURS, HOLIDAY_FRONTEND_HOURLY_MAX_HOURS,
-                    HOLIDAY_FRONTEND_HOURLY_TIME_INCREMENT, HOLIDAY_FRONTEND_HOURLY_LENGTH_INCREMENT,
-                    BACKEND_NIGHTLY_ENABLED, BACKEND_NIGHTLY_MIN_NIGHTS, BACKEND_NIGHTLY_MAX_NIGHTS,
-                    BACKEND_NIGHTLY_START, BACKEND_NIGHTLY_END, BACKEND_NIGHTLY_DISCOUNT_DAYS,
-                    BACKEND_NIGHTLY_DISCOUNT_TYPE, BACKEND_NIGHTLY_DISCOUNT_AMOUNT, FRONTEND_NIGHTLY_ENABLED,
-                    FRONTEND_NIGHTLY_MIN_NIGHTS, FRONTEND_NIGHTLY_MIN_NIGHTS_PEAK, FRONTEND_NIGHTLY_MAX_NIGHTS,
-                    FRONTEND_NIGHTLY_START, FRONTEND_NIGHTLY_END, FRONTEND_NIGHTLY_ADDL_TIMES,
-                    FRONTEND_NIGHTLY_DISCOUNT_DAYS, FRONTEND_NIGHTLY_DISCOUNT_TYPE, FRONTEND_NIGHTLY_DISCOUNT_AMOUNT,
-                    IMAGE_URL, PASSENGERS, WEIGHT_CAPACITY, HORSEPOWER, ENGINE_TYPE, LENGTH_FEET,
-                    WIDTH_FEET, DRAFT_FEET, FUEL_CAPACITY, BRAND, MODEL, TITLE,
-                    DESCRIPTION_TEXT, SUMMARY_TEXT, NOTES, VIDEO_LINK, SMARTWAIVER_WAIVER_LINK,
-                    ACCOUNTING_ITEM_ID, LOCAL_VIDEO_LINK, DOCKMASTER_PART_NUMBER, DOCKMASTER_TAX_CODE,
-                    END_HOURS, SEASONAL_BUFFER_DEFAULT_LOWER, SEASONAL_BUFFER_DEFAULT_UPPER,
-                    SEASONAL_BUFFER_PEAK_LOWER, SEASONAL_BUFFER_PEAK_UPPER, BILLABLE_UNIT_TYPE,
-                    CREATED_AT, UPDATED_AT)
-            VALUES (:1, :2, :3, :4, :5, :6, :7, :8, :9, :10, :11, :12, :13, :14, :15, :16, :17, :18, :19, :20, :21, :22, :23, :24, :25, :26, :27, :28, :29, :30, :31, :32, :33, :34, :35, :36, :37, :38, :39, :40, :41, :42, :43, :44, :45, :46, :47, :48, :49, :50, :51, :52, :53, :54, :55, :56, :57, :58, :59, :60, :61, :62, :63, :64, :65, :66, :67, :68, :69, :70, :71, :72, :73, :74, :75, :76, :77, :78, :79, :80, :81, :82, :83, :84, :85, :86, :87, :88, :89, :90, :91, :92, :93, :94, :95, :96, TO_TIMESTAMP(:97, 'YYYY-MM-DD HH24:MI:SS'), TO_TIMESTAMP(:98, 'YYYY-MM-DD HH24:MI:SS'))"""
-        
-        try:
-            self.cursor.executemany(insert_sql, data_rows)
-            self.connection.commit()
-            logger.info(f"✅ Inserted {len(data_rows)} style records")
-            
-            # Execute merge procedure immediately after insert
-            logger.info("Executing merge for STYLES...")
-            self.merge_single_table('STYLES')
-            
-        except Exception as e:
-            self.connection.rollback()
-            logger.exception(f"❌ Error merging style data: {e}")
-            raise
+        return self.insert('styles', data_rows, conn=conn, commit=commit)
 
-    def insert_style_boats(self, data_rows):
+    def insert_style_boats(self, data_rows, conn=None, commit=True):
         """
         Insert style boat data into STG_STELLAR_STYLE_BOATS table.
         
         Args:
-            data_rows: List of tuples containing style boat data (39 columns)
+            data_rows: List of tuples (or a pandas DataFrame) containing style boat data (39 columns)
+            conn: Optional pooled connection to load on (defaults to the main connection)
+            commit: Commit and run the merge procedure right after the
+                    insert; when False the rows stay in the open
+                    transaction and the merge runs in finalize()
         """
-        if not data_rows:
-            logger.info("No style boat data to process")
-            return
-        
-        insert_sql = """
-        INSERT INTO STG_STELLAR_STYLE_BOATS (ID, STYLE_ID, BOAT_NUMBER, PAPER_LESS_NUMBER, MOTOR, MANUFACTURER,
-                    SERIAL_NUMBER, IN_FLEET, HULL_NUMBER, STATE_NUMBER, CYLINDERS, HP,
-                    MODEL, BOAT_TYPE, PURCHASED_DATE, PURCHASED_COST, SALE_DATE, SALE_PRICE,
-                    CLUB_LOCATION, DEALER_NAME, DEALER_CITY, DEALER_STATE, PO_NUMBER,
-                    BOAT_YEAR_MODEL, MOTOR_YEAR_MODEL, MOTOR_MANUFACTURER_MODEL,
-                    STATE_REG_DATE, STATE_REG_EXP_DATE, ENGINE_PURCHASED_COST,
-                    BACKEND_DISPLAY, POSITION_ORDER, STATUS_BOAT, SERVICE_START, SERVICE_END,
-                    CLEAN_STATUS, INSURANCE_REG_NO, BUOY_INSURANCE_STATUS, CREATED_AT, UPDATED_AT)
-            VALUES (:1, :2, :3, :4, :5, :6, :7, :8, :9, :10, :11, :12, :13, :14, 
-                    TO_DATE(:15, 'YYYY-MM-DD'), :16, TO_DATE(:17, 'YYYY-MM-DD'), :18, :19, :20, :21, :22, :23, :24, :25, :26, 
-                    TO_DATE(:27, 'YYYY-MM-DD'), TO_DATE(:28, 'YYYY-MM-DD'), :29, :30, :31, :32, 
-                    TO_DATE(:33, 'YYYY-MM-DD'), TO_DATE(:34, 'YYYY-MM-DD'), :35, :36, :37, 
-                    TO_TIMESTAMP(:38, 'YYYY-MM-DD HH24:MI:SS'), TO_TIMESTAMP(:39, 'YYYY-MM-DD HH24:MI:SS'))"""
-        
-        try:
-            self.cursor.executemany(insert_sql, data_rows)
-            self.connection.commit()
-            logger.info(f"✅ Inserted {len(data_rows)} style boat records")
-            
-            # Execute merge procedure immediately after insert
-            logger.info("Executing merge for STYLE_BOATS...")
-            self.merge_single_table('STYLE_BOATS')
-            
-        except Exception as e:
-            self.connection.rollback()
-            logger.exception(f"❌ Error merging style boat data: {e}")
-            raise
+        return self.insert('style_boats', data_rows, conn=conn, commit=commit)
 
-    def insert_customer_boats(self, data_rows):
+    def insert_customer_boats(self, data_rows, conn=None, commit=True):
         """
         Insert customer boat data into STG_STELLAR_CUSTOMER_BOATS table.
         Customer-owned boats - 9 columns.
         
         Args:
-            data_rows: List of tuples containing customer boat data (9 columns)
+            data_rows: List of tuples (or a pandas DataFrame) containing customer boat data (9 columns)
+            conn: Optional pooled connection to load on (defaults to the main connection)
+            commit: Commit after the insert; when False the rows stay in the
+                    open transaction until finalize()
         """
-        if not data_rows:
-            logger.info("No customer boat data to process")
-            return
-        
-        insert_sql = """
-        INSERT INTO STG_STELLAR_CUSTOMER_BOATS (ID, CUSTOMER_ID, SLIP_ID, BOAT_NAME, BOAT_NUMBER,
-                    LENGTH_FEET, WIDTH_FEET, CREATED_AT, UPDATED_AT)
-            VALUES (:1, :2, :3, :4, :5, :6, :7, TO_TIMESTAMP(:8, \'YYYY-MM-DD HH24:MI:SS\'), TO_TIMESTAMP(:9, \'YYYY-MM-DD HH24:MI:SS\'))"""
-        
-        try:
-            self.cursor.executemany(insert_sql, data_rows)
-            self.connection.commit()
-            logger.info(f"✅ Inserted {len(data_rows)} customer boat records")
-        except Exception as e:
-            self.connection.rollback()
-            logger.exception(f"❌ Error merging customer boat data: {e}")
-            raise
+        return self.insert('customer_boats', data_rows, conn=conn, commit=commit)
 
-    def insert_seasons(self, data_rows):
+    def insert_seasons(self, data_rows, conn=None, commit=True):
         """
         Insert season data into STG_STELLAR_SEASONS table.
         All 20 columns.
         
         Args:
-            data_rows: List of tuples containing season data
+            data_rows: List of tuples (or a pandas DataFrame) containing season data
+            conn: Optional pooled connection to load on (defaults to the main connection)
+            commit: Commit after the insert; when False the rows stay in the
+                    open transaction until finalize()
         """
-        if not data_rows:
-            logger.info("No season data to process")
-            return
-        
-        insert_sql = """
-        INSERT INTO STG_STELLAR_SEASONS (ID, LOCATION_ID, SEASON_NAME, SEASON_START, SEASON_END,
-                    STATUS_SEASON, WEEK_DAY_MIN_START_TIME, WEEK_DAY_MAX_START_TIME,
-                    WEEK_DAY_MIN_END_TIME, WEEK_DAY_MAX_END_TIME, WEEK_END_MIN_START_TIME,
-                    WEEK_END_MAX_START_TIME, WEEK_END_MIN_END_TIME, WEEK_END_MAX_END_TIME,
-                    HOLIDAY_MIN_START_TIME, HOLIDAY_MAX_START_TIME, HOLIDAY_MIN_END_TIME,
-                    HOLIDAY_MAX_END_TIME, CREATED_AT, UPDATED_AT)
-            VALUES (:1, :2, :3, TO_DATE(:4, 'YYYY-MM-DD'), TO_DATE(:5, 'YYYY-MM-DD'), :6, :7, :8, :9, :10, :11, :12, :13, :14, :15, :16, :17, :18, TO_TIMESTAMP(:19, 'YYYY-MM-DD HH24:MI:SS'), TO_TIMESTAMP(:20, 'YYYY-MM-DD HH24:MI:SS'))"""
-        
-        try:
-            self.cursor.executemany(insert_sql, data_rows)
-            self.connection.commit()
-            logger.info(f"✅ Inserted {len(data_rows)} season records")
-        except Exception as e:
-            self.connection.rollback()
-            logger.exception(f"❌ Error merging season data: {e}")
-            raise
+        return self.insert('seasons', data_rows, conn=conn, commit=commit)
 
-    def insert_season_dates(self, data_rows):
+    def insert_season_dates(self, data_rows, conn=None, commit=True):
         """
         Insert season date data into STG_STELLAR_SEASON_DATES table.
         Season date ranges - 4 columns.
         
         Args:
-            data_rows: List of tuples containing season date data (4 columns)
+            data_rows: List of tuples (or a pandas DataFrame) containing season date data (4 columns)
+            conn: Optional pooled connection to load on (defaults to the main connection)
+            commit: Commit after the insert; when False the rows stay in the
+                    open transaction until finalize()
         """
-        if not data_rows:
-            logger.info("No season date data to process")
-            return
-        
-        insert_sql = """
-        INSERT INTO STG_STELLAR_SEASON_DATES (ID, SEASON_ID, START_DATE, END_DATE)
-            VALUES (:1, :2, TO_DATE(:3, 'YYYY-MM-DD'), TO_DATE(:4, 'YYYY-MM-DD'))"""
-        
-        try:
-            self.cursor.executemany(insert_sql, data_rows)
-            self.connection.commit()
-            logger.info(f"✅ Inserted {len(data_rows)} season date records")
-        except Exception as e:
-            self.connection.rollback()
-            logger.exception(f"❌ Error merging season date data: {e}")
-            raise
+        return self.insert('season_dates', data_rows, conn=conn, commit=commit)
 
-    def insert_style_hourly_prices(self, data_rows):
+    def insert_style_hourly_prices(self, data_rows, conn=None, commit=True):
         """
         Insert style hourly price data into STG_STELLAR_STYLE_HOURLY_PRICES table.
         Hourly pricing by style and season - 22 columns.
         
         Args:
-            data_rows: List of tuples containing style hourly price data (22 columns)
+            data_rows: List of tuples (or a pandas DataFrame) containing style hourly price data (22 columns)
+            conn: Optional pooled connection to load on (defaults to the main connection)
+            commit: Commit and run the merge procedure right after the
+                    insert; when False the rows stay in the open
+                    transaction and the merge runs in finalize()
         """
-        if not data_rows:
-            logger.info("No style hourly price data to process")
-            return
-        
-        insert_sql = """
-        INSERT INTO STG_STELLAR_STYLE_HOURLY_PRICES (ID, STYLE_ID, SEASON_ID, HOURLY_TYPE, DEFAULT_PRICE,
-                    HOLIDAY, SATURDAY, SUNDAY, MONDAY, TUESDAY, WEDNESDAY,
-                    THURSDAY, FRIDAY, DAY_DISCOUNT, UNDER_ONE_HOUR,
-                    FIRST_HOUR_AM, FIRST_HOUR_PM, MAX_PRICE, MIN_HOURS,
-                    MAX_HOURS, CREATED_AT, UPDATED_AT)
-            VALUES (:1, :2, :3, :4, :5, :6, :7, :8, :9, :10, :11, :12, :13, :14, :15, :16, :17, :18, :19, :20, TO_TIMESTAMP(:21, \'YYYY-MM-DD HH24:MI:SS\'), TO_TIMESTAMP(:22, \'YYYY-MM-DD HH24:MI:SS\'))"""
-        
-        try:
-            self.cursor.executemany(insert_sql, data_rows)
-            self.connection.commit()
-            logger.info(f"✅ Inserted {len(data_rows)} style hourly price records")
-            
-            # Execute merge procedure immediately after insert
-            logger.info("Executing merge for STYLE_HOURLY_PRICES...")
-            self.merge_single_table('STYLE_HOURLY_PRICES')
-            
-        except Exception as e:
-            self.connection.rollback()
-            logger.exception(f"❌ Error merging style hourly price data: {e}")
-            raise
+        return self.insert('style_hourly_prices', data_rows, conn=conn, commit=commit)
 
-    def insert_style_times(self, data_rows):
+    def insert_style_times(self, data_rows, conn=None, commit=True):
         """
         Insert style time data into STG_STELLAR_STYLE_TIMES table.
         Time slot availability by style - 26 columns.
         
         Args:
-            data_rows: List of tuples containing style time data (26 columns)
+            data_rows: List of tuples (or a pandas DataFrame) containing style time data (26 columns)
+            conn: Optional pooled connection to load on (defaults to the main connection)
+            commit: Commit and run the merge procedure right after the
+                    insert; when False the rows stay in the open
+                    transaction and the merge runs in finalize()
         """
-        if not data_rows:
-            logger.info("No style time data to process")
-            return
-        
-        insert_sql = """
-        INSERT INTO STG_STELLAR_STYLE_TIMES (ID, STYLE_ID, SEASON_ID, DESCRIPTION_TEXT, FRONTEND_DISPLAY,
-                    START_1, END_1, END_DAYS_1, STATUS_1, START_2, END_2, END_DAYS_2,
-                    STATUS_2, START_3, END_3, END_DAYS_3, STATUS_3, START_4, END_4,
-                    END_DAYS_4, STATUS_4, VALID_DAYS, HOLIDAYS_ONLY_IF_VALID_DAY,
-                    MAPPED_TIME_ID, CREATED_AT, UPDATED_AT)
-            VALUES (:1, :2, :3, :4, :5, :6, :7, :8, :9, :10, :11, :12, :13, :14, :15, :16, :17, :18, :19, :20, :21, :22, :23, :24, TO_TIMESTAMP(:25, 'YYYY-MM-DD HH24:MI:SS'), TO_TIMESTAMP(:26, 'YYYY-MM-DD HH24:MI:SS'))"""
-        
-        try:
-            self.cursor.executemany(insert_sql, data_rows)
-            self.connection.commit()
-            logger.info(f"✅ Inserted {len(data_rows)} style time records")
-            
-            # Execute merge procedure immediately after insert
-            logger.info("Executing merge for STYLE_TIMES...")
-            self.merge_single_table('STYLE_TIMES')
-            
-        except Exception as e:
-            self.connection.rollback()
-            logger.exception(f"❌ Error merging style time data: {e}")
-            raise
+        return self.insert('style_times', data_rows, conn=conn, commit=commit)
 
-    def insert_style_prices(self, data_rows):
+    def insert_style_prices(self, data_rows, conn=None, commit=True):
         """
         Insert style price data into STG_STELLAR_STYLE_PRICES table.
         Uses TIME_ID as primary key (not ID). 12 columns total.
         
         Args:
-            data_rows: List of tuples containing style price data
+            data_rows: List of tuples (or a pandas DataFrame) containing style price data
+            conn: Optional pooled connection to load on (defaults to the main connection)
+            commit: Commit and run the merge procedure right after the
+                    insert; when False the rows stay in the open
+                    transaction and the merge runs in finalize()
         """
-        if not data_rows:
-            logger.info("No style price data to process")
-            return
-        
-        insert_sql = """
-        INSERT INTO STG_STELLAR_STYLE_PRICES (TIME_ID, DEFAULT_PRICE, HOLIDAY, SATURDAY, SUNDAY, MONDAY,
-                    TUESDAY, WEDNESDAY, THURSDAY, FRIDAY, CREATED_AT, UPDATED_AT)
-            VALUES (:1, :2, :3, :4, :5, :6, :7, :8, :9, :10, TO_TIMESTAMP(:11, \'YYYY-MM-DD HH24:MI:SS\'), TO_TIMESTAMP(:12, \'YYYY-MM-DD HH24:MI:SS\'))"""
-        
-        try:
-            self.cursor.executemany(insert_sql, data_rows)
-            self.connection.commit()
-            logger.info(f"✅ Inserted {len(data_rows)} style price records")
-            
-            # Execute merge procedure immediately after insert
-            logger.info("Executing merge for STYLE_PRICES...")
-            self.merge_single_table('STYLE_PRICES')
-            
-        except Exception as e:
-            self.connection.rollback()
-            logger.exception(f"❌ Error merging style price data: {e}")
-            raise
+        return self.insert('style_prices', data_rows, conn=conn, commit=commit)
 
-    def insert_accessories(self, data_rows):
+    def insert_accessories(self, data_rows, conn=None, commit=True):
         """
         Insert accessory data into STG_STELLAR_ACCESSORIES table.
         All 19 columns.
         
         Args:
-            data_rows: List of tuples containing accessory data
+            data_rows: List of tuples (or a pandas DataFrame) containing accessory data
+            conn: Optional pooled connection to load on (defaults to the main connection)
+            commit: Commit after the insert; when False the rows stay in the
+                    open transaction until finalize()
         """
-        if not data_rows:
-            logger.info("No accessory data to process")
-            return
-        
-        insert_sql = """
-        INSERT INTO STG_STELLAR_ACCESSORIES (ID, LOCATION_ID, ACCESSORY_NAME, POSITION_ORDER, FRONTEND_POSITION,
-                    SHORT_NAME, ABBREVIATION, IMAGE_URL, PRICE, DEPOSIT_AMOUNT,
-                    TAX_EXEMPT, MAX_OVERLAPPING_RENTALS, FRONTEND_QTY_LIMIT,
-                    USE_STRIPED_BACKGROUND, BACKEND_AVAILABLE_DAYS, FRONTEND_AVAILABLE_DAYS,
-                    MAX_SAME_DEPARTURES, CREATED_AT, UPDATED_AT)
-            VALUES (:1, :2, :3, :4, :5, :6, :7, :8, :9, :10, :11, :12, :13, :14, :15, :16, :17, TO_TIMESTAMP(:18, 'YYYY-MM-DD HH24:MI:SS'), TO_TIMESTAMP(:19, 'YYYY-MM-DD HH24:MI:SS'))"""
-        
-        try:
-            self.cursor.executemany(insert_sql, data_rows)
-            self.connection.commit()
-            logger.info(f"✅ Inserted {len(data_rows)} accessory records")
-        except Exception as e:
-            self.connection.rollback()
-            logger.exception(f"❌ Error merging accessory data: {e}")
-            raise
+        return self.insert('accessories', data_rows, conn=conn, commit=commit)
 
-    def insert_accessory_options(self, data_rows):
+    def insert_accessory_options(self, data_rows, conn=None, commit=True):
         """
         Insert accessory option data into STG_STELLAR_ACCESSORY_OPTIONS table.
         CSV 'value' → DB 'VALUE_TEXT', CSV 'use_striped_background' → DB 'USE_STRIPED_BACKGROUND'
         
         Args:
-            data_rows: List of tuples containing accessory option data (6 fields)
+            data_rows: List of tuples (or a pandas DataFrame) containing accessory option data (6 fields)
+            conn: Optional pooled connection to load on (defaults to the main connection)
+            commit: Commit after the insert; when False the rows stay in the
+                    open transaction until finalize()
         """
-        if not data_rows:
-            logger.info("No accessory option data to process")
-            return
-        
-        insert_sql = """
-        INSERT INTO STG_STELLAR_ACCESSORY_OPTIONS (ID, ACCESSORY_ID, VALUE_TEXT, USE_STRIPED_BACKGROUND,
-                    CREATED_AT, UPDATED_AT)
-            VALUES (:1, :2, :3, :4, TO_TIMESTAMP(:5, 'YYYY-MM-DD HH24:MI:SS'), TO_TIMESTAMP(:6, 'YYYY-MM-DD HH24:MI:SS'))"""
-        
-        try:
-            self.cursor.executemany(insert_sql, data_rows)
-            self.connection.commit()
-            logger.info(f"✅ Inserted {len(data_rows)} accessory option records")
-        except Exception as e:
-            self.connection.rollback()
-            logger.exception(f"❌ Error merging accessory option data: {e}")
-            raise
+        return self.insert('accessory_options', data_rows, conn=conn, commit=commit)
 
-    def insert_accessory_tiers(self, data_rows):
+    def insert_accessory_tiers(self, data_rows, conn=None, commit=True):
         """
         Insert accessory tier data into STG_STELLAR_ACCESSORY_TIERS table.
         8 columns: ID, ACCESSORY_ID, MIN_HOURS, MAX_HOURS, PRICE, ACCESSORY_OPTION_ID, CREATED_AT, UPDATED_AT
         
         Args:
-            data_rows: List of tuples containing accessory tier data (8 fields)
+            data_rows: List of tuples (or a pandas DataFrame) containing accessory tier data (8 fields)
+            conn: Optional pooled connection to load on (defaults to the main connection)
+            commit: Commit after the insert; when False the rows stay in the
+                    open transaction until finalize()
         """
-        if not data_rows:
-            logger.info("No accessory tier data to process")
-            return
-        
-        insert_sql = """
-        INSERT INTO STG_STELLAR_ACCESSORY_TIERS (ID, ACCESSORY_ID, MIN_HOURS, MAX_HOURS, PRICE, ACCESSORY_OPTION_ID,
-                    CREATED_AT, UPDATED_AT)
-            VALUES (:1, :2, :3, :4, :5, :6, TO_TIMESTAMP(:7, 'YYYY-MM-DD HH24:MI:SS'), TO_TIMESTAMP(:8, 'YYYY-MM-DD HH24:MI:SS'))"""
-        
-        try:
-            self.cursor.executemany(insert_sql, data_rows)
-            self.connection.commit()
-            logger.info(f"✅ Inserted {len(data_rows)} accessory tier records")
-        except Exception as e:
-            self.connection.rollback()
-            logger.exception(f"❌ Error merging accessory tier data: {e}")
-            raise
+        return self.insert('accessory_tiers', data_rows, conn=conn, commit=commit)
 
-    def insert_booking_accessories(self, data_rows):
+    def insert_booking_accessories(self, data_rows, conn=None, commit=True):
         """
         Insert booking accessory data into STG_STELLAR_BOOKING_ACCESSORIES table.
         Uses composite key (BOOKING_ID + ACCESSORY_ID) - no ID column.
         
         Args:
-            data_rows: List of tuples containing booking accessory data (8 columns)
+            data_rows: List of tuples (or a pandas DataFrame) containing booking accessory data (8 columns)
+            conn: Optional pooled connection to load on (defaults to the main connection)
+            commit: Commit after the insert; when False the rows stay in the
+                    open transaction until finalize()
         """
-        if not data_rows:
-            logger.info("No booking accessory data to process")
-            return
-        
-        insert_sql = """
-        INSERT INTO STG_STELLAR_BOOKING_ACCESSORIES (BOOKING_ID, ACCESSORY_ID, QTY, PRICE, PRICE_OVERRIDE,
-                    ACCESSORY_OPTION_ID, CREATED_AT, UPDATED_AT)
-            VALUES (:1, :2, :3, :4, :5, :6, TO_TIMESTAMP(:7, \'YYYY-MM-DD HH24:MI:SS\'), TO_TIMESTAMP(:8, \'YYYY-MM-DD HH24:MI:SS\'))"""
-        
-        try:
-            self.cursor.executemany(insert_sql, data_rows)
-            self.connection.commit()
-            logger.info(f"✅ Inserted {len(data_rows)} booking accessory records")
-        except Exception as e:
-            self.connection.rollback()
-            logger.exception(f"❌ Error merging booking accessory data: {e}")
-            raise
+        return self.insert('booking_accessories', data_rows, conn=conn, commit=commit)
 
-    def insert_club_tiers(self, data_rows):
+    def insert_club_tiers(self, data_rows, conn=None, commit=True):
         """
         Insert club tier data into STG_STELLAR_CLUB_TIERS table.
         Complete 28-column membership tier structure.
         
         Args:
-            data_rows: List of tuples containing club tier data (28 columns)
+            data_rows: List of tuples (or a pandas DataFrame) containing club tier data (28 columns)
+            conn: Optional pooled connection to load on (defaults to the main connection)
+            commit: Commit after the insert; when False the rows stay in the
+                    open transaction until finalize()
         """
-        if not data_rows:
-            logger.info("No club tier data to process")
-            return
-        
-        insert_sql = """
-        INSERT INTO STG_STELLAR_CLUB_TIERS (ID, LOCATION_ID, TIER_NAME, FRONTEND_DISPLAY, FRONTEND_NAME,
-                    FRONTEND_POSITION, TERM_LENGTH, TERM_LENGTH_TYPE, TERM_AUTO_RENEW,
-                    TERM_FEE, PERIOD_LENGTH, PERIOD_LENGTH_TYPE, CREDITS_PER_PERIOD,
-                    HOURS_PER_CREDIT, PERIOD_FEE, FRONTEND_DISPLAY_PRICING, NO_SHOW_FEE,
-                    ALLOW_SELF_CANCELLATIONS, CANCELLATION_FEE, APPLICATION_FEE,
-                    BOAT_DAMAGE_RESPONSIBILITY_DEDUCTION, MAX_PENDING_WAIT_LIST_ENTRIES,
-                    FREE_ACCESSORIES, DESCRIPTION_TEXT, TERMS_TEXT, STATUS_TIER,
-                    CREATED_AT, UPDATED_AT)
-            VALUES (:1, :2, :3, :4, :5, :6, :7, :8, :9, :10, :11, :12, :13, :14, :15, :16, :17, :18, :19, :20, :21, :22, :23, :24, :25, :26, TO_TIMESTAMP(:27, \'YYYY-MM-DD HH24:MI:SS\'), TO_TIMESTAMP(:28, \'YYYY-MM-DD HH24:MI:SS\'))"""
-        
-        try:
-            self.cursor.executemany(insert_sql, data_rows)
-            self.connection.commit()
-            logger.info(f"✅ Inserted {len(data_rows)} club tier records")
-        except Exception as e:
-            self.connection.rollback()
-            logger.exception(f"❌ Error merging club tier data: {e}")
-            raise
+        return self.insert('club_tiers', data_rows, conn=conn, commit=commit)
 
-    def insert_coupons(self, data_rows):
+    def insert_coupons(self, data_rows, conn=None, commit=True):
         """
         Insert coupon data into STG_STELLAR_COUPONS table.
         Discount coupon management - 30 columns.
         
         Args:
-            data_rows: List of tuples containing coupon data (30 columns)
+            data_rows: List of tuples (or a pandas DataFrame) containing coupon data (30 columns)
+            conn: Optional pooled connection to load on (defaults to the main connection)
+            commit: Commit after the insert; when False the rows stay in the
+                    open transaction until finalize()
         """
-        if not data_rows:
-            logger.info("No coupon data to process")
-            return
-        
-        insert_sql = """
-        INSERT INTO STG_STELLAR_COUPONS (ID, LOCATION_ID, CODE, COUPON_NAME, COUPON_TYPE, COUPON_AMOUNT,
-                    COUNT_ALLOWED, COUNT_ALLOWED_DAILY, COUNT_USED, RENTAL_START,
-                    RENTAL_END, COUPON_START, COUPON_END, MIN_DEPARTURE_TIME,
-                    MAX_DEPARTURE_TIME, MIN_RETURN_TIME, MAX_RETURN_TIME, MIN_HOURS,
-                    MAX_HOURS, MIN_HOURS_BEFORE_DEPARTURE, MAX_HOURS_BEFORE_DEPARTURE,
-                    MAX_SAME_DAY_PER_CUSTOMER, MAX_ACTIVE_PER_CUSTOMER,
-                    DISABLE_CONSECUTIVE_PER_CUSTOMER, STATUS_COUPON, VALID_DAYS,
-                    HOLIDAYS_ONLY_IF_VALID_DAY, VALID_STYLES, CREATED_AT, UPDATED_AT)
-            VALUES (:1, :2, :3, :4, :5, :6, :7, :8, :9, TO_DATE(:10, 'YYYY-MM-DD'), TO_DATE(:11, 'YYYY-MM-DD'), TO_DATE(:12, 'YYYY-MM-DD'), TO_DATE(:13, 'YYYY-MM-DD'), :14, :15, :16, :17, :18, :19, :20, :21, :22, :23, :24, :25, :26, :27, :28, TO_TIMESTAMP(:29, 'YYYY-MM-DD HH24:MI:SS'), TO_TIMESTAMP(:30, 'YYYY-MM-DD HH24:MI:SS'))"""
-        
-        try:
-            self.cursor.executemany(insert_sql, data_rows)
-            self.connection.commit()
-            logger.info(f"✅ Inserted {len(data_rows)} coupon records")
-        except Exception as e:
-            self.connection.rollback()
-            logger.exception(f"❌ Error merging coupon data: {e}")
-            raise
+        return self.insert('coupons', data_rows, conn=conn, commit=commit)
 
-    def insert_pos_items(self, data_rows):
+    def insert_pos_items(self, data_rows, conn=None, commit=True):
         """
         Insert POS item data into STG_STELLAR_POS_ITEMS table.
         Point of sale inventory items - 9 columns.
         
         Args:
-            data_rows: List of tuples containing POS item data (9 columns)
+            data_rows: List of tuples (or a pandas DataFrame) containing POS item data (9 columns)
+            conn: Optional pooled connection to load on (defaults to the main connection)
+            commit: Commit and run the merge procedure right after the
+                    insert; when False the rows stay in the open
+                    transaction and the merge runs in finalize()
         """
-        if not data_rows:
-            logger.info("No POS item data to process")
-            return
-        
-        insert_sql = """
-        INSERT INTO STG_STELLAR_POS_ITEMS (ID, LOCATION_ID, SKU, ITEM_NAME, COST, PRICE,
-                    TAX_EXEMPT, CREATED_AT, UPDATED_AT)
-            VALUES (:1, :2, :3, :4, :5, :6, :7, TO_TIMESTAMP(:8, \'YYYY-MM-DD HH24:MI:SS\'), TO_TIMESTAMP(:9, \'YYYY-MM-DD HH24:MI:SS\'))"""
-        
-        try:
-            self.cursor.executemany(insert_sql, data_rows)
-            self.connection.commit()
-            logger.info(f"✅ Inserted {len(data_rows)} POS item records")
-            
-            # Execute merge procedure immediately after insert
-            logger.info("Executing merge for POS_ITEMS...")
-            self.merge_single_table('POS_ITEMS')
-            
-        except Exception as e:
-            self.connection.rollback()
-            logger.exception(f"❌ Error merging POS item data: {e}")
-            raise
+        return self.insert('pos_items', data_rows, conn=conn, commit=commit)
 
-    def insert_pos_sales(self, data_rows):
+    def insert_pos_sales(self, data_rows, conn=None, commit=True):
         """
         Insert POS sale data into STG_STELLAR_POS_SALES table.
         Point of sale transactions - 11 columns.
         
         Args:
-            data_rows: List of tuples containing POS sale data (11 columns)
+            data_rows: List of tuples (or a pandas DataFrame) containing POS sale data (11 columns)
+            conn: Optional pooled connection to load on (defaults to the main connection)
+            commit: Commit and run the merge procedure right after the
+                    insert; when False the rows stay in the open
+                    transaction and the merge runs in finalize()
         """
-        if not data_rows:
-            logger.info("No POS sale data to process")
-            return
-        
-        insert_sql = """
-        INSERT INTO STG_STELLAR_POS_SALES (ID, LOCATION_ID, ADMIN_ID, CUSTOMER_NAME, SUB_TOTAL, TAX_1,
-                    GRAND_TOTAL, AMOUNT_PAID, CREATED_AT, UPDATED_AT, DELETED_AT)
-            VALUES (:1, :2, :3, :4, :5, :6, :7, :8, TO_TIMESTAMP(:9, \'YYYY-MM-DD HH24:MI:SS\'), TO_TIMESTAMP(:10, \'YYYY-MM-DD HH24:MI:SS\'), TO_TIMESTAMP(:11, \'YYYY-MM-DD HH24:MI:SS\'))"""
-        
-        try:
-            self.cursor.executemany(insert_sql, data_rows)
-            self.connection.commit()
-            logger.info(f"✅ Inserted {len(data_rows)} POS sale records")
-            
-            # Execute merge procedure immediately after insert
-            logger.info("Executing merge for POS_SALES...")
-            self.merge_single_table('POS_SALES')
-            
-        except Exception as e:
-            self.connection.rollback()
-            logger.exception(f"❌ Error merging POS sale data: {e}")
-            raise
+        return self.insert('pos_sales', data_rows, conn=conn, commit=commit)
 
-    def insert_fuel_sales(self, data_rows):
+    def insert_fuel_sales(self, data_rows, conn=None, commit=True):
         """
         Insert fuel sale data into STG_STELLAR_FUEL_SALES table.
         Fuel sales transactions - 14 columns.
         
         Args:
-            data_rows: List of tuples containing fuel sale data (14 columns)
+            data_rows: List of tuples (or a pandas DataFrame) containing fuel sale data (14 columns)
+            conn: Optional pooled connection to load on (defaults to the main connection)
+            commit: Commit after the insert; when False the rows stay in the
+                    open transaction until finalize()
         """
-        if not data_rows:
-            logger.info("No fuel sale data to process")
-            return
-        
-        insert_sql = """
-        INSERT INTO STG_STELLAR_FUEL_SALES (ID, LOCATION_ID, ADMIN_ID, CUSTOMER_NAME, FUEL_TYPE, QTY,
-                    PRICE, SUB_TOTAL, TIP, GRAND_TOTAL, AMOUNT_PAID,
-                    CREATED_AT, UPDATED_AT, DELETED_AT)
-            VALUES (:1, :2, :3, :4, :5, :6, :7, :8, :9, :10, :11, TO_TIMESTAMP(:12, \'YYYY-MM-DD HH24:MI:SS\'), TO_TIMESTAMP(:13, \'YYYY-MM-DD HH24:MI:SS\'), TO_TIMESTAMP(:14, \'YYYY-MM-DD HH24:MI:SS\'))"""
-        
-        try:
-            self.cursor.executemany(insert_sql, data_rows)
-            self.connection.commit()
-            logger.info(f"✅ Inserted {len(data_rows)} fuel sale records")
-        except Exception as e:
-            self.connection.rollback()
-            logger.exception(f"❌ Error merging fuel sale data: {e}")
-            raise
+        return self.insert('fuel_sales', data_rows, conn=conn, commit=commit)
 
-    def insert_waitlists(self, data_rows):
+    def insert_waitlists(self, data_rows, conn=None, commit=True):
         """
         Insert waitlist data into STG_STELLAR_WAITLISTS table.
         Customer waitlists for boat reservations - 18 columns.
         
         Args:
-            data_rows: List of tuples containing waitlist data (18 columns)
+            data_rows: List of tuples (or a pandas DataFrame) containing waitlist data (18 columns)
+            conn: Optional pooled connection to load on (defaults to the main connection)
+            commit: Commit after the insert; when False the rows stay in the
+                    open transaction until finalize()
         """
-        if not data_rows:
-            logger.info("No waitlist data to process")
-            return
-        
-        insert_sql = """
-        INSERT INTO STG_STELLAR_WAITLISTS (ID, LOCATION_ID, CATEGORY_ID, STYLE_ID, CUSTOMER_ID, TIME_ID,
-                    TIMEFRAME_ID, FIRST_NAME, LAST_NAME, EMAIL, PHONE, DEPARTURE_DATE,
-                    LENGTH_REQUESTED, WAIT_LIST_TIME, FULFILLED, FULFILLED_DATE,
-                    CREATED_AT, UPDATED_AT)
-            VALUES (:1, :2, :3, :4, :5, :6, :7, :8, :9, :10, :11, TO_DATE(:12, 'YYYY-MM-DD'), :13, :14, :15, TO_DATE(:16, 'YYYY-MM-DD'), TO_TIMESTAMP(:17, 'YYYY-MM-DD HH24:MI:SS'), TO_TIMESTAMP(:18, 'YYYY-MM-DD HH24:MI:SS'))"""
-        
-        try:
-            self.cursor.executemany(insert_sql, data_rows)
-            self.connection.commit()
-            logger.info(f"✅ Inserted {len(data_rows)} waitlist records")
-        except Exception as e:
-            self.connection.rollback()
-            logger.exception(f"❌ Error merging waitlist data: {e}")
-            raise
+        return self.insert('waitlists', data_rows, conn=conn, commit=commit)
 
-    def insert_closed_dates(self, data_rows):
+    def insert_closed_dates(self, data_rows, conn=None, commit=True):
         """
         Insert closed date data into STG_STELLAR_CLOSED_DATES table.
         Business closure dates - 9 columns.
         
         Args:
-            data_rows: List of tuples containing closed date data (9 columns)
+            data_rows: List of tuples (or a pandas DataFrame) containing closed date data (9 columns)
+            conn: Optional pooled connection to load on (defaults to the main connection)
+            commit: Commit after the insert; when False the rows stay in the
+                    open transaction until finalize()
         """
-        if not data_rows:
-            logger.info("No closed date data to process")
-            return
-        
-        insert_sql = """
-        INSERT INTO STG_STELLAR_CLOSED_DATES (ID, LOCATION_ID, CLOSED_DATE, ALLOW_BACKEND_DEPARTURES,
-                    ALLOW_BACKEND_RETURNS, ALLOW_FRONTEND_DEPARTURES,
-                    ALLOW_FRONTEND_RETURNS, CREATED_AT, UPDATED_AT)
-            VALUES (:1, :2, TO_DATE(:3, \'YYYY-MM-DD\'), :4, :5, :6, :7, TO_TIMESTAMP(:8, \'YYYY-MM-DD HH24:MI:SS\'), TO_TIMESTAMP(:9, \'YYYY-MM-DD HH24:MI:SS\'))"""
-        
-        try:
-            self.cursor.executemany(insert_sql, data_rows)
-            self.connection.commit()
-            logger.info(f"✅ Inserted {len(data_rows)} closed date records")
-        except Exception as e:
-            self.connection.rollback()
-            logger.exception(f"❌ Error merging closed date data: {e}")
-            raise
+        return self.insert('closed_dates', data_rows, conn=conn, commit=commit)
 
-    def insert_holidays(self, data_rows):
+    def insert_holidays(self, data_rows, conn=None, commit=True):
         """
         Insert holiday data into STG_STELLAR_HOLIDAYS table.
         Table has NO ID column - uses composite key (LOCATION_ID + HOLIDAY_DATE)
         
         Args:
-            data_rows: List of tuples containing holiday data (2 fields: location_id, holiday_date)
+            data_rows: List of tuples (or a pandas DataFrame) containing holiday data (2 fields: location_id, holiday_date)
+            conn: Optional pooled connection to load on (defaults to the main connection)
+            commit: Commit after the insert; when False the rows stay in the
+                    open transaction until finalize()
         """
-        if not data_rows:
-            logger.info("No holiday data to process")
-            return
-        
-        insert_sql = """
-        INSERT INTO STG_STELLAR_HOLIDAYS (LOCATION_ID, HOLIDAY_DATE)
-            VALUES (:1, TO_DATE(:2, 'YYYY-MM-DD'))"""
-        
-        try:
-            self.cursor.executemany(insert_sql, data_rows)
-            self.connection.commit()
-            logger.info(f"✅ Inserted {len(data_rows)} holiday records")
-        except Exception as e:
-            self.connection.rollback()
-            logger.exception(f"❌ Error merging holiday data: {e}")
-            raise
+        return self.insert('holidays', data_rows, conn=conn, commit=commit)
 
-    def insert_blacklists(self, data_rows):
+    def insert_blacklists(self, data_rows, conn=None, commit=True):
         """
         Insert blacklist data into STG_STELLAR_BLACKLISTS table.
         Customer restriction list - 11 columns (note: missing UPDATED_AT in schema, has 10 total).
         
         Args:
-            data_rows: List of tuples containing blacklist data (10 columns)
+            data_rows: List of tuples (or a pandas DataFrame) containing blacklist data (10 columns)
+            conn: Optional pooled connection to load on (defaults to the main connection)
+            commit: Commit after the insert; when False the rows stay in the
+                    open transaction until finalize()
         """
-        if not data_rows:
-            logger.info("No blacklist data to process")
-            return
-        
-        insert_sql = """
-        INSERT INTO STG_STELLAR_BLACKLISTS (ID, LOCATION_ID, FIRST_NAME, LAST_NAME, PHONE, CELL,
-                    EMAIL, DL_NUMBER, NOTES, CREATED_AT)
-            VALUES (:1, :2, :3, :4, :5, :6, :7, :8, :9, TO_TIMESTAMP(:10, \'YYYY-MM-DD HH24:MI:SS\'))"""
-        
-        try:
-            self.cursor.executemany(insert_sql, data_rows)
-            self.connection.commit()
-            logger.info(f"✅ Inserted {len(data_rows)} blacklist records")
-        except Exception as e:
-            self.connection.rollback()
-            logger.exception(f"❌ Error merging blacklist data: {e}")
-            raise
-            self.connection.rollback()
-            logger.exception(f"❌ Error merging blacklist data: {e}")
-            raise
+        return self.insert('blacklists', data_rows, conn=conn, commit=commit)
 
-    def insert_categories(self, data_rows):
+    def insert_categories(self, data_rows, conn=None, commit=True):
         """
         Insert category data into STG_STELLAR_CATEGORIES table.
         All 15 columns, CSV 'description' → DB 'DESCRIPTION_TEXT'
         
         Args:
-            data_rows: List of tuples containing category data (15 fields)
+            data_rows: List of tuples (or a pandas DataFrame) containing category data (15 fields)
+            conn: Optional pooled connection to load on (defaults to the main connection)
+            commit: Commit after the insert; when False the rows stay in the
+                    open transaction until finalize()
         """
-        if not data_rows:
-            logger.info("No category data to process")
-            return
-        
-        insert_sql = """
-        INSERT INTO STG_STELLAR_CATEGORIES (ID, LOCATION_ID, CATEGORY_NAME, 
-                    FRONTEND_DISPLAY, FRONTEND_NAME, FRONTEND_TYPE, FRONTEND_POSITION,
-                    FILTER_UNIT_TYPE_ENABLED, FILTER_UNIT_TYPE_NAME, FILTER_UNIT_TYPE_POSITION,
-                    MIN_NIGHTS_MULTI_DAY, CALENDAR_BANNER_TEXT, DESCRIPTION_TEXT,
-                    CREATED_AT, UPDATED_AT)
-            VALUES (:1, :2, :3, :4, :5, :6, :7, :8, :9, :10, :11, :12, :13, TO_TIMESTAMP(:14, \'YYYY-MM-DD HH24:MI:SS\'), TO_TIMESTAMP(:15, \'YYYY-MM-DD HH24:MI:SS\'))"""
-        
-        try:
-            self.cursor.executemany(insert_sql, data_rows)
-            self.connection.commit()
-            logger.info(f"✅ Inserted {len(data_rows)} category records")
-        except Exception as e:
-            self.connection.rollback()
-            logger.exception(f"❌ Error merging category data: {e}")
-            raise
+        return self.insert('categories', data_rows, conn=conn, commit=commit)
 
-    def insert_amenities(self, data_rows):
+    def insert_amenities(self, data_rows, conn=None, commit=True):
         """
         Insert amenity data into STG_STELLAR_AMENITIES table.
         All 16 columns.
         
         Args:
-            data_rows: List of tuples containing amenity data
+            data_rows: List of tuples (or a pandas DataFrame) containing amenity data
+            conn: Optional pooled connection to load on (defaults to the main connection)
+            commit: Commit after the insert; when False the rows stay in the
+                    open transaction until finalize()
         """
-        if not data_rows:
-            logger.info("No amenity data to process")
-            return
-        
-        insert_sql = """
-        INSERT INTO STG_STELLAR_AMENITIES (ID, LOCATION_ID, AMENITY_NAME, FRONTEND_DISPLAY, FRONTEND_NAME,
-                    FRONTEND_POSITION, FEATURED, FILTERABLE, ICON, AMENITY_TYPE,
-                    OPTIONS_TEXT, PREFIX_TEXT, SUFFIX_TEXT, DESCRIPTION_TEXT,
-                    CREATED_AT, UPDATED_AT)
-            VALUES (:1, :2, :3, :4, :5, :6, :7, :8, :9, :10, :11, :12, :13, :14, TO_TIMESTAMP(:15, \'YYYY-MM-DD HH24:MI:SS\'), TO_TIMESTAMP(:16, \'YYYY-MM-DD HH24:MI:SS\'))"""
-        
-        try:
-            self.cursor.executemany(insert_sql, data_rows)
-            self.connection.commit()
-            logger.info(f"✅ Inserted {len(data_rows)} amenity records")
-        except Exception as e:
-            self.connection.rollback()
-            logger.exception(f"❌ Error merging amenity data: {e}")
-            raise
-
-
+        return self.insert('amenities', data_rows, conn=conn, commit=commit)
@@ -897,6 +897,46 @@ CREATE TABLE STG_STELLAR_AMENITIES (
 
 );
 
+-- ====================================================================
+-- DIRECT-PATH LOADING
+-- ====================================================================
+-- NOLOGGING only affects direct-path (APPEND_VALUES) inserts, which the
+-- loader uses when it commits per table (e.g. run_all_inserts()). The
+-- Stellar S3 ETL loads every table in one transaction with conventional
+-- inserts, which generate redo either way. These tables are truncated and
+-- reloaded from S3 every run, so after a media recovery an unrecoverable
+-- staging block costs only a rerun of the load, never warehouse data.
+
+ALTER TABLE STG_STELLAR_LOCATIONS NOLOGGING;
+ALTER TABLE STG_STELLAR_CUSTOMERS NOLOGGING;
+ALTER TABLE STG_STELLAR_BOOKINGS NOLOGGING;
+ALTER TABLE STG_STELLAR_BOOKING_BOATS NOLOGGING;
+ALTER TABLE STG_STELLAR_BOOKING_PAYMENTS NOLOGGING;
+ALTER TABLE STG_STELLAR_STYLE_GROUPS NOLOGGING;
+ALTER TABLE STG_STELLAR_STYLES NOLOGGING;
+ALTER TABLE STG_STELLAR_STYLE_BOATS NOLOGGING;
+ALTER TABLE STG_STELLAR_CUSTOMER_BOATS NOLOGGING;
+ALTER TABLE STG_STELLAR_SEASONS NOLOGGING;
+ALTER TABLE STG_STELLAR_SEASON_DATES NOLOGGING;
+ALTER TABLE STG_STELLAR_STYLE_HOURLY_PRICES NOLOGGING;
+ALTER TABLE STG_STELLAR_STYLE_TIMES NOLOGGING;
+ALTER TABLE STG_STELLAR_STYLE_PRICES NOLOGGING;
+ALTER TABLE STG_STELLAR_ACCESSORIES NOLOGGING;
+ALTER TABLE STG_STELLAR_ACCESSORY_OPTIONS NOLOGGING;
+ALTER TABLE STG_STELLAR_ACCESSORY_TIERS NOLOGGING;
+ALTER TABLE STG_STELLAR_BOOKING_ACCESSORIES NOLOGGING;
+ALTER TABLE STG_STELLAR_CLUB_TIERS NOLOGGING;
+ALTER TABLE STG_STELLAR_COUPONS NOLOGGING;
+ALTER TABLE STG_STELLAR_POS_ITEMS NOLOGGING;
+ALTER TABLE STG_STELLAR_POS_SALES NOLOGGING;
+ALTER TABLE STG_STELLAR_FUEL_SALES NOLOGGING;
+ALTER TABLE STG_STELLAR_WAITLISTS NOLOGGING;
+ALTER TABLE STG_STELLAR_CLOSED_DATES NOLOGGING;
+ALTER TABLE STG_STELLAR_HOLIDAYS NOLOGGING;
+ALTER TABLE STG_STELLAR_BLACKLISTS NOLOGGING;
+ALTER TABLE STG_STELLAR_CATEGORIES NOLOGGING;
+ALTER TABLE STG_STELLAR_AMENITIES NOLOGGING;
+
 -- ====================================================================
 -- COMMENTS
 -- ====================================================================
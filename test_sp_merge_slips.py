@@ -1,16 +1,76 @@
 """
 Test sp_merge_molo_slips.sql stored procedure.
 Deploys the procedure and verifies it compiles without errors.
+
+Other procedure files can be passed on the command line; they are
+deployed and checked concurrently over a small async connection pool:
+
+    python test_sp_merge_slips.py stored_procedures/sp_merge_molo_piers.sql ...
 """
 
 import oracledb
+import asyncio
+import functools
 import json
 import os
 import sys
+from pathlib import Path
+
+DEFAULT_PROC_FILE = 'stored_procedures/sp_merge_molo_slips.sql'
+
+# Most sessions opened to deploy procedures at once; each compiles one
+# procedure at a time, so the server works on up to this many in parallel
+MAX_DEPLOY_SESSIONS = 16
+
+# Rows per fetch for the USER_ERRORS listing, which can run to hundreds of
+# rows for a broken procedure, so a full listing is fetched in one batch
+ERRORS_ARRAYSIZE = 1000
+
+# Status, compilation errors and STG_/DW_ row counts for one procedure,
+# opened as four REF CURSORs by a single block, so the queries run in one
+# execute instead of four (each cursor is still fetched separately). Table
+# names go through DBMS_ASSERT and a missing table yields a NULL count
+# rather than failing the block.
+PROCEDURE_DETAILS_BLOCK = """
+    BEGIN
+        OPEN :status_cursor FOR
+            SELECT OBJECT_NAME, STATUS, OBJECT_TYPE
+            FROM USER_OBJECTS
+            WHERE OBJECT_NAME = :proc_name
+            AND OBJECT_TYPE = 'PROCEDURE';
+        OPEN :errors_cursor FOR
+            SELECT LINE, POSITION, TEXT
+            FROM USER_ERRORS
+            WHERE NAME = :proc_name
+            AND TYPE = 'PROCEDURE'
+            ORDER BY SEQUENCE;
+        BEGIN
+            OPEN :stg_count_cursor FOR
+                'SELECT COUNT(*) FROM ' || DBMS_ASSERT.SIMPLE_SQL_NAME(:stg_table);
+        EXCEPTION WHEN OTHERS THEN
+            OPEN :stg_count_cursor FOR SELECT CAST(NULL AS NUMBER) FROM DUAL;
+        END;
+        BEGIN
+            OPEN :dw_count_cursor FOR
+                'SELECT COUNT(*) FROM ' || DBMS_ASSERT.SIMPLE_SQL_NAME(:dw_table);
+        EXCEPTION WHEN OTHERS THEN
+            OPEN :dw_count_cursor FOR SELECT CAST(NULL AS NUMBER) FROM DUAL;
+        END;
+    END;
+"""
 
 
 def setup_oracle_wallet():
-    """Set up Oracle wallet environment for Autonomous Database."""
+    """
+    Locate the Autonomous Database wallet.
+    
+    The connection uses python-oracledb thin mode, which reads tnsnames.ora
+    and ewallet.pem from this directory directly, so no Instant Client has
+    to be found and loaded.
+    
+    Returns:
+        Absolute path of the wallet directory
+    """
     script_dir = os.path.dirname(os.path.abspath(__file__))
     wallet_dir = os.path.join(script_dir, "wallet_demo")
     wallet_dir = os.path.abspath(wallet_dir)
@@ -18,43 +78,26 @@ def setup_oracle_wallet():
     if os.path.exists(wallet_dir):
         os.environ['TNS_ADMIN'] = wallet_dir
         print(f"✅ TNS_ADMIN set to: {wallet_dir}")
+        return wallet_dir
     else:
         print(f"❌ Wallet directory not found: {wallet_dir}")
         sys.exit(1)
 
 
-def initialize_oracle_client():
-    """Initialize Oracle Instant Client."""
-    try:
-        client_paths = [
-            "/opt/oracle/instantclient",
-            r"C:\oracle\instantclient_21_3",
-            r"C:\oracle\instantclient"
-        ]
-        
-        for path in client_paths:
-            if os.path.exists(path):
-                oracledb.init_oracle_client(lib_dir=path)
-                print(f"✅ Oracle Instant Client initialized from: {path}")
-                return
-        
-        oracledb.init_oracle_client()
-    except Exception as e:
-        print(f"⚠️  Oracle client already initialized: {e}")
-
-
-def load_config():
-    """Load database configuration."""
-    with open('config.json', 'r') as f:
+@functools.lru_cache(maxsize=1)
+def load_config(path='config.json'):
+    """Load database configuration (read and parsed once per process; do not mutate)."""
+    with open(path, 'r') as f:
         return json.load(f)
 
 
-def deploy_stored_procedure(cursor, proc_file):
-    """Deploy stored procedure from SQL file."""
-    print(f"\n{'='*80}")
-    print(f"Deploying: {proc_file}")
-    print(f"{'='*80}")
+async def deploy_stored_procedure(cursor, proc_file):
+    """
+    Deploy stored procedure from SQL file.
     
+    Returns:
+        None if the CREATE statement succeeded, otherwise the error it raised
+    """
     with open(proc_file, 'r') as f:
         sql = f.read()
     
@@ -64,27 +107,57 @@ def deploy_stored_procedure(cursor, proc_file):
         sql = sql[:-1]
     
     try:
-        cursor.execute(sql)
-        print("✅ Stored procedure compiled successfully!")
-        return True
+        await cursor.execute(sql)
+        return None
     except Exception as e:
-        print(f"❌ Error compiling stored procedure:")
-        print(f"   {e}")
-        return False
+        return e
 
 
-def check_procedure_status(cursor, proc_name):
-    """Check if procedure exists and its status."""
-    query = """
-        SELECT OBJECT_NAME, STATUS, OBJECT_TYPE
-        FROM USER_OBJECTS
-        WHERE OBJECT_NAME = :proc_name
-        AND OBJECT_TYPE = 'PROCEDURE'
+async def fetch_procedure_details(connection, proc_name, table_names):
     """
+    Fetch a procedure's status, compilation errors and table row counts.
     
-    cursor.execute(query, {'proc_name': proc_name})
-    result = cursor.fetchone()
+    All four queries are opened by one execution of PROCEDURE_DETAILS_BLOCK;
+    the returned REF CURSORs are then fetched one after another.
     
+    Args:
+        connection: Async connection the procedure was deployed on
+        proc_name: Upper-case procedure name
+        table_names: (staging table, target table) names to count
+        
+    Returns:
+        Tuple of (status row or None, list of error rows,
+        {table_name: row count or None})
+    """
+    stg_table, dw_table = table_names
+    with connection.cursor() as cursor, \
+            connection.cursor() as status_cursor, \
+            connection.cursor() as errors_cursor, \
+            connection.cursor() as stg_count_cursor, \
+            connection.cursor() as dw_count_cursor:
+        errors_cursor.arraysize = ERRORS_ARRAYSIZE
+        errors_cursor.prefetchrows = ERRORS_ARRAYSIZE + 1
+        await cursor.execute(PROCEDURE_DETAILS_BLOCK, {
+            'proc_name': proc_name,
+            'stg_table': stg_table,
+            'dw_table': dw_table,
+            'status_cursor': status_cursor,
+            'errors_cursor': errors_cursor,
+            'stg_count_cursor': stg_count_cursor,
+            'dw_count_cursor': dw_count_cursor,
+        })
+        status = await status_cursor.fetchone()
+        errors = await errors_cursor.fetchall()
+        counts = {}
+        for table_name, count_cursor in ((stg_table, stg_count_cursor),
+                                         (dw_table, dw_count_cursor)):
+            row = await count_cursor.fetchone()
+            counts[table_name] = row[0] if row else None
+    return status, errors, counts
+
+
+def check_procedure_status(result, proc_name):
+    """Report whether the procedure exists and its status."""
     if result:
         obj_name, status, obj_type = result
         print(f"\n📋 Procedure Status:")
@@ -103,19 +176,8 @@ def check_procedure_status(cursor, proc_name):
         return False
 
 
-def get_procedure_errors(cursor, proc_name):
-    """Get compilation errors for a procedure."""
-    query = """
-        SELECT LINE, POSITION, TEXT
-        FROM USER_ERRORS
-        WHERE NAME = :proc_name
-        AND TYPE = 'PROCEDURE'
-        ORDER BY SEQUENCE
-    """
-    
-    cursor.execute(query, {'proc_name': proc_name})
-    errors = cursor.fetchall()
-    
+def get_procedure_errors(errors, proc_name):
+    """Report compilation errors for a procedure."""
     if errors:
         print(f"\n❌ Compilation Errors for {proc_name}:")
         print("="*80)
@@ -139,87 +201,152 @@ def test_procedure_syntax(cursor):
         return False
 
 
-def count_table_rows(cursor, table_name):
-    """Count rows in a table."""
-    try:
-        cursor.execute(f"SELECT COUNT(*) FROM {table_name}")
-        count = cursor.fetchone()[0]
-        return count
-    except Exception as e:
-        print(f"⚠️  Could not count rows in {table_name}: {e}")
-        return None
+async def verify_procedure(pool, proc_file):
+    """
+    Deploy one procedure file and fetch what is needed to check it.
+    
+    The procedure name is taken from the file name (sp_merge_molo_slips.sql
+    -> SP_MERGE_MOLO_SLIPS) and its STG_/DW_ tables from the procedure name.
+    
+    Returns:
+        Tuple of (procedure name, deployment error or None,
+        fetch_procedure_details() result)
+    """
+    proc_name = Path(proc_file).stem.upper()
+    table_suffix = proc_name.replace('SP_MERGE_', '', 1)
+    table_names = (f"STG_{table_suffix}", f"DW_{table_suffix}")
+    
+    async with pool.acquire() as connection:
+        with connection.cursor() as cursor:
+            error = await deploy_stored_procedure(cursor, proc_file)
+        details = await fetch_procedure_details(connection, proc_name, table_names)
+    return proc_name, error, details
 
 
-def main():
-    """Main test function."""
+def report_procedure(proc_file, proc_name, error, details):
+    """
+    Print the deployment result for one procedure.
+    
+    Returns:
+        True if the procedure compiled without errors, False otherwise
+    """
+    status, errors, counts = details
+    
+    print(f"\n{'='*80}")
+    print(f"Deploying: {proc_file}")
+    print(f"{'='*80}")
+    
+    if error is not None:
+        print(f"❌ Error compiling stored procedure:")
+        print(f"   {error}")
+        # Check for compilation errors
+        get_procedure_errors(errors, proc_name)
+        return False
+    print("✅ Stored procedure compiled successfully!")
+    
+    # Check procedure status
+    check_procedure_status(status, proc_name)
+    
+    # Get any compilation errors even if it compiled
+    if get_procedure_errors(errors, proc_name):
+        print("\n" + "="*80)
+        print("⚠️  Procedure compiled but has warnings/errors")
+        print("="*80)
+        return False
+    
+    # Check table row counts
+    print("\n📊 Table Row Counts:")
+    for table_name, count in counts.items():
+        if count is not None:
+            print(f"   {table_name}: {count:,} rows")
+        else:
+            print(f"⚠️  Could not count rows in {table_name}")
+    
     print("\n" + "="*80)
-    print("Testing SP_MERGE_MOLO_SLIPS Stored Procedure")
+    print("✅ ALL TESTS PASSED - Stored procedure is ready to use!")
     print("="*80)
+    print("\nYou can now call it with:")
+    print(f"   EXECUTE {proc_name};")
+    print("\nOr from Python:")
+    print(f"   cursor.callproc('{proc_name}')")
+    return True
+
+
+async def deploy_all(proc_files):
+    """
+    Deploy and verify several procedure files concurrently.
     
+    Wallet setup is paid for once and each procedure is compiled on its own
+    pooled session, so the total wait is roughly that of the slowest
+    procedure rather than the sum. Results are reported in file order.
+    
+    Args:
+        proc_files: List of stored procedure SQL file paths
+        
+    Returns:
+        List of files that failed to compile cleanly
+    """
     # Setup
-    setup_oracle_wallet()
-    initialize_oracle_client()
+    wallet_dir = setup_oracle_wallet()
     config = load_config()
+    sessions = min(len(proc_files), MAX_DEPLOY_SESSIONS)
     
-    # Connect to database
+    # Connect to database (thin mode; ewallet.pem may be password protected)
     print("\n🔌 Connecting to Oracle database...")
-    connection = oracledb.connect(
+    pool = oracledb.create_pool_async(
         user=config['database']['user'],
         password=config['database']['password'],
-        dsn=config['database']['dsn']
+        dsn=config['database']['dsn'],
+        config_dir=wallet_dir,
+        wallet_location=wallet_dir,
+        wallet_password=config['database'].get(
+            'wallet_password', os.environ.get('ORACLE_WALLET_PASSWORD')
+        ),
+        min=sessions,
+        max=sessions,
+        increment=1
     )
-    cursor = connection.cursor()
-    print("✅ Connected successfully")
+    print(f"✅ Connection pool created ({sessions} sessions)")
     
     try:
-        # Deploy the procedure
-        proc_file = 'stored_procedures/sp_merge_molo_slips.sql'
-        success = deploy_stored_procedure(cursor, proc_file)
-        
-        if not success:
-            # Check for compilation errors
-            get_procedure_errors(cursor, 'SP_MERGE_MOLO_SLIPS')
-            sys.exit(1)
-        
-        # Check procedure status
-        check_procedure_status(cursor, 'SP_MERGE_MOLO_SLIPS')
-        
-        # Get any compilation errors even if it compiled
-        has_errors = get_procedure_errors(cursor, 'SP_MERGE_MOLO_SLIPS')
-        
-        if not has_errors:
-            # Check table row counts
-            print("\n📊 Table Row Counts:")
-            stg_count = count_table_rows(cursor, 'STG_MOLO_SLIPS')
-            dw_count = count_table_rows(cursor, 'DW_MOLO_SLIPS')
-            
-            if stg_count is not None:
-                print(f"   STG_MOLO_SLIPS: {stg_count:,} rows")
-            if dw_count is not None:
-                print(f"   DW_MOLO_SLIPS: {dw_count:,} rows")
-            
-            print("\n" + "="*80)
-            print("✅ ALL TESTS PASSED - Stored procedure is ready to use!")
-            print("="*80)
-            print("\nYou can now call it with:")
-            print("   EXECUTE SP_MERGE_MOLO_SLIPS;")
-            print("\nOr from Python:")
-            print("   cursor.callproc('SP_MERGE_MOLO_SLIPS')")
-        else:
-            print("\n" + "="*80)
-            print("⚠️  Procedure compiled but has warnings/errors")
-            print("="*80)
-            sys.exit(1)
-            
+        results = await asyncio.gather(
+            *(verify_procedure(pool, proc_file) for proc_file in proc_files)
+        )
+    finally:
+        await pool.close()
+        print("\n🔌 Database connection pool closed")
+    
+    failed = []
+    for proc_file, result in zip(proc_files, results):
+        if not report_procedure(proc_file, *result):
+            failed.append(proc_file)
+    return failed
+
+
+def main():
+    """Main test function."""
+    proc_files = sys.argv[1:] or [DEFAULT_PROC_FILE]
+    
+    print("\n" + "="*80)
+    if proc_files == [DEFAULT_PROC_FILE]:
+        print("Testing SP_MERGE_MOLO_SLIPS Stored Procedure")
+    else:
+        print(f"Testing {len(proc_files)} Stored Procedures")
+    print("="*80)
+    
+    try:
+        failed = asyncio.run(deploy_all(proc_files))
     except Exception as e:
         print(f"\n❌ Test failed with error: {e}")
         import traceback
         traceback.print_exc()
         sys.exit(1)
-    finally:
-        cursor.close()
-        connection.close()
-        print("\n🔌 Database connection closed")
+    
+    if failed:
+        print(f"\n❌ {len(failed)} of {len(proc_files)} procedures failed:")
+        for proc_file in failed:
+            print(f"   {proc_file}")
+        sys.exit(1)
 
 
 if __name__ == "__main__":
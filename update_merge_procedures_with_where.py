@@ -6,149 +6,402 @@ update records when data has actually changed. This prevents:
 1. Unnecessary UPDATE operations when data is identical
 2. Spurious DW_LAST_UPDATED timestamp changes
 3. Reduced write load on the database
+
+The NULL substitute for each column is chosen from its declared type in the
+DW table DDL under tables/; columns not found there fall back to guessing
+from the column name.
 """
 
 import re
 import os
+import json
+import mmap
+import hashlib
+import shutil
+import string
+import tempfile
+import functools
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
-def generate_where_clause_for_columns(columns):
+# DDL files declaring the DW tables that the MERGE procedures write to
+TABLE_DDL_FILES = (
+    'tables/oracle_molo_business_tables.sql',
+    'tables/oracle_stellar_business_tables.sql',
+)
+
+# Side file recording the SHA-256 of every procedure file found to need no
+# change, so unchanged files are skipped on later runs; it is discarded
+# whenever this script itself changes
+HASH_CACHE_FILE = '.merge_where_cache.json'
+
+# Files smaller than this cannot hold a complete MERGE procedure and are
+# skipped without being mapped
+MIN_MERGE_FILE_SIZE = 200
+
+# Files under this size are handed to workers in batches; larger ones are
+# sent one at a time, first, so no batch is held up behind a big file
+SMALL_FILE_SIZE = 4096
+
+# Uppercases ASCII letters only, so offsets into the result match the original
+ASCII_UPPER = str.maketrans(string.ascii_lowercase, string.ascii_uppercase)
+
+# Patterns used for every file, compiled once at import
+EXISTING_TGT_WHERE_PATTERN = re.compile(
+    r'tgt\.DW_LAST_UPDATED\s*=\s*SYSTIMESTAMP\s+WHERE\s+', re.IGNORECASE
+)
+EXISTING_WHERE_PATTERN = re.compile(
+    r'DW_LAST_UPDATED\s*=\s*SYSTIMESTAMP\s+WHERE\s+', re.IGNORECASE
+)
+WHERE_INSERT_POINT_PATTERN = re.compile(
+    r'(tgt\.DW_LAST_UPDATED\s*=\s*SYSTIMESTAMP)\s*\n', re.IGNORECASE
+)
+# Start of an UPDATE SET assignment (section start, line start or after a
+# comma): either a line comment, or tgt.<column> = with the column captured
+ASSIGNED_COLUMN_PATTERN = re.compile(
+    r'(?:^|,)\s*(?:--[^\n]*|tgt\.(\w+)\s*=)', re.MULTILINE
+)
+
+# Column-name keywords (matched as substrings of the uppercased name) that
+# pick the NULL substitute in generate_where_clause_for_columns()
+AUDIT_COLUMNS = frozenset(('DW_LAST_UPDATED', 'DW_LAST_INSERTED'))
+TIMESTAMP_KEYWORD_PATTERN = re.compile('DATE|TIME|TIMESTAMP')
+NUMERIC_KEYWORD_PATTERN = re.compile(
+    '_ID|COUNT|NUMBER|AMOUNT|QUANTITY|PRICE|FEE|TAX|RATE|MINUTES|HOURS|DAYS|CAP'
+)
+DECIMAL_KEYWORD_PATTERN = re.compile('FLOAT|DECIMAL')
+DECIMAL_COLUMNS = frozenset(('TAX', 'PRICE', 'FEE', 'AMOUNT'))
+
+CREATE_TABLE_PATTERN = re.compile(r'CREATE\s+TABLE\s+(\w+)\s*\((.*?)\n\s*\)\s*;', re.DOTALL | re.IGNORECASE)
+COLUMN_DEFINITION_PATTERN = re.compile(
+    r'^\s*(\w+)\s+([A-Z_][A-Z0-9_]*)\s*(?:\(\s*\d+\s*(?:,\s*(\d+)\s*)?\))?',
+    re.IGNORECASE
+)
+MERGE_TARGET_PATTERN = re.compile(r'MERGE\s+INTO\s+(\w+)', re.IGNORECASE)
+# Any-case MERGE INTO on the raw file bytes, used when the capitalised
+# form is not found
+MERGE_INTO_BYTES_PATTERN = re.compile(rb'MERGE INTO', re.IGNORECASE)
+
+# NULL substitutes by kind of column
+TIMESTAMP_NULL = "TO_TIMESTAMP('1900-01-01', 'YYYY-MM-DD')"
+DECIMAL_NULL = "-999999"
+INTEGER_NULL = "-1"
+STRING_NULL = "'~'"
+
+# Change-detection condition for each NULL substitute, built once so the
+# per-column loop only fills in the column name
+CONDITION_TEMPLATES = {
+    null_value: f"NVL(tgt.{{c}}, {null_value}) != NVL(src.{{c}}, {null_value})"
+    for null_value in (TIMESTAMP_NULL, DECIMAL_NULL, INTEGER_NULL, STRING_NULL)
+}
+
+NUMERIC_TYPES = frozenset(('NUMBER', 'INTEGER', 'INT', 'SMALLINT'))
+FLOAT_TYPES = frozenset(('FLOAT', 'BINARY_FLOAT', 'BINARY_DOUBLE'))
+STRING_TYPES = frozenset(('VARCHAR2', 'NVARCHAR2', 'CHAR', 'NCHAR', 'CLOB', 'NCLOB'))
+
+# NULL substitute by declared type, so classifying a column is one lookup
+# (COLUMN_DEFINITION_PATTERN captures TIMESTAMP(6) and TIMESTAMP WITH TIME
+# ZONE as TIMESTAMP); scaled NUMBER columns are decimals
+TYPE_NULL_VALUES = {
+    'DATE': TIMESTAMP_NULL,
+    'TIMESTAMP': TIMESTAMP_NULL,
+    **dict.fromkeys(FLOAT_TYPES, DECIMAL_NULL),
+    **dict.fromkeys(NUMERIC_TYPES, INTEGER_NULL),
+    **dict.fromkeys(STRING_TYPES, STRING_NULL),
+}
+
+def load_column_types(ddl_files):
+    """
+    Read column data types from CREATE TABLE statements.
+    
+    Args:
+        ddl_files: Paths of DDL files to read (missing files are skipped)
+        
+    Returns:
+        Dict of table name -> {column name: (data type, scale or None)}
+    """
+    tables = {}
+    for ddl_file in ddl_files:
+        path = Path(ddl_file)
+        if not path.exists():
+            continue
+        ddl = path.read_text(encoding='utf-8')
+        for table_name, body in CREATE_TABLE_PATTERN.findall(ddl):
+            columns = {}
+            for line in body.split('\n'):
+                match = COLUMN_DEFINITION_PATTERN.match(line)
+                if match:
+                    column, data_type, scale = match.groups()
+                    columns[column.upper()] = (
+                        data_type.upper(), int(scale) if scale else None
+                    )
+            tables[table_name.upper()] = columns
+    return tables
+
+def null_value_for_type(data_type, scale):
+    """Return the NULL substitute for a declared column type, or None if unknown."""
+    if scale and data_type in NUMERIC_TYPES:
+        return DECIMAL_NULL
+    return TYPE_NULL_VALUES.get(data_type)
+
+@functools.lru_cache(maxsize=None)
+def null_value_for_name(upper_name):
+    """Guess the NULL substitute from a column name (cached; names recur across files)."""
+    if TIMESTAMP_KEYWORD_PATTERN.search(upper_name):
+        return TIMESTAMP_NULL
+    if NUMERIC_KEYWORD_PATTERN.search(upper_name):
+        if DECIMAL_KEYWORD_PATTERN.search(upper_name) or upper_name in DECIMAL_COLUMNS:
+            return DECIMAL_NULL
+        return INTEGER_NULL
+    return STRING_NULL
+
+def generate_where_clause_for_columns(columns, column_types=None):
     """
     Generate WHERE clause conditions for all columns in the UPDATE.
     
     Args:
         columns: List of column names from the UPDATE SET clause
+        column_types: Optional {column name: (data type, scale)} for the
+                      target table (see load_column_types)
         
     Returns:
         String containing the WHERE clause with NVL comparisons
     """
     where_conditions = []
+    column_types = column_types or {}
     
     for col in columns:
         col_name = col.strip()
-        if col_name in ['DW_LAST_UPDATED', 'DW_LAST_INSERTED']:
+        if col_name in AUDIT_COLUMNS:
             continue  # Skip audit columns
-            
-        # Determine appropriate NULL substitute based on column name patterns
-        if any(x in col_name.upper() for x in ['DATE', 'TIME', 'TIMESTAMP']):
-            # Timestamp columns
-            null_value = "TO_TIMESTAMP('1900-01-01', 'YYYY-MM-DD')"
-            condition = f"NVL(tgt.{col_name}, {null_value}) != NVL(src.{col_name}, {null_value})"
-        elif any(x in col_name.upper() for x in ['_ID', 'COUNT', 'NUMBER', 'AMOUNT', 'QUANTITY', 'PRICE', 'FEE', 'TAX', 'RATE', 'MINUTES', 'HOURS', 'DAYS', 'CAP']):
-            # Numeric/ID columns
-            if 'FLOAT' in col_name.upper() or 'DECIMAL' in col_name.upper() or col_name.upper() in ['TAX', 'PRICE', 'FEE', 'AMOUNT']:
-                condition = f"NVL(tgt.{col_name}, -999999) != NVL(src.{col_name}, -999999)"
-            else:
-                condition = f"NVL(tgt.{col_name}, -1) != NVL(src.{col_name}, -1)"
-        else:
-            # String columns
-            condition = f"NVL(tgt.{col_name}, '~') != NVL(src.{col_name}, '~')"
+        upper_name = col_name.upper()
         
-        where_conditions.append(condition)
+        # Use the declared type when the DDL has it, else the column name
+        null_value = None
+        if upper_name in column_types:
+            null_value = null_value_for_type(*column_types[upper_name])
+        if null_value is None:
+            null_value = null_value_for_name(upper_name)
+        where_conditions.append(CONDITION_TEMPLATES[null_value].format(c=col_name))
     
     return where_conditions
 
-def add_where_clause_to_merge(sql_content):
+def skip_whitespace(text, pos):
+    """Return the index of the first non-whitespace character at or after pos."""
+    while pos < len(text) and text[pos].isspace():
+        pos += 1
+    return pos
+
+def find_update_section(sql_content):
+    """
+    Locate the assignments between WHEN MATCHED THEN UPDATE SET and WHEN NOT MATCHED.
+    
+    The keywords are found with plain string searches on an uppercased copy
+    instead of a DOTALL regex, so the text is scanned forward once.
+    
+    Args:
+        sql_content: String containing the SQL stored procedure
+        
+    Returns:
+        The UPDATE SET assignment text, or None if there is no such section
+    """
+    upper = sql_content.translate(ASCII_UPPER)
+    pos = upper.find('WHEN MATCHED THEN')
+    while pos != -1:
+        start = pos + len('WHEN MATCHED THEN')
+        body = skip_whitespace(upper, start)
+        if body > start and upper.startswith('UPDATE SET', body):
+            start = body + len('UPDATE SET')
+            body = skip_whitespace(upper, start)
+            end = upper.find('WHEN NOT MATCHED', body)
+            if body > start and end != -1:
+                return sql_content[body:end]
+        pos = upper.find('WHEN MATCHED THEN', pos + 1)
+    return None
+
+def extract_assigned_columns(update_section):
+    """
+    Extract the column names assigned in an UPDATE SET section.
+    
+    ASSIGNED_COLUMN_PATTERN reads a tgt.<column> token followed by '=' at
+    the start of each assignment (after a comma or newline) and consumes SQL
+    line comments there, so one finditer pass covers the whole section.
+    
+    Args:
+        update_section: Text returned by find_update_section()
+        
+    Returns:
+        List of column names in assignment order
+    """
+    return [
+        match.group(1)
+        for match in ASSIGNED_COLUMN_PATTERN.finditer(update_section)
+        if match.group(1)
+    ]
+
+def add_where_clause_to_merge(sql_content, table_types=None):
     """
     Add WHERE clause to MERGE statement's UPDATE section.
     
     Args:
         sql_content: String containing the SQL stored procedure
+        table_types: Optional column types by table (see load_column_types);
+                     the MERGE INTO target's entry is used
         
     Returns:
-        Modified SQL with WHERE clause added
+        Modified SQL with WHERE clause added, or sql_content itself
+        (the same object) when nothing was changed
     """
     # Find the UPDATE SET section
-    update_pattern = r'(WHEN MATCHED THEN\s+UPDATE SET\s+)(.*?)(WHEN NOT MATCHED)'
-    
-    match = re.search(update_pattern, sql_content, re.DOTALL | re.IGNORECASE)
-    if not match:
+    update_section = find_update_section(sql_content)
+    if update_section is None:
         print("  WARNING: Could not find UPDATE SET pattern")
         return sql_content
     
-    update_section = match.group(2)
-    
     # Extract column assignments (handle multi-line)
-    column_assignments = []
-    for line in update_section.split('\n'):
-        line = line.strip()
-        if line.startswith('tgt.') and '=' in line:
-            # Extract column name before the =
-            col_match = re.match(r'tgt\.(\w+)\s*=', line)
-            if col_match:
-                column_assignments.append(col_match.group(1))
+    column_assignments = extract_assigned_columns(update_section)
     
     if not column_assignments:
         print("  WARNING: No column assignments found")
         return sql_content
     
     # Check if WHERE clause already exists
-    if re.search(r'tgt\.DW_LAST_UPDATED\s*=\s*SYSTIMESTAMP\s+WHERE\s+', sql_content, re.IGNORECASE):
+    if EXISTING_TGT_WHERE_PATTERN.search(sql_content):
         print("  INFO: WHERE clause already exists, skipping")
         return sql_content
     
     # Generate WHERE conditions
-    where_conditions = generate_where_clause_for_columns(column_assignments)
+    target = MERGE_TARGET_PATTERN.search(sql_content)
+    column_types = None
+    if target and table_types:
+        column_types = table_types.get(target.group(1).upper())
+    where_conditions = generate_where_clause_for_columns(
+        column_assignments, column_types
+    )
     
     if not where_conditions:
         print("  WARNING: No WHERE conditions generated")
         return sql_content
     
-    # Build the WHERE clause
-    where_clause = "\n        WHERE \n            -- Only update if data has actually changed\n            "
-    where_clause += "\n            OR ".join(where_conditions)
-    
     # Find where to insert the WHERE clause (after DW_LAST_UPDATED = SYSTIMESTAMP)
-    # Replace the line ending after DW_LAST_UPDATED
-    modified_content = re.sub(
-        r'(tgt\.DW_LAST_UPDATED\s*=\s*SYSTIMESTAMP)\s*\n',
-        r'\1' + where_clause + '\n',
-        sql_content,
-        count=1
+    insert_point = WHERE_INSERT_POINT_PATTERN.search(sql_content)
+    if insert_point is None:
+        return sql_content
+    
+    # Splice the WHERE clause in place of the line ending after
+    # DW_LAST_UPDATED, joining all the pieces into the new text at once
+    return ''.join((
+        sql_content[:insert_point.end(1)],
+        "\n        WHERE \n            -- Only update if data has actually changed\n            ",
+        "\n            OR ".join(where_conditions),
+        '\n',
+        sql_content[insert_point.end():],
+    ))
+
+def write_file_atomically(filepath, content):
+    """
+    Replace a file's contents without ever leaving it half written.
+    
+    The content goes to a temporary file in the same directory, which then
+    takes the original's permissions and is renamed over it.
+    
+    Args:
+        filepath: Path of the file to replace
+        content: New text content
+    """
+    tmp = tempfile.NamedTemporaryFile(
+        mode='w', encoding='utf-8', dir=filepath.parent,
+        prefix=f'.{filepath.name}.', delete=False
     )
+    try:
+        with tmp:
+            tmp.write(content)
+        shutil.copymode(filepath, tmp.name)
+        os.replace(tmp.name, filepath)
+    except BaseException:
+        os.unlink(tmp.name)
+        raise
+
+def load_hash_cache(cache_file, script_digest):
+    """
+    Read the no-op file hashes recorded by an earlier run.
     
-    return modified_content
+    Args:
+        cache_file: Path of the HASH_CACHE_FILE side file
+        script_digest: SHA-256 of this script; a cache written by a
+                       different version of it is ignored
+        
+    Returns:
+        Dict of file name -> SHA-256 hex digest (empty if there is no
+        usable cache)
+    """
+    try:
+        cache = json.loads(cache_file.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict) or cache.get('script') != script_digest:
+        return {}
+    return cache.get('files', {})
+
+def save_hash_cache(cache_file, script_digest, file_hashes):
+    """Write the no-op file hashes for the next run."""
+    cache = {'script': script_digest, 'files': file_hashes}
+    cache_file.write_text(json.dumps(cache, indent=2, sort_keys=True), encoding='utf-8')
 
-def process_stored_procedure_file(filepath):
+def process_stored_procedure_file(filepath, table_types=None, known_hashes=None):
     """
     Process a single stored procedure file.
     
     Args:
         filepath: Path to the SQL file
+        table_types: Optional column types by table (see load_column_types)
+        known_hashes: Optional {file name: SHA-256} of files that needed no
+                      change on an earlier run (see load_hash_cache)
         
     Returns:
-        True if file was modified, False otherwise
+        Tuple of (True if file was modified, SHA-256 of the file if it was
+        found to need no change, else None)
     """
     print(f"\nProcessing: {filepath.name}")
     
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            original_content = f.read()
+        # Check if this is a MERGE procedure on the memory-mapped file, so
+        # files that are skipped are never copied into memory or decoded
+        with open(filepath, 'rb') as f:
+            if os.fstat(f.fileno()).st_size < MIN_MERGE_FILE_SIZE:
+                print("  SKIP: Not a MERGE procedure")
+                return False, None
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                digest = hashlib.sha256(mm).hexdigest()
+                if known_hashes and known_hashes.get(filepath.name) == digest:
+                    print("  SKIP: Unchanged since last run")
+                    return False, digest
+                if mm.find(b'MERGE INTO') == -1 and not MERGE_INTO_BYTES_PATTERN.search(mm):
+                    print("  SKIP: Not a MERGE procedure")
+                    return False, digest
+                raw = mm[:]
         
-        # Check if this is a MERGE procedure
-        if 'MERGE INTO' not in original_content.upper():
-            print("  SKIP: Not a MERGE procedure")
-            return False
+        # Same newline translation as reading the file in text mode
+        original_content = raw.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
         
         # Check if WHERE clause already exists
-        if re.search(r'DW_LAST_UPDATED\s*=\s*SYSTIMESTAMP\s+WHERE\s+', original_content, re.IGNORECASE):
+        if EXISTING_WHERE_PATTERN.search(original_content):
             print("  SKIP: WHERE clause already exists")
-            return False
+            return False, digest
         
-        modified_content = add_where_clause_to_merge(original_content)
+        modified_content = add_where_clause_to_merge(original_content, table_types)
         
-        if modified_content != original_content:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(modified_content)
-            print("  ✅ UPDATED: Added WHERE clause")
-            return True
-        else:
+        if modified_content is original_content:
             print("  SKIP: No changes made")
-            return False
+            return False, digest
+        
+        write_file_atomically(filepath, modified_content)
+        print("  ✅ UPDATED: Added WHERE clause")
+        return True, None
             
     except Exception as e:
         print(f"  ERROR: {str(e)}")
-        return False
+        return False, None
 
 def main():
     """Main execution function."""
@@ -168,10 +421,41 @@ def main():
     
     print(f"\nFound {len(sql_files)} merge procedure files")
     
-    updated_count = 0
-    for sql_file in sorted(sql_files):
-        if process_stored_procedure_file(sql_file):
-            updated_count += 1
+    table_types = load_column_types(script_dir / ddl for ddl in TABLE_DDL_FILES)
+    print(f"Loaded column types for {len(table_types)} tables")
+    
+    cache_file = script_dir / HASH_CACHE_FILE
+    script_digest = hashlib.sha256(Path(__file__).read_bytes()).hexdigest()
+    known_hashes = load_hash_cache(cache_file, script_digest)
+    print(f"Loaded {len(known_hashes)} unchanged file hashes from {HASH_CACHE_FILE}")
+    
+    # Each file is read, rewritten and written independently, so spread
+    # them across one worker process per CPU: large files are queued first,
+    # largest first, one per task, then the small ones in batches
+    process_file = functools.partial(
+        process_stored_procedure_file,
+        table_types=table_types,
+        known_hashes=known_hashes
+    )
+    sized_files = sorted(
+        ((path.stat().st_size, path) for path in sql_files), reverse=True
+    )
+    large_files = [path for size, path in sized_files if size >= SMALL_FILE_SIZE]
+    small_files = [path for size, path in sized_files if size < SMALL_FILE_SIZE]
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        large_results = executor.map(process_file, large_files, chunksize=1)
+        small_results = executor.map(process_file, small_files, chunksize=8)
+        results = list(large_results) + list(small_results)
+    updated_count = sum(updated for updated, _ in results)
+    
+    # Remember the files that needed no change (an updated file is recorded
+    # by the next run, once it is confirmed to have its WHERE clause)
+    file_hashes = {
+        path.name: digest
+        for path, (_, digest) in zip(large_files + small_files, results)
+        if digest is not None
+    }
+    save_hash_cache(cache_file, script_digest, file_hashes)
     
     print("\n" + "="*80)
     print(f"COMPLETE: Updated {updated_count} out of {len(sql_files)} files")